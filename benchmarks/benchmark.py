@@ -0,0 +1,313 @@
+"""This module times the hot paths of the rules and whole games
+
+Micro benchmarks call the rule checks of GamePiece, Player and main
+on a fixed position from the middle of a seeded game,
+game benchmarks play seeded headless games on every board size.
+Every run gets appended to a JSON history, so the numbers of different
+versions can be compared and regressions show up right away.
+The history is kept in the working directory unless another file is given:
+
+    python benchmarks/benchmark.py [--history PATH] [--games N] [SIZE ...]
+
+Functions:
+    time_call(func: Callable[[], object], repeat: int = REPEAT) -> float
+    midgame_players(size: str = "medium", seed: int = 0, rolls: int = MIDGAME_ROLLS
+                    ) -> list[Player]
+    micro_benchmarks(size: str = "medium", seed: int = 0) -> dict[str, dict[str, float]]
+    game_benchmark(size: str, n_games: int = GAMES, seed: int = 0) -> dict[str, float]
+    run_benchmarks(sizes: Iterable[str] = SIZES, n_games: int = GAMES,
+                   seed: int = 0) -> dict[str, dict[str, float]]
+    load_history(path: str = HISTORY_FILE) -> list[dict]
+    append_history(results: dict[str, dict[str, float]],
+                   path: str = HISTORY_FILE) -> list[dict]
+    compare(old: dict[str, dict[str, float]],
+            new: dict[str, dict[str, float]]) -> dict[str, float]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Callable, Iterable, Optional, Sequence
+
+# the modules of the game import each other by their flat names
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir, "src", "menschaergeredichnicht"))
+
+# pylint: disable=wrong-import-position
+from game_board import SIZES  # noqa: E402
+from main import game_seed, has_one_player_won, play_game, setup  # noqa: E402
+from occupancy import OccupancyIndex  # noqa: E402
+from player import Player  # noqa: E402
+from record import record_game, replay  # noqa: E402
+from tools import DiceStream  # noqa: E402
+
+# pylint: enable=wrong-import-position
+
+REPEAT = 5
+"""Amount of timings of which the fastest one counts"""
+MIN_TIME = 0.05
+"""Minimum time in seconds of one timing, short calls get looped"""
+MIDGAME_ROLLS = 150
+"""Rolls of a seeded game that lead to the position of the micro benchmarks"""
+GAMES = 200
+"""Default amount of games per board size"""
+HISTORY_FILE = "benchmarks.json"
+"""Default file of the benchmark history, relative to the working directory"""
+
+
+def time_call(func: Callable[[], object], repeat: int = REPEAT) -> float:
+    """Times a function without arguments
+
+    Args:
+        func (Callable[[], object]): function that gets timed
+        repeat (int, optional): amount of timings. Defaults to REPEAT.
+
+    Returns:
+        float: fastest time per call in seconds
+    """
+    # find a loop count that takes at least MIN_TIME
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = perf_counter() - start
+        if elapsed >= MIN_TIME:
+            break
+        number *= 10
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, perf_counter() - start)
+    return best / number
+
+
+def midgame_players(size: str = "medium", seed: int = 0,
+                    rolls: int = MIDGAME_ROLLS) -> list[Player]:
+    """Players with the position of a seeded game after some rolls,
+    tracked by an OccupancyIndex like in main.play_game
+
+    Args:
+        size (str, optional): size of game board. look into SIZES for sizes. Defaults to "medium".
+        seed (int, optional): seed of the game. Defaults to 0.
+        rolls (int, optional): amount of rolls. Defaults to MIDGAME_ROLLS.
+
+    Returns:
+        list[Player]: all the players, the player that started the game comes first
+    """
+    _, record = record_game(size, seed)
+    state = replay(record, rolls)
+    players = setup(size, 4, starting_color=record.starting_color)
+    state.load_into(players)
+    # the index has to see the loaded steps, load_into doesn't notify observers
+    occupancy = OccupancyIndex()
+    for player in players:
+        player.occupancy = occupancy
+        for game_piece in player.game_pieces:
+            occupancy.attach(game_piece)
+    return players
+
+
+def micro_benchmarks(size: str = "medium", seed: int = 0) -> dict[str, dict[str, float]]:
+    """Times the rule checks on a position from the middle of a game,
+    every call covers all 16 game pieces or all 4 players
+
+    Args:
+        size (str, optional): size of game board. look into SIZES for sizes. Defaults to "medium".
+        seed (int, optional): seed of the game. Defaults to 0.
+
+    Returns:
+        dict[str, dict[str, float]]: microseconds per call accessed by benchmark
+    """
+    players = midgame_players(size, seed)
+    game_pieces = [game_piece for player in players for game_piece in player.game_pieces]
+
+    def future_positions():
+        for game_piece in game_pieces:
+            for steps in range(1, 7):
+                game_piece.get_future_pos(steps)
+
+    def goal_checks():
+        for game_piece in game_pieces:
+            game_piece.in_goal()
+
+    def valid_game_pieces():
+        for player in players:
+            for steps in range(1, 7):
+                player.get_valid_game_pieces(steps)
+
+    def done_checks():
+        for player in players:
+            player.check_if_done()
+
+    benchmarks = {"GamePiece.get_future_pos": future_positions,
+                  "GamePiece.in_goal": goal_checks,
+                  "Player.get_valid_game_pieces": valid_game_pieces,
+                  "Player.check_if_done": done_checks,
+                  "has_one_player_won": lambda: has_one_player_won(size, players)}
+    return {name: {"us_per_call": time_call(func) * 1e6} for name, func in benchmarks.items()}
+
+
+def game_benchmark(size: str, n_games: int = GAMES, seed: int = 0) -> dict[str, float]:
+    """Plays seeded headless games like start_game_loop
+
+    Moves and peak memory get measured in separate passes,
+    so the timing isn't slowed down by recording or tracing
+
+    Args:
+        size (str): size of game board. look into SIZES for sizes
+        n_games (int, optional): amount of games. Defaults to GAMES.
+        seed (int, optional): seed of the games. Defaults to 0.
+
+    Returns:
+        dict[str, float]: games per second, microseconds per move and turn
+                          and peak memory in KiB of a single game
+    """
+    def play_games():
+        for game_index in range(n_games):
+            play_game(size, dice_stream=DiceStream(seed=game_seed(seed, game_index)))
+
+    elapsed = min(time_call(play_games, repeat=1) for _ in range(REPEAT))
+
+    moves = turns = 0
+    for game_index in range(n_games):
+        result, record = record_game(size, game_seed(seed, game_index))
+        moves += sum(piece is not None for piece in record.pieces())
+        turns += result.iterations
+
+    tracemalloc.start()
+    play_game(size, dice_stream=DiceStream(seed=game_seed(seed, 0)))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"games_per_second": n_games / elapsed,
+            "us_per_move": elapsed / moves * 1e6,
+            "us_per_turn": elapsed / turns * 1e6,
+            "peak_memory_kib": peak / 1024}
+
+
+def run_benchmarks(sizes: Iterable[str] = SIZES, n_games: int = GAMES,
+                   seed: int = 0) -> dict[str, dict[str, float]]:
+    """Runs all benchmarks
+
+    Args:
+        sizes (Iterable[str], optional): board sizes of the benchmarks. Defaults to SIZES.
+        n_games (int, optional): amount of games per board size. Defaults to GAMES.
+        seed (int, optional): seed of the games. Defaults to 0.
+
+    Returns:
+        dict[str, dict[str, float]]: measurements accessed by "benchmark[size]"
+    """
+    results = {}
+    for size in sizes:
+        results.update((f"{name}[{size}]", measurements)
+                       for name, measurements in micro_benchmarks(size, seed).items())
+        results[f"game[{size}]"] = game_benchmark(size, n_games, seed)
+    return results
+
+
+def _git_revision() -> str:
+    """Commit of the working tree, empty if it isn't known
+
+    Returns:
+        str: hash of the commit
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def load_history(path: str = HISTORY_FILE) -> list[dict]:
+    """Reads the benchmark history
+
+    Args:
+        path (str, optional): file of the history. Defaults to HISTORY_FILE.
+
+    Returns:
+        list[dict]: all runs, oldest first, empty if there's no history yet
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def append_history(results: dict[str, dict[str, float]],
+                   path: str = HISTORY_FILE) -> list[dict]:
+    """Adds a run to the benchmark history
+
+    Args:
+        results (dict[str, dict[str, float]]): measurements accessed by benchmark
+        path (str, optional): file of the history. Defaults to HISTORY_FILE.
+
+    Returns:
+        list[dict]: all runs, oldest first
+    """
+    history = load_history(path)
+    history.append({"time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "revision": _git_revision(),
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": results})
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(history, file, indent=2)
+    return history
+
+
+def compare(old: dict[str, dict[str, float]],
+            new: dict[str, dict[str, float]]) -> dict[str, float]:
+    """Relative change of every measurement both runs have
+
+    Args:
+        old (dict[str, dict[str, float]]): measurements of the older run
+        new (dict[str, dict[str, float]]): measurements of the newer run
+
+    Returns:
+        dict[str, float]: new / old accessed by "benchmark.measurement",
+                          above 1 is slower for times and faster for games per second
+    """
+    return {f"{name}.{key}": value / old[name][key]
+            for name, measurements in new.items() if name in old
+            for key, value in measurements.items() if old[name].get(key)}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Runs the benchmarks, prints them and their change to the last run of the history
+
+    Args:
+        argv (Optional[Sequence[str]], optional): command line arguments,
+                                                  None for sys.argv. Defaults to None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("sizes", nargs="*", metavar="SIZE",
+                        help=f"board sizes out of {', '.join(SIZES)}, all of them by default")
+    parser.add_argument("--games", type=int, default=GAMES, help="games per board size")
+    parser.add_argument("--history", default=HISTORY_FILE, help="file of the history")
+    args = parser.parse_args(argv)
+    unknown = [size for size in args.sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"unknown board sizes: {', '.join(unknown)}")
+
+    results = run_benchmarks(args.sizes or SIZES, args.games)
+    for name, measurements in results.items():
+        print(name, {key: round(value, 2) for key, value in measurements.items()})
+    history = append_history(results, args.history)
+    if len(history) > 1:
+        for key, ratio in compare(history[-2]["results"], results).items():
+            print(f"{key}: {ratio:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""This module plays many headless games in lockstep with NumPy
+
+All games of a batch are kept in one array of steps
+(colors·game pieces × games, same encoding as GamePiece.steps).
+The games are the last axis, so every game piece is one contiguous row
+and checks across the four game pieces of a color are plain elementwise
+operations between rows instead of reductions over a tiny axis.
+Every iteration rolls the dice for all games at once and applies
+the rules of main.make_a_move as masked array operations.
+Game pieces get picked by the batched forms of the strategies (look into strategies)
+
+Classes:
+    BatchResult
+
+Functions:
+    play_batch(n_games: int, *, seed: Optional[int] = None,
+               rng: Optional[np.random.Generator] = None,
+               strategies: BatchStrategies = "greedy",
+               chunk_size: int = CHUNK_SIZE) -> BatchResult
+    to_simulation_result(result: BatchResult) -> SimulationResult
+"""
+
+from collections import Counter
+from typing import NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from game_board import COLORS, PATH_LENGTH, TRACK_LENGTH
+from game_piece import GOAL, HOME, LAST_STEP
+from main import MAX_ITERATIONS, SimulationResult
+from moves import PERMISSION_CHANCE
+from strategies import BatchedStrategy, BatchState, get_batched_strategy
+
+OFFSETS = np.arange(len(COLORS)) * (TRACK_LENGTH // len(COLORS))
+"""Field of the starting vertex accessed by the index of a color"""
+PIECES = np.arange(4)[:, None]
+"""Index of the game pieces of one color, as a column"""
+CHUNK_SIZE = 100_000
+"""Amount of games played at once, bounds the memory of huge batches"""
+
+
+class BatchResult(NamedTuple):
+    """Outcome of a batch of games, colors are given by their index in COLORS
+
+    Attributes:
+        starting_colors (np.ndarray): color that started the game, shape (games,)
+        winners (np.ndarray): color that won, -1 if no one has won, shape (games,)
+        iterations (np.ndarray): amount of turns that were played, shape (games,)
+        hits (np.ndarray): amount of game pieces a color has hit, shape (colors, games)
+    """
+    starting_colors: np.ndarray
+    winners: np.ndarray
+    iterations: np.ndarray
+    hits: np.ndarray
+
+
+BatchStrategies = Union[str, BatchedStrategy, Sequence[Union[str, BatchedStrategy]]]
+"""One strategy for all colors or one per color (in the order of COLORS),
+given by the name of a registered strategy or as a batched strategy"""
+
+
+def _first(mask: np.ndarray) -> np.ndarray:
+    """Index of the first true row per game
+
+    Args:
+        mask (np.ndarray): mask of the game pieces of one color, shape (4, games)
+
+    Returns:
+        np.ndarray: index of the first game piece that is true, 3 if none, shape (games,)
+    """
+    return np.where(mask[0], 0, np.where(mask[1], 1, np.where(mask[2], 2, 3)))
+
+
+def _resolve(strategies: BatchStrategies) -> list[BatchedStrategy]:
+    """Looks up the batched strategy of every color
+
+    Args:
+        strategies (BatchStrategies): one strategy for all colors or one per color
+
+    Returns:
+        list[BatchedStrategy]: batched strategy accessed by the index of a color
+    """
+    if isinstance(strategies, str) or callable(strategies):
+        strategies = [strategies] * len(COLORS)
+    return [get_batched_strategy(strategy) if isinstance(strategy, str) else strategy
+            for strategy in strategies]
+
+
+def _pick(batched: list[BatchedStrategy], batch: BatchState, valid: np.ndarray) -> np.ndarray:
+    """Picks the valid game piece with the highest score, the first one on ties
+
+    Args:
+        batched (list[BatchedStrategy]): batched strategy accessed by the index of a color
+        batch (BatchState): all running games
+        valid (np.ndarray): mask of the valid game pieces, shape (4, games)
+
+    Returns:
+        np.ndarray: index of the picked game piece, shape (games,).
+                    Only meaningful for games with at least one valid game piece
+    """
+    scores = None
+    for strategy in dict.fromkeys(batched):
+        strategy_scores = strategy(batch)
+        if scores is None:
+            scores = strategy_scores
+        else:
+            colors = [color_idx for color_idx, other in enumerate(batched) if other is strategy]
+            scores = np.where(np.isin(batch.turn, colors), strategy_scores, scores)
+    return np.where(valid, scores, -np.inf).argmax(axis=0)
+
+
+def _playable(steps: np.ndarray) -> np.ndarray:
+    """Mask of the game pieces that are on the board and not done
+
+    Game pieces are done if there's no gap between them and the most inner
+    goal position (see Player.check_if_done), which means all fields
+    from them to the most inner goal position are taken
+
+    Args:
+        steps (np.ndarray): steps of the current player's game pieces, shape (4, games)
+
+    Returns:
+        np.ndarray: mask of playable game pieces, shape (4, games)
+    """
+    further = ((steps[0] >= steps).view(np.int8) + (steps[1] >= steps).view(np.int8)
+               + (steps[2] >= steps).view(np.int8) + (steps[3] >= steps).view(np.int8))
+    done = (steps >= GOAL) & (further == PATH_LENGTH - steps)
+    return (steps >= 0) & ~done
+
+
+def _occupy(board: np.ndarray, steps: np.ndarray, games: np.ndarray,
+            fields: np.ndarray, occupants: np.ndarray) -> np.ndarray:
+    """Puts game pieces on fields of the track and resets whoever stood there
+
+    Args:
+        board (np.ndarray): occupant of every field, 0 if empty,
+                            otherwise 1 + index of the game piece, shape (40, games)
+        steps (np.ndarray): steps of all game pieces, shape (colors*4, games)
+        games (np.ndarray): games where a game piece enters a field
+        fields (np.ndarray): fields that get entered
+        occupants (np.ndarray): 1 + index of the entering game pieces
+
+    Returns:
+        np.ndarray: true if a game piece got hit
+    """
+    victims = board[fields, games]
+    hit = victims > 0
+    steps[victims[hit] - 1, games[hit]] = HOME
+    board[fields, games] = occupants
+    return hit
+
+
+def _play_chunk(n_games: int, rng: np.random.Generator,
+                batched: list[BatchedStrategy]) -> BatchResult:
+    """Plays games at once until all of them are won or cut off
+
+    One iteration handles one roll of every running game:
+    - roll the dice and the permission to leave home
+    - get a game piece out if the player has none on the board
+    - pick and move a valid game piece
+    - hit game pieces of other colors
+    - pass the turn on, unless a 6 was rolled
+    Every game keeps an occupancy board of the track,
+    so hits are single lookups. Finished games get dropped from the arrays
+
+    Args:
+        n_games (int): amount of games
+        rng (np.random.Generator): generator for all random numbers
+        batched (list[BatchedStrategy]): batched strategy accessed by the index of a color
+
+    Returns:
+        BatchResult: outcome of all games
+    """
+    n_colors = len(COLORS)
+
+    starting_colors = rng.integers(0, n_colors, size=n_games)
+    winners = np.full(n_games, -1, dtype=np.int8)
+    final_iterations = np.zeros(n_games, dtype=np.int16)
+    final_hits = np.zeros((n_colors, n_games), dtype=np.int16)
+
+    ids = np.arange(n_games)
+    steps = np.full((n_colors*4, n_games), HOME, dtype=np.int8)
+    board = np.zeros((TRACK_LENGTH, n_games), dtype=np.int8)
+    turn = starting_colors.copy()
+    iterations = np.zeros(n_games, dtype=np.int16)
+    hits = np.zeros((n_colors, n_games), dtype=np.int16)
+
+    while ids.size:
+        n_running = ids.size
+        games = np.arange(n_running)
+        rolls = rng.integers(1, 7, size=n_running, dtype=np.int8)
+        permission = rng.random(n_running) < PERMISSION_CHANCE
+        current = steps[turn*4 + PIECES, games]
+
+        # get a game piece out
+        playable = _playable(current)
+        at_home = current == HOME
+        enter = (~(playable[0] | playable[1] | playable[2] | playable[3]) & permission
+                 & (at_home[0] | at_home[1] | at_home[2] | at_home[3]))
+        if enter.any():
+            entering, color = games[enter], turn[enter]
+            piece = _first(at_home[:, enter])
+            current[piece, entering] = 0
+            steps[color*4 + piece, entering] = 0
+            playable[piece, entering] = True
+            hits[color, entering] += _occupy(board, steps, entering, OFFSETS[color],
+                                             color*4 + piece + 1)
+
+        # pick and move a game piece
+        future = current + rolls
+        hitting_self = ((future == current[0]) | (future == current[1])
+                        | (future == current[2]) | (future == current[3]))
+        valid = playable & (future <= LAST_STEP) & ~hitting_self
+        moving = valid[0] | valid[1] | valid[2] | valid[3]
+        movers, color = games[moving], turn[moving]
+        piece = _pick(batched, BatchState(steps, current, turn, rolls, board, rng),
+                      valid)[moving]
+        old_steps = current[piece, movers]
+        new_steps = old_steps + rolls[moving]
+        current[piece, movers] = new_steps
+        steps[color*4 + piece, movers] = new_steps
+
+        leaving = old_steps < GOAL
+        board[(OFFSETS[color] + old_steps)[leaving] % TRACK_LENGTH, movers[leaving]] = 0
+        arriving = new_steps < GOAL
+        hits[color[arriving], movers[arriving]] += _occupy(
+            board, steps, movers[arriving],
+            (OFFSETS[color] + new_steps)[arriving] % TRACK_LENGTH,
+            (color*4 + piece + 1)[arriving])
+
+        # pass the turn on
+        won = ((current[0] >= GOAL) & (current[1] >= GOAL)
+               & (current[2] >= GOAL) & (current[3] >= GOAL))
+        turn_over = won | (rolls != 6)
+        iterations += turn_over
+        turn = (turn + turn_over) % n_colors
+        finished = won | (iterations > MAX_ITERATIONS)
+
+        if finished.any():
+            done_ids = ids[finished]
+            winners[done_ids] = np.where(won[finished], (turn[finished] - 1) % n_colors, -1)
+            final_iterations[done_ids] = iterations[finished]
+            final_hits[:, done_ids] = hits[:, finished]
+            running = ~finished
+            ids, turn, iterations = ids[running], turn[running], iterations[running]
+            steps, board, hits = steps[:, running], board[:, running], hits[:, running]
+
+    return BatchResult(starting_colors=starting_colors,
+                       winners=winners,
+                       iterations=final_iterations,
+                       hits=final_hits)
+
+
+def play_batch(n_games: int, *, seed: Optional[int] = None,
+               rng: Optional[np.random.Generator] = None,
+               strategies: BatchStrategies = "greedy",
+               chunk_size: int = CHUNK_SIZE) -> BatchResult:
+    """Plays many games in lockstep, chunk by chunk
+
+    Args:
+        n_games (int): amount of games
+        seed (Optional[int], optional): seed for a new generator. Defaults to None.
+        rng (Optional[np.random.Generator], optional): generator for all random numbers,
+                                                       overrides seed. Defaults to None.
+        strategies (BatchStrategies, optional): one strategy for all colors
+                                                or one per color. Defaults to "greedy".
+        chunk_size (int, optional): amount of games played at once. Defaults to CHUNK_SIZE.
+
+    Returns:
+        BatchResult: outcome of all games
+    """
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    batched = _resolve(strategies)
+
+    chunks = [_play_chunk(min(chunk_size, n_games - start), rng, batched)
+              for start in range(0, n_games, chunk_size)]
+    if not chunks:
+        chunks.append(_play_chunk(0, rng, batched))
+    return BatchResult(*(np.concatenate(arrays, axis=-1) for arrays in zip(*chunks)))
+
+
+def to_simulation_result(result: BatchResult) -> SimulationResult:
+    """Aggregates a batch the same way as main.simulate
+
+    Args:
+        result (BatchResult): outcome of a batch of games
+
+    Returns:
+        SimulationResult: aggregated outcome
+    """
+    n_colors = len(COLORS)
+    finished = result.winners >= 0
+    winners = result.winners[finished].astype(np.int64)
+    seats = (winners - result.starting_colors[finished]) % n_colors
+
+    simulation_result = SimulationResult()
+    simulation_result.games = int(result.winners.size)
+    simulation_result.wins_per_color = Counter(
+        dict(zip(COLORS, np.bincount(winners, minlength=n_colors).tolist())))
+    simulation_result.wins_per_seat = Counter(
+        dict(enumerate(np.bincount(seats, minlength=n_colors).tolist())))
+    simulation_result.game_lengths = Counter(
+        dict(zip(*(array.tolist()
+                   for array in np.unique(result.iterations, return_counts=True)))))
+    simulation_result.hits = Counter(dict(zip(COLORS, result.hits.sum(axis=1).tolist())))
+    return simulation_result
+
+
+def main() -> None:
+    """For testing and debugging purposes"""
+    print(to_simulation_result(play_batch(10_000, seed=0)))
+    print(to_simulation_result(play_batch(10_000, seed=0, strategies=("greedy", "random",
+                                                                      "aggressive", "defensive"))))
+
+
+if __name__ == "__main__":
+    main()
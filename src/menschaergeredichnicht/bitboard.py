@@ -0,0 +1,161 @@
+"""This module keeps the occupancy of the board in bitmasks
+
+Every color gets one integer with a bit for each of its steps:
+bit 0 to 39 for the fields of the track counted from its starting vertex
+and bit GOAL (40) to LAST_STEP (43) for its goal positions.
+Game pieces at home don't have a bit.
+Because the steps of every color start at its own starting vertex,
+the masks of the other colors get rotated by their seat offset
+into the frame of the color that has to move.
+Afterwards the checks of the rules are single bitwise operations:
+landing on an own game piece, hitting a game piece of another color
+and finding game pieces of other colors behind a field
+
+Functions:
+    color_mask(positions: bytes, color_idx: int) -> int
+    opponents(state: GameState) -> int
+    rotate(track: int, shift: int) -> int
+    last_playable(own: int) -> int
+    lands_on_own(own: int, end: int) -> bool
+    hits_opponent(others: int, end: int) -> bool
+    threatened(others: int, end: int, distance: int) -> bool
+"""
+
+from game_board import COLORS, PATH_LENGTH, TRACK_LENGTH
+from game_piece import GOAL, LAST_STEP
+from state import PIECES_PER_COLOR, GameState
+
+SEAT_SHIFT = TRACK_LENGTH // len(COLORS)
+"""Fields between the starting vertices of two neighbouring colors"""
+GOAL_SLOTS = PATH_LENGTH - TRACK_LENGTH
+"""Amount of goal positions of a color"""
+TRACK_MASK = (1 << TRACK_LENGTH) - 1
+"""Bits of the fields of the track"""
+STEP_BITS = (0,) + tuple(1 << step for step in range(PATH_LENGTH))
+"""Bit of a game piece accessed by its encoded steps (look into GameState), 0 at home"""
+SEAT_BITS = tuple(
+    (0,) + tuple(1 << (step + seat*SEAT_SHIFT) % TRACK_LENGTH for step in range(TRACK_LENGTH))
+    + (0,) * GOAL_SLOTS
+    for seat in range(len(COLORS)))
+"""Bit on the track in the frame of the color that has to move accessed by
+the seat of the other color (counted in the order of play) and its encoded steps,
+0 at home and in goal"""
+DONE_PIECES = tuple(next((done for done in range(GOAL_SLOTS)
+                          if not goal_bits >> (GOAL_SLOTS - 1 - done) & 1), GOAL_SLOTS)
+                    for goal_bits in range(1 << GOAL_SLOTS))
+"""Game pieces that are done (look into Player.check_if_done)
+accessed by the goal bits of a color"""
+
+
+def color_mask(positions: bytes, color_idx: int) -> int:
+    """Occupancy of one color in its own frame
+
+    Args:
+        positions (bytes): encoded steps of all game pieces (look into GameState)
+        color_idx (int): index of the color in COLORS
+
+    Returns:
+        int: bit of every step a game piece of the color stands on
+    """
+    offset = color_idx * PIECES_PER_COLOR
+    mask = 0
+    for position in positions[offset:offset + PIECES_PER_COLOR]:
+        mask |= STEP_BITS[position]
+    return mask
+
+
+def opponents(state: GameState) -> int:
+    """Occupancy of the track by the other colors in the frame of the color that has to move
+
+    Args:
+        state (GameState): state of the game
+
+    Returns:
+        int: bit of every field of the track a game piece of another color stands on
+    """
+    offset = state.turn * PIECES_PER_COLOR
+    rotated = state.positions[offset:] + state.positions[:offset]
+    mask = 0
+    for slot in range(PIECES_PER_COLOR, len(rotated)):
+        mask |= SEAT_BITS[slot // PIECES_PER_COLOR][rotated[slot]]
+    return mask
+
+
+def rotate(track: int, shift: int) -> int:
+    """Rotates the bits of the track, so steps of one color become steps of another
+
+    Args:
+        track (int): bits of the track
+        shift (int): fields the bits get moved forward, negative to move them backwards
+
+    Returns:
+        int: rotated bits of the track
+    """
+    shift %= TRACK_LENGTH
+    track &= TRACK_MASK
+    return (track << shift | track >> (TRACK_LENGTH - shift)) & TRACK_MASK
+
+
+def last_playable(own: int) -> int:
+    """Steps of the furthest game piece that isn't done yet
+
+    Args:
+        own (int): occupancy of the color in its own frame
+
+    Returns:
+        int: game pieces beyond these steps are done
+    """
+    return LAST_STEP - DONE_PIECES[own >> GOAL]
+
+
+def lands_on_own(own: int, end: int) -> bool:
+    """Checks if a game piece would land on another game piece of its color
+
+    Args:
+        own (int): occupancy of the color in its own frame
+        end (int): steps after the move
+
+    Returns:
+        bool: true if the field or goal position is taken
+    """
+    return bool(own >> end & 1)
+
+
+def hits_opponent(others: int, end: int) -> bool:
+    """Checks if a game piece would hit a game piece of another color
+
+    Args:
+        others (int): occupancy of the other colors (look into opponents)
+        end (int): steps after the move
+
+    Returns:
+        bool: true if a game piece of another color stands on the field
+    """
+    return end < GOAL and bool(others >> end & 1)
+
+
+def threatened(others: int, end: int, distance: int) -> bool:
+    """Checks if game pieces of other colors stand right behind a field
+
+    Args:
+        others (int): occupancy of the other colors (look into opponents)
+        end (int): steps of the field
+        distance (int): amount of fields behind the field that get checked
+
+    Returns:
+        bool: true if a game piece of another color is up to distance fields behind
+    """
+    return end < GOAL and bool(others & rotate((1 << distance) - 1, end - distance))
+
+
+def main() -> None:
+    """For testing and debugging purposes"""
+    state = GameState(bytes((1, 0, 42, 44, 5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 31)), 0)
+    own = color_mask(state.positions, state.turn)
+    others = opponents(state)
+    print(f"{own:044b}", f"{others:040b}", last_playable(own))
+    print(lands_on_own(own, 41), hits_opponent(others, 14), threatened(others, 2, 6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""This module draws the game board with turtle
+
+Importing it loads turtle and tkinter, the rules and engines don't need it.
+The board only gets drawn primitive by primitive the first time for every size,
+afterwards the recorded canvas items get replayed
+
+Functions:
+    record_display_list(canvas, items: Iterable[int]) -> list[DisplayItem]
+    replay_display_list(canvas, display_list: list[DisplayItem]) -> None
+    game_board(size: str = "medium", *, animate: bool = True, use_cache: bool = True) -> None
+    draw_winner_on_board(color: str)
+"""
+
+# pylint: disable-next=no-name-in-module
+from turtle import (back, begin_fill, circle, end_fill, exitonclick, fillcolor,
+                    forward, getcanvas, getturtle, goto, hideturtle, left, pencolor,
+                    pendown, pensize, penup, right, seth, shape, speed, tracer, update,
+                    write)
+from typing import Iterable
+
+from game_board import COLORS, SIZES, clockwise_pattern
+from renderer import write_winner
+
+DisplayItem = tuple[str, list[float], dict[str, str]]
+"""Type, coordinates and options (that differ from the defaults) of a canvas item"""
+
+BOARD_DISPLAY_LISTS: dict[str, list[DisplayItem]] = {}
+"""Canvas items of the static game board accessed by size,
+recorded the first time a board of that size gets drawn"""
+
+
+def record_display_list(canvas, items: Iterable[int]) -> list[DisplayItem]:
+    """Records canvas items, so they can be drawn again without a turtle
+
+    Args:
+        canvas: canvas of the screen (look into getcanvas)
+        items (Iterable[int]): ids of the canvas items
+
+    Returns:
+        list[DisplayItem]: recorded items from bottom to top
+    """
+    items = set(items)
+    display_list = []
+    for item in canvas.find_all():
+        if item not in items:
+            continue
+        options = {option: config[-1] for option, config in canvas.itemconfigure(item).items()
+                   if config[-1] != config[-2]}
+        display_list.append((canvas.type(item), canvas.coords(item), options))
+    return display_list
+
+
+def replay_display_list(canvas, display_list: list[DisplayItem]) -> None:
+    """Draws recorded canvas items on top of the canvas
+
+    Args:
+        canvas: canvas of the screen (look into getcanvas)
+        display_list (list[DisplayItem]): recorded items from bottom to top
+    """
+    for kind, coords, options in display_list:
+        getattr(canvas, f"create_{kind}")(*coords, **options)
+
+
+def game_board(size: str = "medium", *, animate: bool = True, use_cache: bool = True) -> None:
+    """Draws a game board
+
+    The board only gets drawn field by field the first time for every size,
+    afterwards the recorded canvas items get replayed (look into BOARD_DISPLAY_LISTS)
+
+    Args:
+        size (str, optional): size of game board. look into SIZES for sizes. Defaults to "medium".
+        animate (bool, optional): false to draw the whole board at once
+                                  (screen updates stay off afterwards). Defaults to True.
+        use_cache (bool, optional): replay the recorded board if there is one. Defaults to True.
+    """
+    canvas = getcanvas()
+    if use_cache and size in BOARD_DISPLAY_LISTS:
+        hideturtle()
+        if not animate:
+            tracer(0)
+        replay_display_list(canvas, BOARD_DISPLAY_LISTS[size])
+        update()
+        return
+    existing_items = set(canvas.find_all())
+
+    dist: int = SIZES[size]
+
+    def draw_one_unit():
+        """Draws one field/unit.
+        That includes the circle and the leading line"""
+        begin_fill()
+        circle(dist//4)
+        end_fill()
+        left(90)
+        penup()
+        forward(dist//2)
+        pendown()
+        forward(dist//2)
+        right(90)
+
+    shape("turtle")
+    speed(0)
+    if not animate:
+        tracer(0)
+
+    # background
+    fillcolor("#fdeb95")
+    pencolor("red")
+    pen_width = 20
+    pensize(pen_width)
+    penup()
+    outer_outline = dist*5 + dist//4 + 10 + 10 + pen_width//2
+    goto(-outer_outline, -outer_outline)
+    pendown()
+    begin_fill()
+    for pos in clockwise_pattern(outer_outline):
+        goto(pos)
+    end_fill()
+    pencolor("black")
+    pensize(4)
+    penup()
+    inner_outline = dist*5 + dist//4 + 10
+    goto(-inner_outline, -inner_outline)
+    pendown()
+    for pos in clockwise_pattern(inner_outline):
+        goto(pos)
+    penup()
+
+    # game fields
+    goto(-(dist*5 + dist//4), dist)
+    seth(270)
+    fillcolor("white")
+    for i in range(4):
+        for _ in range(2):
+            pendown()
+            for __ in range(4):
+                draw_one_unit()
+            penup()
+            forward(dist//4)
+            left(90)
+            forward(dist//4)
+        right(90)
+        back(dist//2)
+        right(90)
+        pendown()
+        draw_one_unit()
+        draw_one_unit()
+        penup()
+        back(dist//4)
+        right(90)
+        back(dist//4)
+
+    # home, start & goal fields
+    home_fields = dict(zip(COLORS, clockwise_pattern(dist*5 + dist//4, dist*5 - dist//8)))
+    start_fields = dict(zip(COLORS, clockwise_pattern(dist*5 + dist//4, dist)))
+    goal_fields = dict(zip(COLORS, clockwise_pattern(dist*4 + dist//4, 0)))
+    hdg = 270
+    for color in COLORS:
+        fillcolor(color)
+        seth(hdg)
+        hdg -= 90
+
+        # home fields
+        goto(home_fields[color])
+        for i in range(2):
+            if i == 1:
+                left(90)
+                forward((dist//4 + dist//8)*2 + 10)
+                right(90)
+                back((dist//4 + dist//8)*2 + 10)
+            pendown()
+            begin_fill()
+            circle(dist//4 + dist//8)
+            end_fill()
+            penup()
+            forward((dist//4 + dist//8)*2 + 10)
+            pendown()
+            begin_fill()
+            circle(dist//4 + dist//8)
+            end_fill()
+            penup()
+
+        # start field
+        goto(start_fields[color])
+        pendown()
+        begin_fill()
+        circle(dist//4)
+        end_fill()
+        penup()
+
+        # goal fields
+        goto(goal_fields[color])
+        for _ in range(4):
+            pendown()
+            begin_fill()
+            circle(dist//4)
+            end_fill()
+            penup()
+            left(90)
+            forward(dist)
+            right(90)
+
+    school = "Blackadder ITC"
+    # home = "AR DECODE"
+    off = 0
+    for idx, (word, pos) in enumerate(zip(("Mensch", "ärgere", "nicht", "dich"),
+                                          clockwise_pattern(dist*2 + dist//2))):
+        if idx == 2:
+            off = dist//4
+        goto(pos[0], pos[1] - off)
+        write(word, move=False, align="center", font=(
+            school, dist//2 + dist//8, "normal"))
+    hideturtle()
+    if not animate:
+        update()
+    BOARD_DISPLAY_LISTS[size] = record_display_list(
+        canvas, (item for item in getturtle().items if item not in existing_items))
+
+
+def draw_winner_on_board(color: str):
+    """Draws winner on the game board
+
+    Args:
+        color (str): color that won
+    """
+    write_winner(getturtle(), color)
+
+
+def main():
+    """For testing and debugging purposes"""
+    game_board("large")
+    for color in COLORS:
+        draw_winner_on_board(color)
+    exitonclick()
+
+
+if __name__ == "__main__":
+    main()
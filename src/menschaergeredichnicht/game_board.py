@@ -1,5 +1,9 @@
-"""This module draws the game board
-and generates all necessary position coordinates inside dicts or tuples
+"""This module generates all necessary position coordinates of the game board
+inside dicts or tuples
+
+Drawing the game board lives in board_drawing, so the rules and engines
+never import turtle or tkinter. game_board and draw_winner_on_board
+can still be imported from here, board_drawing gets loaded on first use
 
 Functions:
     clockwise_pattern(x: float, y: Optional[float] = None) -> tuple[tuple[float, float],
@@ -7,8 +11,6 @@ Functions:
                                                                  tuple[float, float],
                                                                  tuple[float, float]]
     clockwise_pattern_as_list(x: float, y: Optional[float] = None) -> list[list[float]]
-    game_board(size: str = "medium") -> None
-    draw_winner_on_board(color: str)
     has_to_turn_left(x: float, y: float, /, size: str) -> bool
     has_to_turn_right(x: float, y: float, /, size: str, color: str) -> bool
     starting_vertices(size: str) -> dict[str, tuple[float, float]]
@@ -22,16 +24,18 @@ Functions:
                                             tuple[float, float],
                                             tuple[float, float]]]
     get_goal_factors(color: str) -> tuple[float, float]
+    path_positions(size: str, color: str) -> tuple[tuple[float, float], ...]
     home_positions(size: str) -> dict[str,
                                       tuple[tuple[float, float],
                                             tuple[float, float],
                                             tuple[float, float],
                                             tuple[float, float]]]
+
+Classes:
+    BoardGeometry
 """
 
-from turtle import (back, begin_fill, circle, end_fill, exitonclick, fillcolor,
-                    forward, goto, hideturtle, left, pencolor, pendown,
-                    pensize, penup, right, seth, shape, speed, write)
+from dataclasses import dataclass
 from typing import Optional
 
 SIZES: dict[str, int] = {"x-small": 48,
@@ -53,6 +57,25 @@ HOME_ANGLES = dict(zip(COLORS, (90, 0, 270, 180)))
 """Angles accessed by color so at the beginning game pieces
 look in the right direction (easier setup)"""
 
+TRACK_LENGTH = 40
+"""Amount of fields on the track around the game board"""
+PATH_LENGTH = TRACK_LENGTH + 4
+"""Amount of fields a game piece can visit,
+from the starting vertex to the most inner goal position"""
+
+COLOR_INDICES: dict[str, int] = {color: idx for idx, color in enumerate(COLORS)}
+"""Index of a color in COLORS accessed by color"""
+
+FIELD_PATHS: tuple[tuple[int, ...], ...] = tuple(
+    tuple((idx*TRACK_LENGTH//len(COLORS) + steps) % TRACK_LENGTH for steps in range(TRACK_LENGTH))
+    + tuple(TRACK_LENGTH + idx*(PATH_LENGTH - TRACK_LENGTH) + steps
+            for steps in range(PATH_LENGTH - TRACK_LENGTH))
+    for idx in range(len(COLORS)))
+"""Fields accessed by the index of a color and the steps a game piece made.
+Fields 0 to 39 are the track shared by all colors (counted clockwise
+beginning with the starting vertex of the first color),
+all fields from 40 on are the goal positions of the colors"""
+
 MATRIX: tuple[tuple[int, int],
               tuple[int, int],
               tuple[int, int],
@@ -86,6 +109,10 @@ def clockwise_pattern(x: float, y: Optional[float] = None, /) -> tuple[tuple[flo
     return tuple(tmp)
 
 
+GOAL_FACTORS: dict[str, tuple[int, int]] = dict(zip(COLORS, clockwise_pattern(1, 0)))
+"""Goal factors accessed by color for calculating the goal pos"""
+
+
 def clockwise_pattern_as_list(x: float, y: Optional[float] = None, /) -> list[list[float]]:
     """Creates list with the following pattern
     [[-x, y], [y, x], [x, -y], [-y, -x]]
@@ -107,159 +134,6 @@ def clockwise_pattern_as_list(x: float, y: Optional[float] = None, /) -> list[li
     return tmp
 
 
-def game_board(size: str = "medium") -> None:
-    """Draws a game board
-
-    Args:
-        size (str, optional): size of game board. look into SIZES for sizes. Defaults to "medium".
-    """
-
-    dist: int = SIZES[size]
-
-    def draw_one_unit():
-        """Draws one field/unit.
-        That includes the circle and the leading line"""
-        begin_fill()
-        circle(dist//4)
-        end_fill()
-        left(90)
-        penup()
-        forward(dist//2)
-        pendown()
-        forward(dist//2)
-        right(90)
-
-    shape("turtle")
-    speed(0)
-
-    # background
-    fillcolor("#fdeb95")
-    pencolor("red")
-    pen_width = 20
-    pensize(pen_width)
-    penup()
-    outer_outline = dist*5 + dist//4 + 10 + 10 + pen_width//2
-    goto(-outer_outline, -outer_outline)
-    pendown()
-    begin_fill()
-    for pos in clockwise_pattern(outer_outline):
-        goto(pos)
-    end_fill()
-    pencolor("black")
-    pensize(4)
-    penup()
-    inner_outline = dist*5 + dist//4 + 10
-    goto(-inner_outline, -inner_outline)
-    pendown()
-    for pos in clockwise_pattern(inner_outline):
-        goto(pos)
-    penup()
-
-    # game fields
-    goto(-(dist*5 + dist//4), dist)
-    seth(270)
-    fillcolor("white")
-    for i in range(4):
-        for _ in range(2):
-            pendown()
-            for __ in range(4):
-                draw_one_unit()
-            penup()
-            forward(dist//4)
-            left(90)
-            forward(dist//4)
-        right(90)
-        back(dist//2)
-        right(90)
-        pendown()
-        draw_one_unit()
-        draw_one_unit()
-        penup()
-        back(dist//4)
-        right(90)
-        back(dist//4)
-
-    # home, start & goal fields
-    home_fields = dict(zip(COLORS, clockwise_pattern(dist*5 + dist//4, dist*5 - dist//8)))
-    start_fields = dict(zip(COLORS, clockwise_pattern(dist*5 + dist//4, dist)))
-    goal_fields = dict(zip(COLORS, clockwise_pattern(dist*4 + dist//4, 0)))
-    hdg = 270
-    for color in COLORS:
-        fillcolor(color)
-        seth(hdg)
-        hdg -= 90
-
-        # home fields
-        goto(home_fields[color])
-        for i in range(2):
-            if i == 1:
-                left(90)
-                forward((dist//4 + dist//8)*2 + 10)
-                right(90)
-                back((dist//4 + dist//8)*2 + 10)
-            pendown()
-            begin_fill()
-            circle(dist//4 + dist//8)
-            end_fill()
-            penup()
-            forward((dist//4 + dist//8)*2 + 10)
-            pendown()
-            begin_fill()
-            circle(dist//4 + dist//8)
-            end_fill()
-            penup()
-
-        # start field
-        goto(start_fields[color])
-        pendown()
-        begin_fill()
-        circle(dist//4)
-        end_fill()
-        penup()
-
-        # goal fields
-        goto(goal_fields[color])
-        for _ in range(4):
-            pendown()
-            begin_fill()
-            circle(dist//4)
-            end_fill()
-            penup()
-            left(90)
-            forward(dist)
-            right(90)
-
-    school = "Blackadder ITC"
-    # home = "AR DECODE"
-    off = 0
-    for idx, (word, pos) in enumerate(zip(("Mensch", "ärgere", "nicht", "dich"),
-                                          clockwise_pattern(dist*2 + dist//2))):
-        if idx == 2:
-            off = dist//4
-        goto(pos[0], pos[1] - off)
-        write(word, move=False, align="center", font=(
-            school, dist//2 + dist//8, "normal"))
-    hideturtle()
-
-
-def draw_winner_on_board(color: str):
-    """Draws winner on the game board
-
-    Args:
-        color (str): color that won
-    """
-    hideturtle()
-    speed(0)
-    pencolor(color)
-    penup()
-    goto(0, 100)
-    write(color.upper(), move=False, align="center",
-          font=("Arial", 150, "normal"))
-    pencolor("black")
-    goto(0, -300)
-    write("WON", move=False, align="center", font=("Arial", 150, "normal"))
-
-
 def has_to_turn_left(x: float, y: float, /, size: str) -> bool:
     """Checks if game piece has to turn left
 
@@ -271,8 +145,7 @@ def has_to_turn_left(x: float, y: float, /, size: str) -> bool:
     Returns:
         bool: true if game piece has to turn left on vertex (x, y)
     """
-    dist = SIZES[size]
-    return abs(x) == dist and abs(y) == dist
+    return (x, y) in BOARD_GEOMETRIES[size].left_turn_vertices
 
 
 def has_to_turn_right(x: float, y: float, /, size: str, color: str) -> bool:
@@ -287,12 +160,7 @@ def has_to_turn_right(x: float, y: float, /, size: str, color: str) -> bool:
     Returns:
         bool: true if game piece has to turn right on vertex (x, y)
     """
-    dist = SIZES[size]
-    color_factors_dict = dict(zip(COLORS, clockwise_pattern(5, 0)))
-    factor_x, factor_y = color_factors_dict[color]
-    return ((abs(x) == dist * 5 and abs(y) == dist)
-            or (abs(x) == dist and abs(y) == dist * 5)
-            or (x == factor_x*dist and y == factor_y*dist))
+    return (x, y) in BOARD_GEOMETRIES[size].right_turn_vertices[COLOR_INDICES[color]]
 
 
 def starting_vertices(size: str) -> dict[str, tuple[float, float]]:
@@ -304,8 +172,7 @@ def starting_vertices(size: str) -> dict[str, tuple[float, float]]:
     Returns:
         dict[str, tuple[float, float]]: vertices for starting point
     """
-    dist = SIZES[size]
-    return dict(zip(COLORS, clockwise_pattern(dist*5, dist)))
+    return dict(zip(COLORS, BOARD_GEOMETRIES[size].starting_vertices))
 
 
 def vertex_fore_goal(size: str) -> dict[str, tuple[float, float]]:
@@ -318,8 +185,7 @@ def vertex_fore_goal(size: str) -> dict[str, tuple[float, float]]:
     Returns:
         dict[str, tuple[float, float]]: vertex in front of goal pos
     """
-    dist = SIZES[size]
-    return dict(zip(COLORS, clockwise_pattern(dist*5, 0)))
+    return dict(zip(COLORS, BOARD_GEOMETRIES[size].vertices_fore_goal))
 
 
 def two_vertices_fore_goal(
@@ -335,21 +201,7 @@ def two_vertices_fore_goal(
              tuple[tuple[float, float],
                    tuple[float, float]]]: vertices two steps in front of goal pos
     """
-    dist = SIZES[size]
-    rev_vert_4_goal = list(reversed(clockwise_pattern_as_list(dist*5, dist)))
-    for idx, pos in enumerate(rev_vert_4_goal):
-        pos[0], pos[1] = pos[1], pos[0]
-        rev_vert_4_goal[idx] = tuple(rev_vert_4_goal[idx])
-
-    swapped_vert_fore_goal: tuple[tuple[float, float],
-                                  tuple[float, float],
-                                  tuple[float, float],
-                                  tuple[float, float]] = tuple(rev_vert_4_goal)
-    return {color: (one_fore_goal, two_fore_goal)
-            for color, one_fore_goal, two_fore_goal
-            in zip(COLORS,
-                   clockwise_pattern(dist*5, 0),
-                   swapped_vert_fore_goal)}
+    return dict(zip(COLORS, BOARD_GEOMETRIES[size].two_vertices_fore_goal))
 
 
 def goal_positions(
@@ -371,18 +223,7 @@ def goal_positions(
                    tuple[float, float],
                    tuple[float, float]]]: goal pos
     """
-    dist = SIZES[size]
-    return {color: tuple((factor_x*i*dist, factor_y*i*dist)
-                         for i in range(1, 5))
-            for color, (factor_x, factor_y)
-            in zip(COLORS, clockwise_pattern(1, 0))}
-    # return {color: (inner, second, third, outer)
-    #         for color, inner, second, third, outer
-    #         in zip(COLORS,
-    #                clockwise_pattern(dist, 0),
-    #                clockwise_pattern(dist*2, 0),
-    #                clockwise_pattern(dist*3, 0),
-    #                clockwise_pattern(dist*4, 0))}
+    return dict(zip(COLORS, BOARD_GEOMETRIES[size].goal_positions))
 
 
 def get_goal_factors(color: str) -> tuple[float, float]:
@@ -394,7 +235,23 @@ def get_goal_factors(color: str) -> tuple[float, float]:
     Returns:
         tuple[float, float]: factors
     """
-    return dict(zip(COLORS, clockwise_pattern(1, 0)))[color]
+    return GOAL_FACTORS[color]
+
+
+def path_positions(size: str, color: str) -> tuple[tuple[float, float], ...]:
+    """Vertex positions of the whole path of a color,
+    accessed by the steps a game piece has made since leaving home
+
+    Starts on the starting vertex and ends on the most inner goal position
+
+    Args:
+        size (str): size of game board. look into SIZES for sizes
+        color (str): color of game piece
+
+    Returns:
+        tuple[tuple[float, float], ...]: vertices of the path
+    """
+    return BOARD_GEOMETRIES[size].paths[COLOR_INDICES[color]]
 
 
 def home_positions(size: str) -> dict[str,
@@ -414,22 +271,143 @@ def home_positions(size: str) -> dict[str,
                    tuple[float, float],
                    tuple[float, float]]]: vertices for home pos
     """
-    dist = SIZES[size]
-    return {color: (fir, sec, thi, fou)
-            for color, fir, sec, thi, fou
-            in zip(COLORS,
-                   clockwise_pattern(dist*5 - dist//8),
-                   clockwise_pattern(dist*4, dist*5 - dist//8),
-                   clockwise_pattern(dist*5 - dist//8, dist*4),
-                   clockwise_pattern(dist*4))}
+    return dict(zip(COLORS, BOARD_GEOMETRIES[size].home_positions))
+
+
+@dataclass(frozen=True)
+class BoardGeometry:
+    """All vertex positions of one game board size
+
+    Built once per size in SIZES, so nothing has to be recomputed
+    while playing. Every tuple is accessed by the index of a color in COLORS
+
+    Attributes:
+        size (str): size of game board. look into SIZES for sizes
+        dist (int): distance between two fields
+        left_turn_vertices (frozenset[tuple[float, float]]): vertices where
+                                                             every game piece turns left
+        right_turn_vertices (tuple[frozenset[tuple[float, float]], ...]): vertices where
+                                                                          a game piece
+                                                                          turns right
+        starting_vertices (tuple[tuple[float, float], ...]): vertices for starting point
+        vertices_fore_goal (tuple[tuple[float, float], ...]): vertex in front of goal pos
+        two_vertices_fore_goal (tuple[tuple[tuple[float, float],
+                                            tuple[float, float]], ...]): vertices two steps
+                                                                         in front of goal pos
+        goal_positions (tuple[tuple[tuple[float, float], ...], ...]): goal pos, inside out
+        home_positions (tuple[tuple[tuple[float, float], ...], ...]): vertices for home pos
+        paths (tuple[tuple[tuple[float, float], ...], ...]): vertices of the path
+                                                             accessed by steps
+
+    Methods:
+        from_size(cls, size: str) -> BoardGeometry
+    """
+    size: str
+    dist: int
+    left_turn_vertices: frozenset[tuple[float, float]]
+    right_turn_vertices: tuple[frozenset[tuple[float, float]], ...]
+    starting_vertices: tuple[tuple[float, float], ...]
+    vertices_fore_goal: tuple[tuple[float, float], ...]
+    two_vertices_fore_goal: tuple[tuple[tuple[float, float], tuple[float, float]], ...]
+    goal_positions: tuple[tuple[tuple[float, float], ...], ...]
+    home_positions: tuple[tuple[tuple[float, float], ...], ...]
+    paths: tuple[tuple[tuple[float, float], ...], ...]
+
+    @classmethod
+    def from_size(cls, size: str):
+        """Computes all vertex positions of a game board size
+
+        Args:
+            size (str): size of game board. look into SIZES for sizes
+
+        Returns:
+            BoardGeometry: geometry of the game board
+        """
+        dist = SIZES[size]
+
+        left_turn_vertices = frozenset(clockwise_pattern(dist))
+        outer_corners = frozenset(clockwise_pattern(dist*5, dist)
+                                  + clockwise_pattern(dist, dist*5))
+        vertices_fore_goal = clockwise_pattern(dist*5, 0)
+        right_turn_vertices = tuple(outer_corners | {vertex}
+                                    for vertex in vertices_fore_goal)
+
+        rev_vert_4_goal = list(reversed(clockwise_pattern_as_list(dist*5, dist)))
+        for idx, pos in enumerate(rev_vert_4_goal):
+            pos[0], pos[1] = pos[1], pos[0]
+            rev_vert_4_goal[idx] = tuple(rev_vert_4_goal[idx])
+        two_vertices_fore_goal = tuple(zip(vertices_fore_goal, rev_vert_4_goal))
+
+        goal_positions = tuple(tuple((factor_x*i*dist, factor_y*i*dist)
+                                     for i in range(1, 5))
+                               for factor_x, factor_y in clockwise_pattern(1, 0))
+
+        home_positions = tuple(zip(clockwise_pattern(dist*5 - dist//8),
+                                   clockwise_pattern(dist*4, dist*5 - dist//8),
+                                   clockwise_pattern(dist*5 - dist//8, dist*4),
+                                   clockwise_pattern(dist*4)))
+
+        starting_vertices = clockwise_pattern(dist*5, dist)
+        heading_vectors = {0: (1, 0), 90: (0, 1), 180: (-1, 0), 270: (0, -1)}
+        paths = []
+        for color, (x_pos, y_pos) in zip(COLORS, starting_vertices):
+            heading = HOME_ANGLES[color]
+            positions = [(x_pos, y_pos)]
+            for _ in range(PATH_LENGTH - 1):
+                if (x_pos, y_pos) in left_turn_vertices:
+                    heading = (heading + 90) % 360
+                if (x_pos, y_pos) in right_turn_vertices[COLOR_INDICES[color]]:
+                    heading = (heading - 90) % 360
+                factor_x, factor_y = heading_vectors[heading]
+                x_pos, y_pos = x_pos + factor_x*dist, y_pos + factor_y*dist
+                positions.append((x_pos, y_pos))
+            paths.append(tuple(positions))
+
+        return cls(size=size,
+                   dist=dist,
+                   left_turn_vertices=left_turn_vertices,
+                   right_turn_vertices=right_turn_vertices,
+                   starting_vertices=starting_vertices,
+                   vertices_fore_goal=vertices_fore_goal,
+                   two_vertices_fore_goal=two_vertices_fore_goal,
+                   goal_positions=goal_positions,
+                   home_positions=home_positions,
+                   paths=tuple(paths))
+
+
+BOARD_GEOMETRIES: dict[str, BoardGeometry] = {size: BoardGeometry.from_size(size)
+                                              for size in SIZES}
+"""Geometry of the game board accessed by size"""
+
+
+LAZY_DRAWING = ("game_board", "draw_winner_on_board", "record_display_list",
+                "replay_display_list", "BOARD_DISPLAY_LISTS")
+"""Names that get loaded from board_drawing on first use"""
+
+
+def __getattr__(name: str):
+    """Loads the drawing functions (and turtle) only when they are used
+
+    Args:
+        name (str): name of the attribute
+
+    Raises:
+        AttributeError: if the name is neither here nor in LAZY_DRAWING
+
+    Returns:
+        Any: attribute of board_drawing
+    """
+    if name in LAZY_DRAWING:
+        # pylint: disable-next=import-outside-toplevel
+        import board_drawing
+        return getattr(board_drawing, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main():
     """For testing and debugging purposes"""
-    game_board("large")
-    for color in COLORS:
-        draw_winner_on_board(color)
-    exitonclick()
+    print(BOARD_GEOMETRIES["medium"].starting_vertices)
+    print(FIELD_PATHS[1])
 
 
 if __name__ == "__main__":
@@ -1,60 +1,70 @@
 """This module represents a game piece"""
-# pylint: disable-next=no-name-in-module
-from turtle import Screen, Turtle, exitonclick
 
-from game_board import (GAME_PIECE_COLORS, HOME_ANGLES, SIZES,
-                        get_goal_factors, has_to_turn_left, has_to_turn_right,
-                        home_positions, starting_vertices)
-from tools import convert_Vec2D_to_tuple
+from typing import Optional
+
+from game_board import (COLOR_INDICES, FIELD_PATHS, PATH_LENGTH, SIZES,
+                        TRACK_LENGTH, path_positions)
+
+HOME = -1
+"""Steps of a game piece that is at home"""
+GOAL = TRACK_LENGTH
+"""Steps of a game piece on the most outer goal position"""
+LAST_STEP = PATH_LENGTH - 1
+"""Steps of a game piece on the most inner goal position"""
 
 
 class GamePiece:
     """This class represents one game piece in the game of a player
 
+    A game piece is pure data, nothing gets drawn here.
+    Its position is the amount of steps it made since leaving home:
+    HOME (-1) at home, 0 to 39 on the track relative to its starting vertex
+    and GOAL (40) to LAST_STEP (43) on the goal positions.
+    Coordinates are only derived from that for drawing.
+    Observers (e.g. a TurtleRenderer) get notified about every state change
+
     Attributes:
-        turtle (Turtle): turtle of game piece
+        board_size (str): size of game board. look into SIZES for sizes
         color (str): color of game piece
         home_position (tuple[float, float]): home position of game piece
-        steps (int): steps the game piece has made
+        steps (int): steps the game piece has made, HOME if at home
         is_done (bool): is game piece in goal and not playable
+        observers (list): objects that get notified about state changes
 
     Methods:
         __init__(self, board_size: str, color: str, home_position: tuple[float, float],
-                 *, speed: int = 0) -> None
+                 *, observers: Optional[list] = None) -> None
         __bool__(self) -> bool
         __repr__(self) -> str
         move(self, steps: int) -> GamePiece
         get_out(self) -> GamePiece
         reset(self) -> GamePiece
-        get_future_pos(self, steps: int) -> tuple[float, float]
+        get_future_pos(self, steps: int) -> int
         get_pos(self) -> tuple[float, float]
+        get_field(self) -> int
         in_home(self) -> bool
         in_goal(self) -> int
     """
 
+    __slots__ = ("board_size", "color", "home_position", "steps", "is_done", "observers")
+
     def __init__(self, board_size: str, color: str, home_position: tuple[float, float],
-                 *, speed: int = 0) -> None:
-        """Initializing attributes and setting up turtle
+                 *, observers: Optional[list] = None) -> None:
+        """Initializing attributes
 
         Args:
             board_size (str): size of game board. look into SIZES for sizes
             color (str): color of game piece
             home_position (tuple[float, float]): home pos of game board
-            speed (int, optional): speed of game piece. Defaults to 0.
+            observers (Optional[list], optional): objects that get notified
+                                                  about state changes. Defaults to None.
         """
         self.board_size = board_size
-        self.turtle = Turtle(shape="turtle")
         self.color: str = color
         self.home_position = home_position
-        self.steps: int = 0
+        self.steps: int = HOME
         self.is_done = False
-
-        screen = Screen()
-        screen.colormode(255)
-        self.turtle.fillcolor(GAME_PIECE_COLORS[self.color])
-        self.turtle.pencolor(255, 255, 255)
-        self.turtle.speed(speed)
-        self.turtle.penup()
+        self.observers: list = [] if observers is None else observers
 
     def __bool__(self) -> bool:
         """Existence of a game piece means true"""
@@ -64,10 +74,10 @@ class GamePiece:
         return f"{self.color = }\n{self.home_position = }\n{self.steps = }\n{self.is_done = }"
 
     def __repr__(self) -> str:
-        return f"GamePiece({self.board_size}, {self.color}, {self.home_position}, speed={self.turtle.speed()})"
+        return f"GamePiece({self.board_size}, {self.color}, {self.home_position})"
 
     def move(self, steps: int):
-        """Moving the turtle of the game piece
+        """Moving the game piece
 
         Args:
             steps (int): number of steps the game piece goes
@@ -75,15 +85,9 @@ class GamePiece:
         Returns:
             GamePiece: self
         """
-        dist = SIZES[self.board_size]
-        for _ in range(steps):
-            x_pos, y_pos = self.get_pos()
-            if has_to_turn_left(x_pos, y_pos, self.board_size):
-                self.turtle.left(90)
-            if has_to_turn_right(x_pos, y_pos, self.board_size, self.color):
-                self.turtle.right(90)
-            self.turtle.forward(dist)
-            self.steps += 1
+        self.steps += steps
+        for observer in self.observers:
+            observer.on_move(self, steps)
         return self
 
     def get_out(self):
@@ -92,7 +96,9 @@ class GamePiece:
         Returns:
             GamePiece: self
         """
-        self.turtle.goto(starting_vertices(self.board_size)[self.color])
+        self.steps = 0
+        for observer in self.observers:
+            observer.on_get_out(self)
         return self
 
     def reset(self):
@@ -101,46 +107,45 @@ class GamePiece:
         Returns:
             GamePiece: self
         """
-        self.steps = 0
-        self.turtle.goto(self.home_position)
-        self.turtle.seth(HOME_ANGLES[self.color])
+        self.steps = HOME
+        for observer in self.observers:
+            observer.on_reset(self)
         return self
 
-    def get_future_pos(self, steps: int) -> tuple[float, float]:
-        """Calculates the future position of the game piece's turtle
+    def get_future_pos(self, steps: int) -> int:
+        """Looks up the future field of a game piece on the board
 
         Args:
             steps (int): amount of steps the game piece goes
 
         Returns:
-            tuple[float, float]: future position of the turtle
+            int: future field of the game piece (look into FIELD_PATHS),
+                 -1 if there aren't enough fields left
         """
-        dist = SIZES[self.board_size]
-        x_pos, y_pos = self.get_pos()
-        future_heading = self.turtle.heading()
-        for _ in range(steps):
-            if has_to_turn_left(x_pos, y_pos, self.board_size):
-                future_heading = (future_heading + 90) % 360
-            if has_to_turn_right(x_pos, y_pos, self.board_size, self.color):
-                future_heading = (future_heading - 90) % 360
-
-            if future_heading == 0:
-                x_pos += dist
-            elif future_heading == 90:
-                y_pos += dist
-            elif future_heading == 180:
-                x_pos -= dist
-            elif future_heading == 270:
-                y_pos -= dist
-        return x_pos, y_pos
+        future_steps = self.steps + steps
+        if future_steps >= PATH_LENGTH:
+            return -1
+        return FIELD_PATHS[COLOR_INDICES[self.color]][future_steps]
 
     def get_pos(self) -> tuple[float, float]:
-        """Getter for the turtle's position
+        """Getter for the game piece's coordinates, only needed for drawing
+
+        Returns:
+            tuple[float, float]: game piece's position (x, y)
+        """
+        if self.steps == HOME:
+            return self.home_position
+        return path_positions(self.board_size, self.color)[self.steps]
+
+    def get_field(self) -> int:
+        """Getter for the field of the game piece on the board
 
         Returns:
-            tuple[float, float]: turtle's position (x, y)
+            int: field of the game piece (look into FIELD_PATHS), -1 if at home
         """
-        return convert_Vec2D_to_tuple(self.turtle.pos())
+        if self.steps == HOME:
+            return -1
+        return FIELD_PATHS[COLOR_INDICES[self.color]][self.steps]
 
     def in_home(self) -> bool:
         """Returns if a game piece is home
@@ -148,8 +153,7 @@ class GamePiece:
         Returns:
             bool: true if game piece is home
         """
-        return self.get_pos() in home_positions(self.board_size)[self.color]
-        # return self.get_pos() == self.home_position
+        return self.steps == HOME
 
     def in_goal(self) -> int:
         """Check method if game piece is in goal
@@ -161,16 +165,9 @@ class GamePiece:
         Returns:
             int: index of the goal position
         """
-        dist = SIZES[self.board_size]
-        x_pos, y_pos = self.get_pos()
-        factor_x, factor_y = get_goal_factors(self.color)
-        x_set = {factor_x*i for i in range(1, 5)}
-        y_set = {factor_y*i for i in range(1, 5)}
-        if x_pos / dist in x_set and y_pos / dist in y_set:
-            if len(y_set) == 1:
-                return int(abs(x_pos) / dist) - 1
-            return int(abs(y_pos) / dist) - 1
-        return -1
+        if self.steps < GOAL:
+            return -1
+        return LAST_STEP - self.steps
 
 
 def main():
@@ -183,18 +180,14 @@ def main():
     print(bool(game_piece))  # True
     print(not game_piece)  # False
 
-    game_piece.turtle.goto(-80, 0)
+    game_piece.steps = LAST_STEP
     print(game_piece.in_goal())
 
-    return
-    game_piece.turtle.goto(home_position)
-    game_piece.turtle.seth(90)
+    game_piece.get_out()
     print(game_piece.get_pos())
     print(game_piece.get_future_pos(2))
     print(game_piece.move(2).get_pos())
-    game_piece.turtle.stamp()
     print(game_piece.reset().get_pos())
-    exitonclick()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,375 @@
+"""This module streams the events of games into online statistics
+
+Games get turned into a stream of events (rolls, entries, moves, hits,
+rolls without a move, ends of turns and ends of games) by a generator.
+Aggregators consume the stream one event at a time and only keep counters,
+so the memory stays the same no matter how many games get analysed
+
+Events are derived from game records (look into record), so archived games
+get analysed without simulating them again
+
+Classes:
+    Event
+    Aggregator
+    WinRates
+    HitsPerField
+    GameLengths
+    PermissionLosses
+
+Functions:
+    record_events(record: GameRecord) -> Iterator[Event]
+    simulate_events(n_games: int, *, size: str = "medium", seed: int = 0,
+                    strategies: Optional[dict[str, Union[str, Strategy]]] = None
+                    ) -> Iterator[Event]
+    aggregate(events: Iterable[Event], aggregators: Sequence[Aggregator]) -> None
+"""
+
+from collections import Counter
+from typing import Iterable, Iterator, NamedTuple, Optional, Protocol, Sequence, Union
+
+from game_board import COLOR_INDICES, COLORS, FIELD_PATHS, TRACK_LENGTH
+from game_piece import HOME
+from main import game_seed
+from moves import apply, legal_moves, skip, winner
+from player import Strategy
+from record import PIECE_SHIFT, ROLL_MASK, GameRecord, record_game
+from state import PIECES_PER_COLOR, GameState
+
+ROLL = "roll"
+"""A color rolled the dice"""
+ENTRY = "entry"
+"""A game piece got out onto its starting field"""
+MOVE = "move"
+"""A game piece moved"""
+HIT = "hit"
+"""A game piece got sent home"""
+BLOCKED = "blocked"
+"""A color couldn't move any of its game pieces on the board"""
+DENIED = "denied"
+"""A color without playable game pieces didn't roll a 6 in three throws"""
+TURN_END = "turn_end"
+"""A turn is over"""
+GAME_END = "game_end"
+"""A game is over"""
+EVENT_KINDS = (ROLL, ENTRY, MOVE, HIT, BLOCKED, DENIED, TURN_END, GAME_END)
+"""All kinds of events in the order they happen during a roll"""
+
+
+class Event(NamedTuple):
+    """Something that happened in a game
+
+    Attributes:
+        kind (str): one of EVENT_KINDS
+        color (Optional[str]): color that rolled, the color that got hit for HIT,
+                               the winner (None if cut off) for GAME_END
+        roll (int, optional): rolled number, 0 if it doesn't belong to a roll
+        piece (int, optional): index of the game piece inside of its color, -1 if none
+        field (int, optional): field the event happened on (look into FIELD_PATHS), -1 if none
+        turns (int, optional): amount of turns of the game, only set for GAME_END
+    """
+    kind: str
+    color: Optional[str]
+    roll: int = 0
+    piece: int = -1
+    field: int = -1
+    turns: int = 0
+
+
+def _hits(before: GameState, after: GameState) -> Iterator[Event]:
+    """Game pieces of other colors that got sent home by a move
+
+    Args:
+        before (GameState): state before the move
+        after (GameState): state after the move
+
+    Yields:
+        Iterator[Event]: HIT event of every game piece that got sent home
+    """
+    turn = before.turn
+    for slot, (old, new) in enumerate(zip(before.positions, after.positions)):
+        if old != new and new == HOME + 1 and slot // PIECES_PER_COLOR != turn:
+            color_idx = slot // PIECES_PER_COLOR
+            yield Event(HIT, COLORS[color_idx], piece=slot % PIECES_PER_COLOR,
+                        field=FIELD_PATHS[color_idx][old - 1])
+
+
+def record_events(record: GameRecord) -> Iterator[Event]:
+    """Turns a recorded game into events
+
+    Args:
+        record (GameRecord): record of a game
+
+    Yields:
+        Iterator[Event]: events in the order they happened
+    """
+    state = GameState.initial(COLOR_INDICES[record.starting_color])
+    turns = 0
+    for event in record.events:
+        roll = event & ROLL_MASK
+        piece = (event >> PIECE_SHIFT) - 1
+        color_idx = state.turn
+        color = COLORS[color_idx]
+        yield Event(ROLL, color, roll)
+
+        if piece == -1:
+            # a color without any game piece on the board only waits for the permission
+            moves = legal_moves(state, roll, permission=True)
+            yield Event(DENIED if moves else BLOCKED, color, roll)
+            next_state = skip(state, roll)
+        else:
+            move = next(move for move in legal_moves(state, roll, permission=True)
+                        if move.piece == piece)
+            path = FIELD_PATHS[color_idx]
+            if move.start == HOME:
+                yield Event(ENTRY, color, roll, piece, path[0])
+            next_state = apply(state, move)
+            yield Event(MOVE, color, roll, piece, path[move.end])
+            yield from _hits(state, next_state)
+
+        if roll != 6:
+            turns += 1
+            yield Event(TURN_END, color)
+        state = next_state
+
+    won = winner(state)
+    yield Event(GAME_END, None if won is None else COLORS[won], turns=turns)
+
+
+def simulate_events(n_games: int, *, size: str = "medium", seed: int = 0,
+                    strategies: Optional[dict[str, Union[str, Strategy]]] = None
+                    ) -> Iterator[Event]:
+    """Plays games and streams their events, the seeds are the same as in main.simulate
+
+    Args:
+        n_games (int): amount of games
+        size (str, optional): size of game board. look into SIZES for sizes. Defaults to "medium".
+        seed (int, optional): seed of the simulation. Defaults to 0.
+        strategies (Optional[dict[str, Union[str, Strategy]]], optional):
+            strategy or name of a registered strategy accessed by color. Defaults to None.
+
+    Yields:
+        Iterator[Event]: events of all games one after another
+    """
+    for game_index in range(n_games):
+        _, record = record_game(size, game_seed(seed, game_index), strategies=strategies)
+        yield from record_events(record)
+
+
+class Aggregator(Protocol):
+    """Online statistic over a stream of events
+
+    Attributes:
+        kinds (tuple[str, ...]): kinds of events the statistic needs
+
+    Methods:
+        add(self, event: Event) -> None
+    """
+    kinds: tuple[str, ...]
+
+    def add(self, event: Event) -> None:
+        """Takes the next event of one of the kinds"""
+
+
+class WinRates:
+    """Share of games won by every color
+
+    Attributes:
+        kinds (tuple[str, ...]): kinds of events the statistic needs
+        games (int): amount of games
+        wins (Counter[str]): won games accessed by color
+
+    Methods:
+        __init__(self) -> None
+        __repr__(self) -> str
+        add(self, event: Event) -> None
+        rates(self) -> dict[str, float]
+    """
+    kinds = (GAME_END,)
+
+    def __init__(self) -> None:
+        """Initializing attributes"""
+        self.games = 0
+        self.wins: Counter[str] = Counter()
+
+    def __repr__(self) -> str:
+        return f"WinRates(games={self.games}, rates={self.rates()})"
+
+    def add(self, event: Event) -> None:
+        """Counts the end of a game
+
+        Args:
+            event (Event): GAME_END event
+        """
+        self.games += 1
+        if event.color is not None:
+            self.wins[event.color] += 1
+
+    def rates(self) -> dict[str, float]:
+        """Win rate of every color
+
+        Returns:
+            dict[str, float]: share of all games accessed by color
+        """
+        return {color: self.wins[color] / self.games if self.games else 0.0
+                for color in COLORS}
+
+
+class HitsPerField:
+    """How often game pieces got hit on every field of the track
+
+    Attributes:
+        kinds (tuple[str, ...]): kinds of events the statistic needs
+        hits (list[int]): amount of hits accessed by field
+
+    Methods:
+        __init__(self) -> None
+        __repr__(self) -> str
+        add(self, event: Event) -> None
+        frequencies(self) -> list[float]
+    """
+    kinds = (HIT,)
+
+    def __init__(self) -> None:
+        """Initializing attributes"""
+        self.hits = [0] * TRACK_LENGTH
+
+    def __repr__(self) -> str:
+        return f"HitsPerField(hits={self.hits})"
+
+    def add(self, event: Event) -> None:
+        """Counts a hit
+
+        Args:
+            event (Event): HIT event
+        """
+        self.hits[event.field] += 1
+
+    def frequencies(self) -> list[float]:
+        """Share of all hits that happened on every field
+
+        Returns:
+            list[float]: share accessed by field
+        """
+        total = sum(self.hits)
+        return [hits / total if total else 0.0 for hits in self.hits]
+
+
+class GameLengths:
+    """Histogram of the amount of turns per game
+
+    Attributes:
+        kinds (tuple[str, ...]): kinds of events the statistic needs
+        histogram (Counter[int]): amount of games accessed by their amount of turns
+
+    Methods:
+        __init__(self) -> None
+        __repr__(self) -> str
+        add(self, event: Event) -> None
+        mean(self) -> float
+    """
+    kinds = (GAME_END,)
+
+    def __init__(self) -> None:
+        """Initializing attributes"""
+        self.histogram: Counter[int] = Counter()
+
+    def __repr__(self) -> str:
+        return f"GameLengths(games={self.histogram.total()}, mean={self.mean():.1f})"
+
+    def add(self, event: Event) -> None:
+        """Counts the length of a game
+
+        Args:
+            event (Event): GAME_END event
+        """
+        self.histogram[event.turns] += 1
+
+    def mean(self) -> float:
+        """Average amount of turns per game
+
+        Returns:
+            float: mean of the histogram, 0 without games
+        """
+        games = self.histogram.total()
+        return sum(turns * count for turns, count in self.histogram.items()) / games \
+            if games else 0.0
+
+
+class PermissionLosses:
+    """Share of turns in which a color couldn't move,
+    because it didn't get the permission to leave home (look into main.get_permission)
+
+    Attributes:
+        kinds (tuple[str, ...]): kinds of events the statistic needs
+        turns (int): amount of turns
+        lost_turns (int): turns without a move and with at least one denied permission
+
+    Methods:
+        __init__(self) -> None
+        __repr__(self) -> str
+        add(self, event: Event) -> None
+        share(self) -> float
+    """
+    kinds = (MOVE, DENIED, TURN_END)
+
+    def __init__(self) -> None:
+        """Initializing attributes"""
+        self.turns = 0
+        self.lost_turns = 0
+        self._moved = False
+        self._denied = False
+
+    def __repr__(self) -> str:
+        return f"PermissionLosses(turns={self.turns}, share={self.share():.3f})"
+
+    def add(self, event: Event) -> None:
+        """Keeps track of the current turn
+
+        Args:
+            event (Event): MOVE, DENIED or TURN_END event
+        """
+        if event.kind == MOVE:
+            self._moved = True
+        elif event.kind == DENIED:
+            self._denied = True
+        else:
+            self.turns += 1
+            self.lost_turns += self._denied and not self._moved
+            self._moved = self._denied = False
+
+    def share(self) -> float:
+        """Share of the turns lost to the permission rule
+
+        Returns:
+            float: lost turns per turn, 0 without turns
+        """
+        return self.lost_turns / self.turns if self.turns else 0.0
+
+
+def aggregate(events: Iterable[Event], aggregators: Sequence[Aggregator]) -> None:
+    """Feeds a stream of events into aggregators,
+    every event only goes to the aggregators that need its kind
+
+    Args:
+        events (Iterable[Event]): stream of events
+        aggregators (Sequence[Aggregator]): statistics that get updated
+    """
+    handlers: dict[str, list] = {kind: [] for kind in EVENT_KINDS}
+    for aggregator in aggregators:
+        for kind in aggregator.kinds:
+            handlers[kind].append(aggregator.add)
+    for event in events:
+        for handler in handlers[event.kind]:
+            handler(event)
+
+
+def main() -> None:
+    """For testing and debugging purposes"""
+    aggregators = (WinRates(), HitsPerField(), GameLengths(), PermissionLosses())
+    aggregate(simulate_events(200), aggregators)
+    for aggregator in aggregators:
+        print(aggregator)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""This module is an in-memory stand-in for turtle
+
+A HeadlessTurtle keeps its position and heading in plain numbers
+and never opens a window, so a TurtleRenderer with headless turtles
+walks the game pieces over the board exactly like on the screen,
+just at the speed of plain Python and without Tk.
+All turns of the renderer are multiples of 90 degrees and all distances
+are integers, so the positions stay exact integers instead of
+drifting floats like the ones convert_Vec2D_to_tuple has to round
+
+Classes:
+    HeadlessTurtle
+    HeadlessScreen
+
+Functions:
+    headless_renderer(board_size: str, **kwargs) -> TurtleRenderer
+"""
+
+import math
+from typing import Optional, Union
+
+from renderer import TurtleRenderer
+
+AXIS_DIRECTIONS = {0: (1, 0), 90: (0, 1), 180: (-1, 0), 270: (0, -1)}
+"""Unit steps of the headings a game piece can have on the board"""
+
+Number = Union[int, float]
+
+
+class HeadlessTurtle:
+    """Turtle that only remembers where it is
+
+    Implements the part of turtle.Turtle the renderer and the board drawing use,
+    everything that only changes the look of a turtle gets ignored
+
+    Attributes:
+        x_pos (Number): x coordinate
+        y_pos (Number): y coordinate
+        angle (Number): heading in degrees, 0 is east and 90 is north
+        turtle_speed (int): speed of the turtle, only remembered
+        is_down (bool): does the turtle draw while moving
+        is_visible (bool): is the turtle shown
+        texts (list[tuple[str, tuple[Number, Number]]]): written texts and their positions
+
+    Methods:
+        __init__(self, shape: str = "classic", **_) -> None
+        __repr__(self) -> str
+        forward(self, distance: Number) -> None
+        left(self, angle: Number) -> None
+        right(self, angle: Number) -> None
+        goto(self, x: Union[Number, tuple[Number, Number]],
+             y: Optional[Number] = None) -> None
+        seth(self, to_angle: Number) -> None
+        heading(self) -> Number
+        pos(self) -> tuple[Number, Number]
+        towards(self, x: Union[Number, tuple[Number, Number]],
+                y: Optional[Number] = None) -> Number
+        speed(self, speed: Optional[int] = None) -> Optional[int]
+        penup(self) -> None
+        pendown(self) -> None
+        hideturtle(self) -> None
+        showturtle(self) -> None
+        fillcolor(self, *_) -> None
+        pencolor(self, *_) -> None
+        write(self, arg: object, **_) -> None
+    """
+
+    __slots__ = ("shape", "x_pos", "y_pos", "angle", "turtle_speed", "is_down", "is_visible",
+                 "texts")
+
+    def __init__(self, shape: str = "classic", **_) -> None:
+        """Initializing attributes
+
+        Args:
+            shape (str, optional): shape of the turtle, only remembered. Defaults to "classic".
+        """
+        self.shape = shape
+        self.x_pos: Number = 0
+        self.y_pos: Number = 0
+        self.angle: Number = 0
+        self.turtle_speed = 3
+        self.is_down = True
+        self.is_visible = True
+        self.texts: list[tuple[str, tuple[Number, Number]]] = []
+
+    def __repr__(self) -> str:
+        return f"HeadlessTurtle(pos={self.pos()}, heading={self.angle})"
+
+    def forward(self, distance: Number) -> None:
+        """Moves in the direction of the heading
+
+        Args:
+            distance (Number): distance that gets moved
+        """
+        direction = AXIS_DIRECTIONS.get(self.angle)
+        if direction is None:
+            radians = math.radians(self.angle)
+            direction = (math.cos(radians), math.sin(radians))
+        self.x_pos += direction[0] * distance
+        self.y_pos += direction[1] * distance
+
+    def left(self, angle: Number) -> None:
+        """Turns counterclockwise
+
+        Args:
+            angle (Number): angle in degrees
+        """
+        self.angle = (self.angle + angle) % 360
+
+    def right(self, angle: Number) -> None:
+        """Turns clockwise
+
+        Args:
+            angle (Number): angle in degrees
+        """
+        self.angle = (self.angle - angle) % 360
+
+    def goto(self, x: Union[Number, tuple[Number, Number]],
+             y: Optional[Number] = None) -> None:
+        """Jumps to a position
+
+        Args:
+            x (Union[Number, tuple[Number, Number]]): x coordinate or position
+            y (Optional[Number], optional): y coordinate if x isn't a position. Defaults to None.
+        """
+        self.x_pos, self.y_pos = x if y is None else (x, y)
+
+    def seth(self, to_angle: Number) -> None:
+        """Sets the heading
+
+        Args:
+            to_angle (Number): heading in degrees
+        """
+        self.angle = to_angle % 360
+
+    setheading = seth
+
+    def heading(self) -> Number:
+        """Current heading
+
+        Returns:
+            Number: heading in degrees
+        """
+        return self.angle
+
+    def pos(self) -> tuple[Number, Number]:
+        """Current position
+
+        Returns:
+            tuple[Number, Number]: position (x, y)
+        """
+        return self.x_pos, self.y_pos
+
+    position = pos
+
+    def towards(self, x: Union[Number, tuple[Number, Number]],
+                y: Optional[Number] = None) -> Number:
+        """Heading that points to a position
+
+        Args:
+            x (Union[Number, tuple[Number, Number]]): x coordinate or position
+            y (Optional[Number], optional): y coordinate if x isn't a position. Defaults to None.
+
+        Returns:
+            Number: heading in degrees, an integer along the axes
+        """
+        x_pos, y_pos = x if y is None else (x, y)
+        d_x, d_y = x_pos - self.x_pos, y_pos - self.y_pos
+        for angle, direction in AXIS_DIRECTIONS.items():
+            # parallel to the axis and pointing the same way
+            if (d_x * direction[1] == d_y * direction[0]
+                    and d_x * direction[0] + d_y * direction[1] > 0):
+                return angle
+        return math.degrees(math.atan2(d_y, d_x)) % 360
+
+    def speed(self, speed: Optional[int] = None) -> Optional[int]:
+        """Sets or gets the speed
+
+        Args:
+            speed (Optional[int], optional): new speed, None to get it. Defaults to None.
+
+        Returns:
+            Optional[int]: speed if no new one was given
+        """
+        if speed is None:
+            return self.turtle_speed
+        self.turtle_speed = speed
+        return None
+
+    def penup(self) -> None:
+        """Stops drawing while moving"""
+        self.is_down = False
+
+    def pendown(self) -> None:
+        """Starts drawing while moving"""
+        self.is_down = True
+
+    def hideturtle(self) -> None:
+        """Hides the turtle"""
+        self.is_visible = False
+
+    def showturtle(self) -> None:
+        """Shows the turtle"""
+        self.is_visible = True
+
+    def fillcolor(self, *_) -> None:
+        """Ignores the fill color"""
+
+    def pencolor(self, *_) -> None:
+        """Ignores the pen color"""
+
+    def write(self, arg: object, **_) -> None:
+        """Remembers a text instead of writing it
+
+        Args:
+            arg (object): text that gets written
+        """
+        self.texts.append((str(arg), self.pos()))
+
+
+class HeadlessScreen:
+    """Screen that only counts how often it would have been redrawn
+
+    Attributes:
+        updates (int): amount of redraws
+
+    Methods:
+        __init__(self) -> None
+        colormode(self, *_) -> None
+        tracer(self, *_) -> None
+        update(self) -> None
+    """
+
+    __slots__ = ("updates",)
+
+    def __init__(self) -> None:
+        """Initializing attributes"""
+        self.updates = 0
+
+    def colormode(self, *_) -> None:
+        """Ignores the color mode"""
+
+    def tracer(self, *_) -> None:
+        """Ignores the animation settings"""
+
+    def update(self) -> None:
+        """Counts a redraw"""
+        self.updates += 1
+
+
+def headless_renderer(board_size: str, **kwargs) -> TurtleRenderer:
+    """TurtleRenderer that draws with headless turtles
+
+    Args:
+        board_size (str): size of game board. look into SIZES for sizes
+        **kwargs: other arguments of TurtleRenderer
+
+    Returns:
+        TurtleRenderer: renderer with a HeadlessScreen
+    """
+    return TurtleRenderer(board_size, turtle_factory=HeadlessTurtle, screen=HeadlessScreen(),
+                          **kwargs)
+
+
+def main():
+    """For testing and debugging purposes"""
+    # pylint: disable-next=import-outside-toplevel
+    from main import play_game, setup
+    # pylint: disable-next=import-outside-toplevel
+    from record import record_game, replay
+    # pylint: disable-next=import-outside-toplevel
+    from tools import DiceStream
+
+    _, record = record_game("medium", 0)
+    players = setup("medium", 4, starting_color=record.starting_color)
+    replay(record).load_into(players)
+    expected = [game_piece.get_pos() for player in players for game_piece in player.game_pieces]
+    for fast_forward in (False, True):
+        renderer = headless_renderer("medium", fast_forward=fast_forward)
+        result = play_game("medium", renderer=renderer, dice_stream=DiceStream(seed=0))
+        positions = [turtle.pos() for turtle in renderer.turtles.values()]
+        print(f"{fast_forward = }", result, renderer.screen.updates, positions == expected)
+
+
+if __name__ == "__main__":
+    main()
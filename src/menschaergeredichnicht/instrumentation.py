@@ -0,0 +1,128 @@
+"""This module measures where the game loop spends its time
+
+An Instrumentation gets passed into main.play_game (or start_game_loop)
+and collects the time of every phase of a move and counters of what happened.
+Without one the game loop only checks for None, so it costs nothing
+
+Classes:
+    Instrumentation
+
+Functions:
+    run_profiled(func: Callable[[], T], profiler=None) -> tuple[T, Any]
+"""
+
+from collections import Counter
+from typing import Any, Callable, TypeVar
+
+PHASES = ("roll", "permission", "validation", "pick", "move", "hit_check", "win_check")
+"""Phases of the game loop that get timed, in the order they happen"""
+COUNTERS = ("games", "turns", "rolls", "moves", "hits", "entries", "blocked", "denied",
+            "cut_off")
+"""Things that get counted:
+games, turns and rolls that were played, moves of game pieces,
+game pieces that got hit, game pieces that got out,
+rolls without a valid game piece on the board,
+rolls without game pieces on the board and without permission
+and games that got cut off after MAX_ITERATIONS"""
+
+T = TypeVar("T")
+
+
+class Instrumentation:
+    """Timers and counters of the game loop
+
+    Attributes:
+        timers (dict[str, float]): seconds spent accessed by phase (look into PHASES)
+        counters (Counter[str]): amounts accessed by name (look into COUNTERS)
+
+    Methods:
+        __init__(self) -> None
+        __repr__(self) -> str
+        add_time(self, phase: str, seconds: float) -> None
+        count(self, name: str, amount: int = 1) -> None
+        merge(self, other: Instrumentation) -> Instrumentation
+        report(self) -> str
+    """
+
+    __slots__ = ("timers", "counters")
+
+    def __init__(self) -> None:
+        """Initializing attributes"""
+        self.timers: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.counters: Counter[str] = Counter(dict.fromkeys(COUNTERS, 0))
+
+    def __repr__(self) -> str:
+        return f"Instrumentation(timers={self.timers}, counters={dict(self.counters)})"
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """Adds time to a phase
+
+        Args:
+            phase (str): phase of the game loop (look into PHASES)
+            seconds (float): time spent
+        """
+        self.timers[phase] += seconds
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increases a counter
+
+        Args:
+            name (str): name of the counter (look into COUNTERS)
+            amount (int, optional): amount that gets added. Defaults to 1.
+        """
+        self.counters[name] += amount
+
+    def merge(self, other):
+        """Adds the measurements of other games
+
+        Args:
+            other (Instrumentation): measurements of the other games
+
+        Returns:
+            Instrumentation: self
+        """
+        for phase, seconds in other.timers.items():
+            self.timers[phase] = self.timers.get(phase, 0.0) + seconds
+        self.counters.update(other.counters)
+        return self
+
+    def report(self) -> str:
+        """Readable summary of the measurements
+
+        Returns:
+            str: one line per phase and counter
+        """
+        total = sum(self.timers.values())
+        rolls = self.counters["rolls"] or 1
+        lines = [f"{phase:<12}{seconds * 1e3:10.2f} ms {seconds / total if total else 0:7.1%}"
+                 f"{seconds / rolls * 1e6:9.2f} us/roll"
+                 for phase, seconds in self.timers.items()]
+        lines.extend(f"{name:<12}{amount:10d}" for name, amount in self.counters.items())
+        return "\n".join(lines)
+
+
+def run_profiled(func: Callable[[], T], profiler=None) -> tuple[T, Any]:
+    """Runs a function under a profiler
+
+    Args:
+        func (Callable[[], T]): function that gets profiled, a game for example
+        profiler (optional): profiler with enable/disable (like cProfile.Profile)
+                             or start/stop (like most sampling profilers),
+                             None for a new cProfile.Profile. Defaults to None.
+
+    Returns:
+        tuple[T, Any]: result of the function and the profiler
+    """
+    if profiler is None:
+        # only profiled runs pay for loading the profiler
+        # pylint: disable-next=import-outside-toplevel
+        import cProfile
+        profiler = cProfile.Profile()
+    start, stop = ((profiler.enable, profiler.disable) if hasattr(profiler, "enable")
+                   else (profiler.start, profiler.stop))
+    start()
+    try:
+        result = func()
+    finally:
+        stop()
+    return result, profiler
@@ -35,22 +35,32 @@ TODO:
   benutzt werden, funktioniert nicht
 """
 
+import os
+from collections import Counter
+from functools import partial
 from itertools import cycle
-from random import choice
-from turtle import exitonclick  # pylint: disable=no-name-in-module
-from typing import Optional
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple, Optional, Union
 
-from game_board import (COLORS, HOME_ANGLES, draw_winner_on_board, game_board,
-                        goal_positions, home_positions)
+from game_board import BOARD_GEOMETRIES, COLOR_INDICES, COLORS
 from game_piece import GamePiece
-from player import Player
-from tools import dice
+from instrumentation import Instrumentation, run_profiled
+from occupancy import OccupancyIndex
+from player import Player, Strategy
+from state import GameState
+from strategies import resolve_strategy
+from tools import DiceStream
+
+if TYPE_CHECKING:
+    from record import GameRecorder
+    from renderer import TurtleRenderer
 
 ############################ Start of game mechanics ###########################
 
 
 def did_player_hit_other_players(*, game_piece_being_checked: Optional[GamePiece],
-                                 players: list[Player]) -> None:
+                                 players: list[Player],
+                                 occupancy: Optional[OccupancyIndex] = None) -> int:
     """Helper function for the game mechanic that players can hit other players
 
     If other player got hit, game piece gets reset
@@ -58,32 +68,56 @@ def did_player_hit_other_players(*, game_piece_being_checked: Optional[GamePiece
     Args:
         game_piece_being_checked (GamePiece): game piece that made a move
         players (list[Player]): information of all players
+        occupancy (Optional[OccupancyIndex], optional): index of the fields of all game pieces,
+                                                        None to compare with every game piece.
+                                                        Defaults to None.
+
+    Returns:
+        int: amount of game pieces that got hit
     """
     if not game_piece_being_checked:
-        return
+        return 0
+
+    current_field = game_piece_being_checked.get_field()
+    if current_field == -1:
+        return 0
 
-    current_pos = game_piece_being_checked.get_pos()
+    if occupancy is not None:
+        victims = [game_piece for game_piece in occupancy.at(current_field)
+                   if game_piece.color != game_piece_being_checked.color]
+        for game_piece in victims:
+            game_piece.reset()
+        return len(victims)
+
+    hits = 0
     for player in players:
         if player.color == game_piece_being_checked.color:
             continue
         for game_piece in player.game_pieces:
-            if game_piece.get_pos() == current_pos:
+            if game_piece.get_field() == current_field:
                 game_piece.reset()
+                hits += 1
+    return hits
 
 
-def get_permission() -> bool:
+def get_permission(dice_stream: DiceStream) -> bool:
     """Gives a game piece the permission to leave home and get on field
 
+    Args:
+        dice_stream (DiceStream): dice of the game
+
     Returns:
         bool: true if the dice got a 6 in three throws
     """
     for _ in range(3):
-        if dice() == 6:
+        if dice_stream.roll() == 6:
             return True
     return False
 
 
-def make_a_move(*, steps: int, current_player: Player, players: list[Player]) -> None:
+def make_a_move(*, steps: int, current_player: Player, players: list[Player],
+                dice_stream: DiceStream, occupancy: Optional[OccupancyIndex] = None,
+                instrumentation: Optional[Instrumentation] = None) -> int:
     """Simulates and also handles the move in the game
 
     If a player has no game pieces to play with,
@@ -94,18 +128,70 @@ def make_a_move(*, steps: int, current_player: Player, players: list[Player]) ->
         steps (int): number of steps
         current_player (Player): the player that has the current turn
         players (list[Player]): information of all players
-    """
-    permission = get_permission()
+        dice_stream (DiceStream): dice of the game
+        occupancy (Optional[OccupancyIndex], optional): index of the fields of all game pieces.
+                                                        Defaults to None.
+        instrumentation (Optional[Instrumentation], optional): times the phases of the move,
+                                                               None to skip measuring.
+                                                               Defaults to None.
 
-    if not has_player_playable_game_pieces_on_board(current_player) and permission:
+    Returns:
+        int: amount of game pieces of other players that got hit
+    """
+    # every phase only gets timed with an instrumentation, the rules stay the same
+    timed = instrumentation is not None
+    start = perf_counter() if timed else 0.0
+    permission = get_permission(dice_stream)
+    if timed:
+        instrumentation.add_time("permission", perf_counter() - start)
+    hits = 0
+
+    playable = has_player_playable_game_pieces_on_board(current_player)
+    if not playable:
+        if not permission:
+            if timed:
+                instrumentation.count("denied")
+            return hits
+        if timed:
+            start = perf_counter()
         current_game_piece = current_player.place_game_piece_on_start()
-        did_player_hit_other_players(game_piece_being_checked=current_game_piece,
-                                     players=players)
-
-    if has_player_playable_game_pieces_on_board(current_player):
-        current_game_piece = current_player.move(steps)
-        did_player_hit_other_players(game_piece_being_checked=current_game_piece,
-                                     players=players)
+        if timed:
+            instrumentation.add_time("move", perf_counter() - start)
+            instrumentation.count("entries")
+            start = perf_counter()
+        hits += did_player_hit_other_players(game_piece_being_checked=current_game_piece,
+                                             players=players, occupancy=occupancy)
+        if timed:
+            instrumentation.add_time("hit_check", perf_counter() - start)
+        # a game piece that got out is playable, there's none if all of them are on the way
+        playable = current_game_piece is not None
+
+    if playable:
+        if timed:
+            start = perf_counter()
+        game_pieces = current_player.get_valid_game_pieces(steps)
+        if timed:
+            instrumentation.add_time("validation", perf_counter() - start)
+            instrumentation.count("blocked", not game_pieces)
+            start = perf_counter()
+        state = (GameState.from_players(players, current_player.color)
+                 if game_pieces and current_player.strategy is not None else None)
+        current_game_piece = current_player.choose_game_piece(game_pieces, steps, state)
+        if timed:
+            instrumentation.add_time("pick", perf_counter() - start)
+            start = perf_counter()
+        current_game_piece = current_player.move_game_piece(current_game_piece, steps)
+        if timed:
+            instrumentation.add_time("move", perf_counter() - start)
+            instrumentation.count("moves", current_game_piece is not None)
+            start = perf_counter()
+        hits += did_player_hit_other_players(game_piece_being_checked=current_game_piece,
+                                             players=players, occupancy=occupancy)
+        if timed:
+            instrumentation.add_time("hit_check", perf_counter() - start)
+    if timed:
+        instrumentation.count("hits", hits)
+    return hits
 
 
 ############################# End of game mechanics ############################
@@ -128,6 +214,7 @@ def has_player_playable_game_pieces_on_board(current_player: Player) -> bool:
     return False
 
 
+# pylint: disable-next=unused-argument
 def has_one_player_won(size: str, players: list[Player]) -> Optional[Player]:
     """Checks if a player has won yet
 
@@ -141,7 +228,7 @@ def has_one_player_won(size: str, players: list[Player]) -> Optional[Player]:
     for player in players:
         has_player_won = True
         for game_piece in player.game_pieces:
-            if game_piece.get_pos() not in goal_positions(size)[player.color]:
+            if game_piece.in_goal() == -1:
                 has_player_won = False
                 break
         if has_player_won:
@@ -153,47 +240,95 @@ def has_one_player_won(size: str, players: list[Player]) -> Optional[Player]:
 ########################## Start of setup & game loop ##########################
 
 
-def draw_winner(player: Player) -> None:
-    """Draws winner by passing on the color of the player
+class GameResult(NamedTuple):
+    """Outcome of one game
 
-    Args:
-        player (Player): player that won
+    Attributes:
+        starting_color (str): color of the player that started the game
+        winner (Optional[str]): color of the player that won, None if no one has won
+        iterations (int): amount of turns that were played
+        hits (dict[str, int]): amount of game pieces a color has hit
     """
-    draw_winner_on_board(player.color)
+    starting_color: str
+    winner: Optional[str]
+    iterations: int
+    hits: dict[str, int]
+
+
+MAX_ITERATIONS = 300
+"""A game gets cut off after that many turns"""
 
 
 # pylint: disable-next=unused-argument
-def setup(size: str, amount_of_players: int) -> list[Player]:
+def setup(size: str, amount_of_players: int,
+          renderer: Optional["TurtleRenderer"] = None,
+          strategies: Optional[dict[str, Union[str, Strategy]]] = None,
+          dice_stream: Optional[DiceStream] = None,
+          occupancy: Optional[OccupancyIndex] = None,
+          starting_color: Optional[str] = None) -> list[Player]:
     """A setup function so the game can start with initial values
 
     Args:
         size (str): size of game board. look into SIZES for sizes
         amount_of_players (int): the amount of players in the game (not implemented yet)
+        renderer (Optional[TurtleRenderer], optional): renderer that draws the game pieces,
+                                                       None for a headless game.
+                                                       Defaults to None.
+        strategies (Optional[dict[str, Union[str, Strategy]]], optional):
+            strategy or name of a registered strategy (look into strategies) accessed by color,
+            colors without one use the default behaviour. Defaults to None.
+        dice_stream (Optional[DiceStream], optional): picks the starting color,
+                                                      None for a new unseeded one.
+                                                      Defaults to None.
+        occupancy (Optional[OccupancyIndex], optional): index that tracks the fields
+                                                        of all game pieces. Defaults to None.
+        starting_color (Optional[str], optional): color that starts the game,
+                                                  None for a random one. Defaults to None.
 
     Returns:
-        list[Player]: first a tuple with all the players,
-                      second the player that starts the game
+        list[Player]: all the players, the player that starts the game comes first
     """
+    if strategies is None:
+        strategies = {}
+    if dice_stream is None:
+        dice_stream = DiceStream()
+
     # set up the starting color
-    starting_color = choice(COLORS)
+    if starting_color is None:
+        starting_color = dice_stream.choice(COLORS)
     index_of_starting_color = COLORS.index(starting_color)
     colors = COLORS[index_of_starting_color:] + COLORS[:index_of_starting_color]
 
+    geometry = BOARD_GEOMETRIES[size]
     players: list[Player] = []
     for color in colors:
         players.append(Player(board_size=size, color=color, game_pieces=[GamePiece(
-            size, color, home_positions(size)[color][i], speed=3) for i in range(4)]))
+            size, color, geometry.home_positions[COLOR_INDICES[color]][i]) for i in range(4)],
+            strategy=(resolve_strategy(strategies[color], dice_stream)
+                      if color in strategies else None),
+            occupancy=occupancy))
 
-    for player, color in zip(players, colors):
-        for game_piece in player.game_pieces:
-            game_piece.turtle.seth(HOME_ANGLES[color])
-            game_piece.turtle.goto(game_piece.home_position)
+    if occupancy is not None:
+        for player in players:
+            for game_piece in player.game_pieces:
+                occupancy.attach(game_piece)
+
+    if renderer is not None:
+        for player in players:
+            for game_piece in player.game_pieces:
+                renderer.attach(game_piece)
 
     return players
 
 
-def start_game_loop(size: str, amount_of_players: int = 4) -> None:
-    """Starts the game loop
+def play_game(size: str, amount_of_players: int = 4, *,
+              renderer: Optional["TurtleRenderer"] = None,
+              strategies: Optional[dict[str, Union[str, Strategy]]] = None,
+              dice_stream: Optional[DiceStream] = None,
+              starting_color: Optional[str] = None,
+              recorder: Optional["GameRecorder"] = None,
+              instrumentation: Optional[Instrumentation] = None) -> GameResult:
+    """Plays one game until someone has won or it gets cut off
 
     Loop works as follows:
     - move the current player
@@ -201,45 +336,333 @@ def start_game_loop(size: str, amount_of_players: int = 4) -> None:
     - set the next player for the next iteration
     - check if someone has won yet
 
+    Hits and blocked moves are looked up in an OccupancyIndex.
+    All random numbers come from dice_stream,
+    so a game gets replayed by passing a stream with the same seed
+
     Args:
         size (str): size of game board. look into SIZES for sizes
         amount_of_players (int, optional): amount of players that are playing (not implemented yet).
                                            Defaults to 4.
+        renderer (Optional[TurtleRenderer], optional): renderer that draws the game,
+                                                       None for a headless game.
+                                                       Defaults to None.
+        strategies (Optional[dict[str, Union[str, Strategy]]], optional):
+            strategy or name of a registered strategy accessed by color. Defaults to None.
+        dice_stream (Optional[DiceStream], optional): dice of the game,
+                                                      None for a new unseeded one.
+                                                      Defaults to None.
+        starting_color (Optional[str], optional): color that starts the game,
+                                                  None for a random one. Defaults to None.
+        recorder (Optional[GameRecorder], optional): writes the move log of the game,
+                                                     look into record. Defaults to None.
+        instrumentation (Optional[Instrumentation], optional): times the phases of the game
+                                                               loop and counts what happened,
+                                                               None to skip measuring.
+                                                               Defaults to None.
+
+    Returns:
+        GameResult: outcome of the game
     """
-    players = setup(size, amount_of_players)
+    if dice_stream is None:
+        dice_stream = DiceStream()
+    occupancy = OccupancyIndex()
+    players = setup(size, amount_of_players, renderer, strategies, dice_stream, occupancy,
+                    starting_color)
+    if recorder is not None:
+        for player in players:
+            for game_piece in player.game_pieces:
+                recorder.attach(game_piece)
     won_player: Optional[Player] = None
+    hits = dict.fromkeys(COLORS, 0)
 
     iterations = 0
+    start = 0.0
     for player in cycle(players):
-        dice_results = [dice()]
+        if instrumentation is not None:
+            start = perf_counter()
+        dice_results = [dice_stream.roll()]
         while dice_results[-1] == 6:
-            dice_results.append(dice())
+            dice_results.append(dice_stream.roll())
+        if instrumentation is not None:
+            instrumentation.add_time("roll", perf_counter() - start)
+            instrumentation.count("rolls", len(dice_results))
         for steps in dice_results:
-            make_a_move(steps=steps, current_player=player, players=players)
-            won_player = has_one_player_won(size, players)
+            if recorder is not None:
+                recorder.on_roll(steps)
+            hits[player.color] += make_a_move(steps=steps, current_player=player,
+                                              players=players, dice_stream=dice_stream,
+                                              occupancy=occupancy,
+                                              instrumentation=instrumentation)
+        # only the player that moved can have won, and a win can't get undone
+        # by the remaining rolls of the turn, so one check per turn is enough
+        if instrumentation is not None:
+            start = perf_counter()
+        won_player = has_one_player_won(size, [player])
+        if instrumentation is not None:
+            instrumentation.add_time("win_check", perf_counter() - start)
         iterations += 1
-        if won_player or iterations > 300:
+        if renderer is not None:
+            renderer.end_turn()
+        if won_player or iterations > MAX_ITERATIONS:
             break
 
+    if instrumentation is not None:
+        instrumentation.count("games")
+        instrumentation.count("turns", iterations)
+        instrumentation.count("cut_off", won_player is None)
+
+    return GameResult(starting_color=players[0].color,
+                      winner=won_player.color if won_player else None,
+                      iterations=iterations,
+                      hits=hits)
+
+
+def start_game_loop(size: str, amount_of_players: int = 4, *,
+                    renderer: Optional["TurtleRenderer"] = None,
+                    seed=None, instrumentation: Optional[Instrumentation] = None,
+                    profiler=None) -> GameResult:
+    """Starts the game loop and announces the winner
+
+    Args:
+        size (str): size of game board. look into SIZES for sizes
+        amount_of_players (int, optional): amount of players that are playing (not implemented yet).
+                                           Defaults to 4.
+        renderer (Optional[TurtleRenderer], optional): renderer that draws the game,
+                                                       None for a headless game.
+                                                       Defaults to None.
+        seed (optional): seed of the dice, None for a random game. Defaults to None.
+        instrumentation (Optional[Instrumentation], optional): times the phases of the game
+                                                               loop and gets printed afterwards.
+                                                               Defaults to None.
+        profiler (optional): profiler the game runs under, like cProfile.Profile
+                             or a sampling profiler (look into run_profiled).
+                             Defaults to None.
+
+    Returns:
+        GameResult: outcome of the game
+    """
+    def play() -> GameResult:
+        return play_game(size, amount_of_players, renderer=renderer,
+                         dice_stream=DiceStream(seed=seed), instrumentation=instrumentation)
+
+    result = play() if profiler is None else run_profiled(play, profiler)[0]
+
+    iterations = result.iterations
     print(f"{iterations = }")
-    if isinstance(won_player, Player):
-        print(f"{won_player.color} has won the game")
-        draw_winner(won_player)
+    if instrumentation is not None:
+        print(instrumentation.report())
+    if result.winner is not None:
+        print(f"{result.winner} has won the game")
+        if renderer is not None:
+            renderer.draw_winner(result.winner)
+    return result
 
 
-def start_game(size: str = "medium") -> None:
+def start_game(size: str = "medium", seed=None, *, fast_forward: bool = False) -> None:
     """Starts game
 
     Args:
         size (str, optional): size of game board. look into SIZES for sizes. Defaults to "medium".
+        seed (optional): seed of the dice, None for a random game. Defaults to None.
+        fast_forward (bool, optional): draw without animations and redraw once per turn.
+                                       Defaults to False.
     """
-    game_board(size)
-    start_game_loop(size)
+    # drawing needs turtle and tkinter, headless games never load them
+    # pylint: disable-next=import-outside-toplevel
+    from board_drawing import game_board
+    # pylint: disable-next=import-outside-toplevel
+    from renderer import TurtleRenderer
+    # pylint: disable-next=import-outside-toplevel,no-name-in-module
+    from turtle import exitonclick
+
+    game_board(size, animate=not fast_forward)
+    start_game_loop(size, renderer=TurtleRenderer(size, fast_forward=fast_forward), seed=seed)
     exitonclick()
 
 
 ########################### End of start & game loop ###########################
 
+############################# Start of simulation ##############################
+
+
+class SimulationResult:
+    """Aggregated outcome of many games
+
+    Seats are counted in the order of play, the starting player has seat 0
+
+    Attributes:
+        games (int): amount of games
+        wins_per_color (Counter[str]): won games accessed by color
+        wins_per_seat (Counter[int]): won games accessed by seat
+        game_lengths (Counter[int]): amount of games accessed by their iterations
+        hits (Counter[str]): amount of game pieces a color has hit
+
+    Methods:
+        __init__(self) -> None
+        __repr__(self) -> str
+        add(self, result: GameResult) -> SimulationResult
+        merge(self, other: SimulationResult) -> SimulationResult
+        unfinished_games(self) -> int
+        win_rates_per_color(self) -> dict[str, float]
+        win_rates_per_seat(self) -> dict[int, float]
+    """
+
+    def __init__(self) -> None:
+        """Initializing attributes"""
+        self.games = 0
+        self.wins_per_color: Counter[str] = Counter()
+        self.wins_per_seat: Counter[int] = Counter()
+        self.game_lengths: Counter[int] = Counter()
+        self.hits: Counter[str] = Counter()
+
+    def __repr__(self) -> str:
+        return (f"SimulationResult(games={self.games}, "
+                f"win_rates_per_color={self.win_rates_per_color()}, "
+                f"win_rates_per_seat={self.win_rates_per_seat()}, "
+                f"unfinished_games={self.unfinished_games()}, hits={dict(self.hits)})")
+
+    def add(self, result: GameResult):
+        """Adds the outcome of one game
+
+        Args:
+            result (GameResult): outcome of the game
+
+        Returns:
+            SimulationResult: self
+        """
+        self.games += 1
+        self.game_lengths[result.iterations] += 1
+        self.hits.update(result.hits)
+        if result.winner is not None:
+            self.wins_per_color[result.winner] += 1
+            seat = (COLOR_INDICES[result.winner]
+                    - COLOR_INDICES[result.starting_color]) % len(COLORS)
+            self.wins_per_seat[seat] += 1
+        return self
+
+    def merge(self, other):
+        """Adds the outcome of other games
+
+        Args:
+            other (SimulationResult): aggregated outcome of the other games
+
+        Returns:
+            SimulationResult: self
+        """
+        self.games += other.games
+        self.wins_per_color.update(other.wins_per_color)
+        self.wins_per_seat.update(other.wins_per_seat)
+        self.game_lengths.update(other.game_lengths)
+        self.hits.update(other.hits)
+        return self
+
+    def unfinished_games(self) -> int:
+        """Amount of games that got cut off without a winner
+
+        Returns:
+            int: amount of unfinished games
+        """
+        return self.games - sum(self.wins_per_color.values())
+
+    def win_rates_per_color(self) -> dict[str, float]:
+        """Share of won games accessed by color
+
+        Returns:
+            dict[str, float]: win rates
+        """
+        return {color: self.wins_per_color[color] / max(self.games, 1) for color in COLORS}
+
+    def win_rates_per_seat(self) -> dict[int, float]:
+        """Share of won games accessed by seat
+
+        Returns:
+            dict[int, float]: win rates
+        """
+        return {seat: self.wins_per_seat[seat] / max(self.games, 1)
+                for seat in range(len(COLORS))}
+
+
+def game_seed(seed: int, game_index: int) -> str:
+    """Seed of one game inside of a simulation
+
+    play_game(size, dice_stream=DiceStream(seed=game_seed(seed, game_index)))
+    replays the game exactly (with the same strategies)
+
+    Args:
+        seed (int): seed of the whole simulation
+        game_index (int): index of the game inside of the simulation
+
+    Returns:
+        str: seed of the game
+    """
+    return f"{seed}-{game_index}"
+
+
+def simulate_games(size: str, strategies: Optional[dict[str, Union[str, Strategy]]],
+                   seed: int, game_indices: range) -> SimulationResult:
+    """Plays a chunk of headless games, every game gets its own seed
+
+    Args:
+        size (str): size of game board. look into SIZES for sizes
+        strategies (Optional[dict[str, Union[str, Strategy]]]): strategy or name
+                                                                of a registered strategy
+                                                                accessed by color
+        seed (int): seed of the whole simulation
+        game_indices (range): indices of the games inside of the simulation
+
+    Returns:
+        SimulationResult: aggregated outcome of the games
+    """
+    result = SimulationResult()
+    for game_index in game_indices:
+        result.add(play_game(size, strategies=strategies,
+                             dice_stream=DiceStream(seed=game_seed(seed, game_index))))
+    return result
+
+
+def simulate(n_games: int, size: str = "medium",
+             strategies: Optional[dict[str, Union[str, Strategy]]] = None,
+             seed: int = 0, workers: Optional[int] = None) -> SimulationResult:
+    """Plays many headless games in parallel processes
+
+    Every game is seeded by its index, so the result only depends
+    on the seed and not on the amount of workers
+
+    Args:
+        n_games (int): amount of games
+        size (str, optional): size of game board. look into SIZES for sizes. Defaults to "medium".
+        strategies (Optional[dict[str, Union[str, Strategy]]], optional):
+            strategy or name of a registered strategy accessed by color,
+            has to be picklable. Defaults to None.
+        seed (int, optional): seed of the simulation. Defaults to 0.
+        workers (Optional[int], optional): amount of processes,
+                                           None for one per CPU. Defaults to None.
+
+    Returns:
+        SimulationResult: aggregated outcome of all games
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1:
+        return simulate_games(size, strategies, seed, range(n_games))
+
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunk_size = max(1, n_games // (workers * 8))
+    chunks = [range(start, min(start + chunk_size, n_games))
+              for start in range(0, n_games, chunk_size)]
+    result = SimulationResult()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_result in executor.map(partial(simulate_games, size, strategies, seed),
+                                         chunks):
+            result.merge(chunk_result)
+    return result
+
+
+############################## End of simulation ###############################
+
 
 def main() -> None:
     """pylint shut up"""
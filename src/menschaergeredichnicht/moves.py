@@ -0,0 +1,194 @@
+"""This module generates and applies moves on a GameState
+
+The rules are the same as in main.make_a_move, just without side effects:
+- a player without playable game pieces gets one out, if allowed to,
+  and moves it right away
+- otherwise every game piece that doesn't overshoot the goal
+  and doesn't land on an own game piece can move
+  (checked on the occupancy bitmask of the color, look into bitboard)
+- game pieces of other colors on the entered fields get hit
+- a 6 lets the player roll again
+
+Classes:
+    Move
+
+Functions:
+    legal_moves(state: GameState, roll: int, permission: bool = False) -> list[Move]
+    apply(state: GameState, move: Move) -> GameState
+    skip(state: GameState, roll: int) -> GameState
+    winner(state: GameState) -> Optional[int]
+    greedy_move(moves: list[Move]) -> Move
+"""
+
+from typing import NamedTuple, Optional
+
+from bitboard import color_mask, lands_on_own, last_playable
+from game_board import COLORS, FIELD_PATHS, TRACK_LENGTH
+from game_piece import GOAL, HOME, LAST_STEP
+from state import PIECES_PER_COLOR, GameState
+
+PERMISSION_CHANCE = 1 - (5/6)**3
+"""Chance of main.get_permission rolling a 6 in three throws"""
+
+HIT_CODES: tuple[tuple[tuple[tuple[int, int], ...], ...], ...] = tuple(
+    tuple(tuple((color_idx*PIECES_PER_COLOR,
+                 (field - color_idx*TRACK_LENGTH//len(COLORS)) % TRACK_LENGTH + 1)
+                for color_idx in range(len(COLORS)) if color_idx != turn)
+          for field in range(TRACK_LENGTH))
+    for turn in range(len(COLORS)))
+"""Offset in GameState.positions and encoded steps of the game pieces of the other colors
+on a field of the track, accessed by the index of the moving color and the field"""
+
+
+class Move(NamedTuple):
+    """A move of the color that has to move
+
+    Attributes:
+        piece (int): index of the game piece inside of its color
+        start (int): steps before the move, HOME if the game piece gets out
+        end (int): steps after the move
+        roll (int): rolled number
+    """
+    piece: int
+    start: int
+    end: int
+    roll: int
+
+
+def legal_moves(state: GameState, roll: int, permission: bool = False) -> list[Move]:
+    """All moves the color that has to move can make
+
+    Args:
+        state (GameState): state of the game
+        roll (int): rolled number
+        permission (bool, optional): result of main.get_permission,
+                                     only matters without playable game pieces.
+                                     Defaults to False.
+
+    Returns:
+        list[Move]: all legal moves, empty if the player can't move
+    """
+    offset = state.turn * PIECES_PER_COLOR
+    steps = [position - 1 for position in state.positions[offset:offset + PIECES_PER_COLOR]]
+    own = color_mask(state.positions, state.turn)
+
+    # game pieces from the most inner goal position outwards without a gap are done
+    playable_up_to = last_playable(own)
+
+    moves: list[Move] = []
+    for piece, start in enumerate(steps):
+        if start == HOME or start > playable_up_to:
+            continue
+        end = start + roll
+        if end <= LAST_STEP and not lands_on_own(own, end):
+            moves.append(Move(piece, start, end, roll))
+
+    if not moves and permission and HOME in steps:
+        # no bit of a playable game piece is set
+        if not own & ((2 << playable_up_to) - 1):
+            moves.append(Move(steps.index(HOME), HOME, roll, roll))
+    return moves
+
+
+def _hit(positions: bytearray, turn: int, field: int) -> None:
+    """Sends game pieces of other colors on a field home
+
+    Args:
+        positions (bytearray): encoded steps of all game pieces
+        turn (int): index of the color that entered the field
+        field (int): field on the track
+    """
+    for offset, code in HIT_CODES[turn][field]:
+        slot = positions.find(code, offset, offset + PIECES_PER_COLOR)
+        if slot != -1:
+            positions[slot] = HOME + 1
+
+
+def apply(state: GameState, move: Move) -> GameState:
+    """Makes a move
+
+    Args:
+        state (GameState): state of the game
+        move (Move): legal move of the color that has to move
+
+    Returns:
+        GameState: state after the move, the same color moves again after a 6
+    """
+    turn = state.turn
+    positions = bytearray(state.positions)
+    positions[turn*PIECES_PER_COLOR + move.piece] = move.end + 1
+    path = FIELD_PATHS[turn]
+    if move.start == HOME:
+        _hit(positions, turn, path[0])
+    if move.end < GOAL:
+        _hit(positions, turn, path[move.end])
+    return GameState(bytes(positions), turn if move.roll == 6 else (turn + 1) % len(COLORS))
+
+
+def skip(state: GameState, roll: int) -> GameState:
+    """Passes on the turn if the player can't move
+
+    Args:
+        state (GameState): state of the game
+        roll (int): rolled number
+
+    Returns:
+        GameState: state after the roll, the same color rolls again after a 6
+    """
+    if roll == 6:
+        return state
+    return GameState(state.positions, (state.turn + 1) % len(COLORS))
+
+
+def winner(state: GameState) -> Optional[int]:
+    """Checks if a color has won
+
+    Args:
+        state (GameState): state of the game
+
+    Returns:
+        Optional[int]: index of the color that has won, None if no one has won yet
+    """
+    positions = state.positions
+    for color_idx in range(len(COLORS)):
+        offset = color_idx * PIECES_PER_COLOR
+        if min(positions[offset:offset + PIECES_PER_COLOR]) > GOAL:
+            return color_idx
+    return None
+
+
+def greedy_move(moves: list[Move]) -> Move:
+    """Default behaviour of Player.pick_game_piece in terms of moves
+
+    Args:
+        moves (list[Move]): legal moves, not empty
+
+    Returns:
+        Move: the picked move
+    """
+    roll = moves[0].roll
+    if roll < 4:
+        for move in moves:
+            if GOAL <= move.start <= LAST_STEP - roll:
+                return move
+
+    pick = moves[0]
+    for move in moves:
+        if move.start > pick.start:
+            pick = move
+    return pick
+
+
+def main() -> None:
+    """For testing and debugging purposes"""
+    state = GameState.initial()
+    print(legal_moves(state, 4))
+    moves = legal_moves(state, 4, permission=True)
+    print(moves)
+    state = apply(state, moves[0])
+    print(state, legal_moves(state, 6), winner(state))
+    print(skip(state, 3))
+
+
+if __name__ == "__main__":
+    main()
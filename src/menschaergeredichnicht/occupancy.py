@@ -0,0 +1,120 @@
+"""This module keeps track of which game pieces stand on which field
+
+Classes:
+    OccupancyIndex
+"""
+
+from game_board import COLORS, PATH_LENGTH, TRACK_LENGTH
+from game_piece import GamePiece
+
+FIELD_COUNT = TRACK_LENGTH + len(COLORS) * (PATH_LENGTH - TRACK_LENGTH)
+"""Amount of fields on the board, track and goal positions of all colors"""
+
+
+class OccupancyIndex:
+    """Maps every field to the game pieces on it
+
+    The index observes the game pieces like a renderer
+    and gets updated on every move, get out and reset,
+    so checking a field is a single lookup instead of a scan over all game pieces.
+    Right after a move a field can hold the moved game piece
+    and the game piece that is about to get hit
+
+    Attributes:
+        occupants (list[list[GamePiece]]): game pieces accessed by field
+                                           (look into FIELD_PATHS)
+        fields (dict[int, int]): field accessed by id of the game piece, -1 if at home
+
+    Methods:
+        __init__(self) -> None
+        attach(self, game_piece: GamePiece) -> None
+        at(self, field: int) -> list[GamePiece]
+        on_move(self, game_piece: GamePiece, steps: int) -> None
+        on_get_out(self, game_piece: GamePiece) -> None
+        on_reset(self, game_piece: GamePiece) -> None
+    """
+
+    __slots__ = ("occupants", "fields")
+
+    def __init__(self) -> None:
+        """Initializing attributes"""
+        self.occupants: list[list[GamePiece]] = [[] for _ in range(FIELD_COUNT)]
+        self.fields: dict[int, int] = {}
+
+    def attach(self, game_piece: GamePiece) -> None:
+        """Adds a game piece to the index and starts observing it
+
+        Args:
+            game_piece (GamePiece): game piece that gets tracked
+        """
+        field = game_piece.get_field()
+        self.fields[id(game_piece)] = field
+        if field != -1:
+            self.occupants[field].append(game_piece)
+        game_piece.observers.append(self)
+
+    def at(self, field: int) -> list[GamePiece]:
+        """Getter for the game pieces on a field
+
+        Args:
+            field (int): field on the board (look into FIELD_PATHS)
+
+        Returns:
+            list[GamePiece]: game pieces on the field, don't modify it
+        """
+        return self.occupants[field]
+
+    def _update(self, game_piece: GamePiece) -> None:
+        """Moves a game piece from its old field to its current one
+
+        Args:
+            game_piece (GamePiece): game piece that changed its position
+        """
+        old_field = self.fields[id(game_piece)]
+        if old_field != -1:
+            self.occupants[old_field].remove(game_piece)
+        new_field = game_piece.get_field()
+        self.fields[id(game_piece)] = new_field
+        if new_field != -1:
+            self.occupants[new_field].append(game_piece)
+
+    # pylint: disable-next=unused-argument
+    def on_move(self, game_piece: GamePiece, steps: int) -> None:
+        """Updates the index after a game piece moved
+
+        Args:
+            game_piece (GamePiece): game piece that moved
+            steps (int): number of steps the game piece went
+        """
+        self._update(game_piece)
+
+    def on_get_out(self, game_piece: GamePiece) -> None:
+        """Updates the index after a game piece got out
+
+        Args:
+            game_piece (GamePiece): game piece that got out
+        """
+        self._update(game_piece)
+
+    def on_reset(self, game_piece: GamePiece) -> None:
+        """Updates the index after a game piece got kicked out
+
+        Args:
+            game_piece (GamePiece): game piece that got kicked out
+        """
+        self._update(game_piece)
+
+
+def main() -> None:
+    """For testing and debugging purposes"""
+    occupancy = OccupancyIndex()
+    game_piece = GamePiece("medium", "green", (0, 0))
+    occupancy.attach(game_piece)
+    game_piece.get_out().move(3)
+    print(occupancy.at(game_piece.get_field()))
+    game_piece.reset()
+    print(occupancy.fields)
+
+
+if __name__ == "__main__":
+    main()
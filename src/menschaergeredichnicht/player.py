@@ -4,11 +4,17 @@ Classes:
     Player
 """
 
-from itertools import chain, product
-from typing import Optional
+from typing import Callable, Optional
 
-from game_board import goal_positions, home_positions, two_vertices_fore_goal
+from game_board import home_positions
 from game_piece import GamePiece
+from moves import Move
+from occupancy import OccupancyIndex
+from state import GameState
+
+Strategy = Callable[[GameState, list[Move]], Move]
+"""Picks one of the legal moves (second argument) in the state of the game (first argument),
+look into strategies for the built-in ones"""
 
 
 class Player:
@@ -18,29 +24,51 @@ class Player:
         color (str): color of the player
         game_pieces (list[GamePiece]): all game pieces of the same color
                                        assigned to a player
+        strategy (Optional[Strategy]): picks the game piece for a move,
+                                       None for the default behaviour
+        occupancy (Optional[OccupancyIndex]): index of the fields of all game pieces,
+                                              None to compare with every game piece
 
     Methods:
-        __init__(self, *, board_size: str, color: str, game_pieces: list[GamePiece]) -> None
+        __init__(self, *, board_size: str, color: str, game_pieces: list[GamePiece],
+                 strategy: Optional[Strategy] = None,
+                 occupancy: Optional[OccupancyIndex] = None) -> None
         __bool__(self) -> bool
         __repr__(self) -> str
         get_valid_game_pieces(self, steps: int) -> list[GamePiece]
-        pick_game_piece(self, steps: int) -> GamePiece
-        move(self, steps: int) -> Optional[GamePiece]
+        pick_game_piece(self, steps: int, state: Optional[GameState] = None) -> GamePiece
+        choose_game_piece(self, game_pieces: list[GamePiece], steps: int,
+                          state: Optional[GameState] = None) -> Optional[GamePiece]
+        move(self, steps: int, state: Optional[GameState] = None) -> Optional[GamePiece]
+        move_game_piece(self, game_piece: Optional[GamePiece], steps: int
+                        ) -> Optional[GamePiece]
         check_if_done(self) -> None
         place_game_piece_on_start(self) -> Optional[GamePiece]
     """
 
-    def __init__(self, *, board_size: str, color: str, game_pieces: list[GamePiece]) -> None:
+    __slots__ = ("board_size", "color", "game_pieces", "strategy", "occupancy")
+
+    def __init__(self, *, board_size: str, color: str, game_pieces: list[GamePiece],
+                 strategy: Optional[Strategy] = None,
+                 occupancy: Optional[OccupancyIndex] = None) -> None:
         """Initializing attributes
 
         Args:
             board_size (str): size of game board. look into SIZES for sizes
             color (str): color of player
             game_pieces (list[GamePiece]): game pieces that belong to player
+            strategy (Optional[Strategy], optional): picks the game piece for a move,
+                                                     None for the default behaviour.
+                                                     Defaults to None.
+            occupancy (Optional[OccupancyIndex], optional): index of the fields
+                                                            of all game pieces.
+                                                            Defaults to None.
         """
         self.board_size = board_size
         self.color = color
         self.game_pieces = game_pieces
+        self.strategy = strategy
+        self.occupancy = occupancy
 
     def __bool__(self) -> bool:
         """Existence of a player should be treated as True"""
@@ -85,29 +113,29 @@ class Player:
         valid_game_pieces: list[GamePiece] = []
 
         for game_piece in self.game_pieces:
-            gp_pos = game_piece.get_pos()
             # filter of game piece being done or at home
             if game_piece.is_done or game_piece.in_home():
                 continue
 
             # filter of having enough steps before goal
-            invalid_fore_goal = False
-            for idx, pos in enumerate(chain(goal_positions(self.board_size)[self.color],
-                                            two_vertices_fore_goal(self.board_size)[self.color])):
-                if pos != gp_pos:
-                    continue
-                if idx < steps:
-                    invalid_fore_goal = True
-                    break
-            if invalid_fore_goal:
+            future_pos = game_piece.get_future_pos(steps)
+            if future_pos == -1:
                 continue
 
             # filter of player hitting own game pieces
+            if self.occupancy is not None:
+                for other_game_piece in self.occupancy.at(future_pos):
+                    if other_game_piece.color == self.color:
+                        break
+                else:
+                    valid_game_pieces.append(game_piece)
+                continue
+
             invalid_hitting_self = False
             for other_game_piece in self.game_pieces:
                 if game_piece is other_game_piece:
                     continue
-                if game_piece.get_future_pos(steps) == other_game_piece.get_pos():
+                if future_pos == other_game_piece.get_field():
                     invalid_hitting_self = True
                     break
             if invalid_hitting_self:
@@ -117,22 +145,45 @@ class Player:
 
         return valid_game_pieces
 
-    def pick_game_piece(self, steps: int) -> Optional[GamePiece]:
+    def pick_game_piece(self, steps: int,
+                        state: Optional[GameState] = None) -> Optional[GamePiece]:
         """Gets all the valid game pieces and picks a final game piece
 
-        Deciding mechanisms can be implemented here
+        Deciding mechanisms can be implemented here or passed in as strategy
 
         Args:
             steps (int): amount of steps the game piece goes
+            state (Optional[GameState], optional): state of the game, needed by a strategy.
+                                                   Defaults to None.
+
+        Returns:
+            GamePiece | None: game piece that gets finally picked for the move
+                              or None if no game pieces are available
+        """
+        return self.choose_game_piece(self.get_valid_game_pieces(steps), steps, state)
+
+    def choose_game_piece(self, game_pieces: list[GamePiece], steps: int,
+                          state: Optional[GameState] = None) -> Optional[GamePiece]:
+        """Picks one of the valid game pieces
+
+        Args:
+            game_pieces (list[GamePiece]): valid game pieces (look into get_valid_game_pieces)
+            steps (int): amount of steps the game piece goes
+            state (Optional[GameState], optional): state of the game, needed by a strategy.
+                                                   Defaults to None.
 
         Returns:
             GamePiece | None: game piece that gets finally picked for the move
                               or None if no game pieces are available
         """
-        game_pieces = self.get_valid_game_pieces(steps)
         if not game_pieces:
             return None
 
+        if self.strategy is not None:
+            moves = [Move(self.game_pieces.index(game_piece), game_piece.steps,
+                          game_piece.steps + steps, steps) for game_piece in game_pieces]
+            return self.game_pieces[self.strategy(state, moves).piece]
+
         if steps < 4:
             for game_piece in game_pieces:
                 if game_piece.in_goal() >= steps:
@@ -144,7 +195,7 @@ class Player:
                 pick = game_piece
         return pick
 
-    def move(self, steps: int) -> Optional[GamePiece]:
+    def move(self, steps: int, state: Optional[GameState] = None) -> Optional[GamePiece]:
         """Makes the move for a player
 
         First is there even a game piece.
@@ -152,18 +203,32 @@ class Player:
 
         Args:
             steps (int): amount of steps the game piece goes
+            state (Optional[GameState], optional): state of the game, needed by a strategy.
+                                                   Defaults to None.
 
         Returns:
             GamePiece | None: game piece that got the move,
                               used to handle rules of the game
                               or None if no game pieces are available
         """
-        current_game_piece = self.pick_game_piece(steps)
-        if not current_game_piece:
+        return self.move_game_piece(self.pick_game_piece(steps, state), steps)
+
+    def move_game_piece(self, game_piece: Optional[GamePiece],
+                        steps: int) -> Optional[GamePiece]:
+        """Moves a picked game piece and handles the done situation if in goal
+
+        Args:
+            game_piece (Optional[GamePiece]): picked game piece, None if there's none
+            steps (int): amount of steps the game piece goes
+
+        Returns:
+            GamePiece | None: game piece that got the move or None if there's none
+        """
+        if not game_piece:
             return
-        current_game_piece = current_game_piece.move(steps)
+        current_game_piece = game_piece.move(steps)
 
-        if current_game_piece.in_goal():
+        if current_game_piece.in_goal() != -1:
             self.check_if_done()
 
         return current_game_piece
@@ -171,28 +236,15 @@ class Player:
     def check_if_done(self) -> None:
         """Checks the situation on the goal positions and marks done if needed
 
-        First is it already done.
-        Second is it on goal, if yes where.
-        Third mark as done if it meets conditions
+        Goal positions are filled from the most inner one outwards,
+        every game piece on a goal position without a gap
+        to the most inner one is done
         """
-        break_counter = 0
-        for idx, (goal_pos, game_piece) in enumerate(product(goal_positions(self.board_size)[self.color], self.game_pieces)):
-            # print(game_piece.get_pos() == goal_pos)
-            if game_piece.get_pos() == goal_pos:
-                game_piece.is_done = True
-                break_counter = 0
-                continue
-
-            break_counter += 1
-
-            # print(f"{break_counter = }")
-            if break_counter == 4:
+        goal_indices = {game_piece.in_goal(): game_piece for game_piece in self.game_pieces}
+        for goal_index in range(4):
+            if goal_index not in goal_indices:
                 break
-
-            # print((idx + 1) % 4)
-            if (idx + 1) % 4 == 0:
-                # print("Inside of idx modulo 4")
-                break_counter = 0
+            goal_indices[goal_index].is_done = True
 
     def place_game_piece_on_start(self) -> Optional[GamePiece]:
         """Puts a game piece of the assigned color on the starting vertex"""
@@ -216,8 +268,6 @@ def main() -> None:
                                             color1,
                                             home_positions(size)[color1][i])
                                             for i in range(4)])
-    for game_piece in player1.game_pieces:
-        game_piece.turtle.goto(game_piece.home_position)
     print(player1)
     print(bool(player1))  # True
     print(not player1)  # False
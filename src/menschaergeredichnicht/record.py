@@ -0,0 +1,450 @@
+"""This module records games as compact move logs and replays them
+
+A game is fully described by its starting color, its rolls and
+the game pieces that moved, so a record stores one byte per roll:
+the rolled number in the lower 3 bits and the index of the moved
+game piece + 1 (0 if nothing moved) in the bits above.
+Whether a game piece got out follows from the rules,
+so the rolls for the permission aren't stored
+
+Records get written one after another into a binary file behind a short header,
+every record starts with the kind and the length of the seed,
+the index of the starting color and the amount of rolls.
+Reading is streaming, so archives of millions of games never have to fit into memory
+
+Classes:
+    GameRecord
+    GameRecorder
+    RecordWriter
+
+Functions:
+    read_records(file: BinaryIO) -> Iterator[GameRecord]
+    record_game(size: str = "medium", seed=None, *,
+                strategies: Optional[dict[str, Union[str, Strategy]]] = None,
+                starting_color: Optional[str] = None) -> tuple[GameResult, GameRecord]
+    record_games(file: BinaryIO, n_games: int, *, size: str = "medium", seed: int = 0,
+                 strategies: Optional[dict[str, Union[str, Strategy]]] = None) -> int
+    iter_states(record: GameRecord) -> Iterator[GameState]
+    replay(record: GameRecord, rolls: Optional[int] = None) -> GameState
+    replay_game(record: GameRecord, size: str = "medium", *,
+                renderer: Optional[TurtleRenderer] = None) -> GameResult
+"""
+
+import struct
+from itertools import islice
+from typing import TYPE_CHECKING, BinaryIO, Iterator, NamedTuple, Optional, Union
+
+from game_board import COLOR_INDICES, COLORS
+from game_piece import GamePiece
+from main import GameResult, game_seed, play_game
+from moves import Move, apply, legal_moves, skip
+from player import Strategy
+from state import GameState
+from tools import DiceStream
+
+if TYPE_CHECKING:
+    from renderer import TurtleRenderer
+
+MAGIC = b"MADN\x02"
+"""Header of a file of records, the last byte is the version of the format"""
+RECORD_HEADER = struct.Struct("<BBBI")
+"""Kind of the seed (one of SEED_KINDS), length of the seed, index of the starting color
+and amount of rolls of a record"""
+SEED_KINDS = (type(None), int, str)
+"""Types of seeds a record keeps, Random gives other rolls for 7 than for "7",
+so int seeds must not come back as str"""
+MAX_SEED_LENGTH = 0xFF
+"""Maximum length of the encoded seed of a record"""
+PIECE_SHIFT = 3
+"""Position of the index of the moved game piece inside of a byte of a record"""
+ROLL_MASK = (1 << PIECE_SHIFT) - 1
+"""Bits of the rolled number inside of a byte of a record"""
+
+
+class GameRecord(NamedTuple):
+    """Move log of one game
+
+    Attributes:
+        seed (Optional[Union[int, str]]): seed of the dice, replays only need the rolls
+                                          but DiceStream(seed=seed) plays the game again
+        starting_color (str): color of the player that started the game
+        events (bytes): rolled number and index of the moved game piece + 1 of every roll
+
+    Methods:
+        rolls(self) -> bytes
+        pieces(self) -> tuple[Optional[int], ...]
+    """
+    seed: Optional[Union[int, str]]
+    starting_color: str
+    events: bytes
+
+    def rolls(self) -> bytes:
+        """All rolled numbers in the order of the game
+
+        Returns:
+            bytes: rolled numbers
+        """
+        return bytes(event & ROLL_MASK for event in self.events)
+
+    def pieces(self) -> tuple[Optional[int], ...]:
+        """Index of the game piece that moved after every roll
+
+        Returns:
+            tuple[Optional[int], ...]: index inside of its color, None if nothing moved
+        """
+        return tuple((event >> PIECE_SHIFT) - 1 if event >> PIECE_SHIFT else None
+                     for event in self.events)
+
+
+class GameRecorder:
+    """Writes the move log of a game while it gets played
+
+    The recorder observes the game pieces like a renderer,
+    play_game tells it about every roll
+
+    Attributes:
+        indices (dict[int, int]): index of the game piece inside of its color
+                                  accessed by id of the game piece
+        events (bytearray): rolled number and index of the moved game piece + 1 of every roll
+
+    Methods:
+        __init__(self) -> None
+        attach(self, game_piece: GamePiece) -> None
+        on_roll(self, steps: int) -> None
+        on_move(self, game_piece: GamePiece, steps: int) -> None
+        on_get_out(self, game_piece: GamePiece) -> None
+        on_reset(self, game_piece: GamePiece) -> None
+        record(self, seed, starting_color: str) -> GameRecord
+    """
+
+    __slots__ = ("indices", "events", "_attached")
+
+    def __init__(self) -> None:
+        """Initializing attributes"""
+        self.indices: dict[int, int] = {}
+        self.events = bytearray()
+        self._attached = dict.fromkeys(COLORS, 0)
+
+    def attach(self, game_piece: GamePiece) -> None:
+        """Starts observing a game piece,
+        game pieces of a color have to be attached in their order
+
+        Args:
+            game_piece (GamePiece): game piece that gets recorded
+        """
+        self.indices[id(game_piece)] = self._attached[game_piece.color]
+        self._attached[game_piece.color] += 1
+        game_piece.observers.append(self)
+
+    def on_roll(self, steps: int) -> None:
+        """Adds a roll to the log
+
+        Args:
+            steps (int): rolled number
+        """
+        self.events.append(steps)
+
+    def on_move(self, game_piece: GamePiece, steps: int) -> None:
+        """Marks the game piece that moved with the last roll
+
+        Args:
+            game_piece (GamePiece): game piece that moved
+            steps (int): number of steps the game piece went
+        """
+        self.events[-1] |= (self.indices[id(game_piece)] + 1) << PIECE_SHIFT
+
+    def on_get_out(self, game_piece: GamePiece) -> None:
+        """Getting out is always followed by a move, nothing to record
+
+        Args:
+            game_piece (GamePiece): game piece that got out
+        """
+
+    def on_reset(self, game_piece: GamePiece) -> None:
+        """Hits follow from the moves, nothing to record
+
+        Args:
+            game_piece (GamePiece): game piece that got kicked out
+        """
+
+    def record(self, seed, starting_color: str) -> GameRecord:
+        """Takes the log recorded so far
+
+        Args:
+            seed: seed of the dice, None if unknown,
+                  seeds that aren't int or str are kept as str
+            starting_color (str): color of the player that started the game
+
+        Returns:
+            GameRecord: record of the game
+        """
+        if type(seed) not in SEED_KINDS:
+            seed = str(seed)
+        return GameRecord(seed, starting_color, bytes(self.events))
+
+
+class RecordWriter:
+    """Writes records one after another into a binary file
+
+    Attributes:
+        file (BinaryIO): file opened for writing in binary mode
+        count (int): amount of written records
+
+    Methods:
+        __init__(self, file: BinaryIO) -> None
+        write(self, record: GameRecord) -> None
+    """
+
+    def __init__(self, file: BinaryIO) -> None:
+        """Initializing attributes and writing the header of the file
+
+        Args:
+            file (BinaryIO): file opened for writing in binary mode
+        """
+        self.file = file
+        self.count = 0
+        file.write(MAGIC)
+
+    def write(self, record: GameRecord) -> None:
+        """Appends a record to the file
+
+        Args:
+            record (GameRecord): record of a game
+
+        Raises:
+            ValueError: if the seed isn't None, int or str or is too long to be stored
+        """
+        if type(record.seed) not in SEED_KINDS:
+            raise ValueError(f"Seed {record.seed!r} is neither None, int nor str")
+        seed = b"" if record.seed is None else str(record.seed).encode()
+        if len(seed) > MAX_SEED_LENGTH:
+            raise ValueError(f"Seed {record.seed!r} is longer than {MAX_SEED_LENGTH} bytes")
+        self.file.write(RECORD_HEADER.pack(SEED_KINDS.index(type(record.seed)), len(seed),
+                                           COLOR_INDICES[record.starting_color],
+                                           len(record.events)))
+        self.file.write(seed)
+        self.file.write(record.events)
+        self.count += 1
+
+
+def _read_exactly(file: BinaryIO, size: int) -> bytes:
+    """Reads a given amount of bytes
+
+    Args:
+        file (BinaryIO): file opened for reading in binary mode
+        size (int): amount of bytes
+
+    Raises:
+        ValueError: if the file ends before
+
+    Returns:
+        bytes: read bytes
+    """
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("File of records is truncated")
+    return data
+
+
+def read_records(file: BinaryIO) -> Iterator[GameRecord]:
+    """Reads the records of a file one by one
+
+    Args:
+        file (BinaryIO): file opened for reading in binary mode
+
+    Raises:
+        ValueError: if the file isn't a file of records, is truncated
+                    or has an unknown kind of seed
+
+    Yields:
+        Iterator[GameRecord]: records in the order they got written
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a file of game records")
+    while header := file.read(RECORD_HEADER.size):
+        if len(header) != RECORD_HEADER.size:
+            raise ValueError("File of records is truncated")
+        seed_kind, seed_length, color_idx, n_events = RECORD_HEADER.unpack(header)
+        if seed_kind >= len(SEED_KINDS):
+            raise ValueError(f"Unknown kind of seed {seed_kind}")
+        seed = _read_exactly(file, seed_length).decode()
+        yield GameRecord(None if seed_kind == 0 else SEED_KINDS[seed_kind](seed),
+                         COLORS[color_idx], _read_exactly(file, n_events))
+
+
+def record_game(size: str = "medium", seed=None, *,
+                strategies: Optional[dict[str, Union[str, Strategy]]] = None,
+                starting_color: Optional[str] = None) -> tuple[GameResult, GameRecord]:
+    """Plays one game and records it
+
+    Args:
+        size (str, optional): size of game board. look into SIZES for sizes. Defaults to "medium".
+        seed (optional): seed of the dice, None for a random game. Defaults to None.
+        strategies (Optional[dict[str, Union[str, Strategy]]], optional):
+            strategy or name of a registered strategy accessed by color. Defaults to None.
+        starting_color (Optional[str], optional): color that starts the game,
+                                                  None for a random one. Defaults to None.
+
+    Returns:
+        tuple[GameResult, GameRecord]: outcome and record of the game
+    """
+    recorder = GameRecorder()
+    result = play_game(size, strategies=strategies, dice_stream=DiceStream(seed=seed),
+                       starting_color=starting_color, recorder=recorder)
+    return result, recorder.record(seed, result.starting_color)
+
+
+def record_games(file: BinaryIO, n_games: int, *, size: str = "medium", seed: int = 0,
+                 strategies: Optional[dict[str, Union[str, Strategy]]] = None) -> int:
+    """Plays games and writes their records into a file,
+    the seeds are the same as in main.simulate
+
+    Args:
+        file (BinaryIO): file opened for writing in binary mode
+        n_games (int): amount of games
+        size (str, optional): size of game board. look into SIZES for sizes. Defaults to "medium".
+        seed (int, optional): seed of the simulation. Defaults to 0.
+        strategies (Optional[dict[str, Union[str, Strategy]]], optional):
+            strategy or name of a registered strategy accessed by color. Defaults to None.
+
+    Returns:
+        int: amount of written records
+    """
+    writer = RecordWriter(file)
+    for game_index in range(n_games):
+        writer.write(record_game(size, game_seed(seed, game_index), strategies=strategies)[1])
+    return writer.count
+
+
+def _find_move(moves: list[Move], piece: int) -> Move:
+    """Move of a game piece
+
+    Args:
+        moves (list[Move]): legal moves
+        piece (int): index of the game piece inside of its color
+
+    Raises:
+        ValueError: if the game piece can't move
+
+    Returns:
+        Move: the move of the game piece
+    """
+    for move in moves:
+        if move.piece == piece:
+            return move
+    raise ValueError(f"Record doesn't match the rules, game piece {piece} can't move")
+
+
+def iter_states(record: GameRecord) -> Iterator[GameState]:
+    """Replays a record without turtle
+
+    Args:
+        record (GameRecord): record of a game
+
+    Raises:
+        ValueError: if the record doesn't match the rules
+
+    Yields:
+        Iterator[GameState]: state after every roll
+    """
+    state = GameState.initial(COLOR_INDICES[record.starting_color])
+    for event in record.events:
+        roll = event & ROLL_MASK
+        piece = (event >> PIECE_SHIFT) - 1
+        if piece == -1:
+            state = skip(state, roll)
+        else:
+            # without a playable game piece the moved one must have gotten out
+            state = apply(state, _find_move(legal_moves(state, roll, permission=True), piece))
+        yield state
+
+
+def replay(record: GameRecord, rolls: Optional[int] = None) -> GameState:
+    """Rebuilds a position of a recorded game
+
+    Args:
+        record (GameRecord): record of a game
+        rolls (Optional[int], optional): amount of rolls to replay, None for all of them.
+                                         Defaults to None.
+
+    Returns:
+        GameState: state after the rolls
+    """
+    state = GameState.initial(COLOR_INDICES[record.starting_color])
+    for state in islice(iter_states(record), rolls):
+        pass
+    return state
+
+
+class _ScriptedDice(DiceStream):
+    """Dice that roll given numbers, runs out after the last one"""
+
+    def __init__(self, rolls: list[int]) -> None:
+        """Initializing attributes
+
+        Args:
+            rolls (list[int]): numbers in the order they get rolled
+        """
+        super().__init__()
+        self._script = rolls[::-1]
+
+    def roll(self) -> int:
+        """Rolls the next given number
+
+        Returns:
+            int: number between 1 and 6
+        """
+        return self._script.pop()
+
+
+def replay_game(record: GameRecord, size: str = "medium", *,
+                renderer: Optional["TurtleRenderer"] = None) -> GameResult:
+    """Replays a record with the game pieces of main, so a renderer can draw it
+
+    The dice roll the recorded numbers (and a 6 for the permission when
+    a game piece got out) and every color plays the recorded game pieces
+
+    Args:
+        record (GameRecord): record of a game
+        size (str, optional): size of game board. look into SIZES for sizes. Defaults to "medium".
+        renderer (Optional[TurtleRenderer], optional): renderer that draws the game,
+                                                       None for a headless replay.
+                                                       Defaults to None.
+
+    Returns:
+        GameResult: outcome of the game
+    """
+    # play_game rolls until a turn is over and asks for the permission of every roll afterwards
+    dice: list[int] = []
+    permissions: list[int] = []
+    state = GameState.initial(COLOR_INDICES[record.starting_color])
+    for event, next_state in zip(record.events, iter_states(record)):
+        roll = event & ROLL_MASK
+        got_out = event >> PIECE_SHIFT and not legal_moves(state, roll)
+        dice.append(roll)
+        permissions.extend((6,) if got_out else (1, 1, 1))
+        if roll != 6:
+            dice.extend(permissions)
+            permissions.clear()
+        state = next_state
+
+    pieces = iter(piece for piece in record.pieces() if piece is not None)
+
+    # pylint: disable-next=unused-argument
+    def recorded_move(state: GameState, moves: list[Move]) -> Move:
+        return _find_move(moves, next(pieces))
+
+    return play_game(size, renderer=renderer,
+                     strategies=dict.fromkeys(COLORS, recorded_move),
+                     dice_stream=_ScriptedDice(dice), starting_color=record.starting_color)
+
+
+def main() -> None:
+    """For testing and debugging purposes"""
+    result, record = record_game(seed=0)
+    print(result, len(record.events))
+    print(replay(record), replay_game(record) == result)
+
+
+if __name__ == "__main__":
+    main()
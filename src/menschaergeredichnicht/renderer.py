@@ -0,0 +1,179 @@
+"""This module draws the game pieces with turtle
+
+The game itself runs headless, a renderer only observes
+the state changes of the game pieces and mirrors them on the screen.
+Turtle and tkinter only get loaded when no other turtles get passed in,
+like the in-memory ones of headless_turtle.
+In fast forward mode the turtles jump straight to their new fields and
+the screen only gets redrawn after every few turns instead of every step
+
+Classes:
+    TurtleRenderer
+
+Functions:
+    write_winner(pen, color: str) -> None
+"""
+
+from typing import Any, Callable, Optional
+
+from game_board import (BOARD_GEOMETRIES, COLOR_INDICES, GAME_PIECE_COLORS,
+                        HOME_ANGLES, SIZES, has_to_turn_left, has_to_turn_right)
+from game_piece import GamePiece
+from tools import convert_Vec2D_to_tuple
+
+
+class TurtleRenderer:
+    """Draws game pieces with one turtle each
+
+    Attributes:
+        board_size (str): size of game board. look into SIZES for sizes
+        speed (int): speed of the turtles
+        fast_forward (bool): moves turtles with a single goto and redraws only between turns
+        redraw_interval (int): amount of turns between two redraws in fast forward mode
+        turns (int): amount of turns that ended
+        turtle_factory (Callable[..., Any]): creates turtles, like turtle.Turtle
+        screen: screen the turtles are drawn on, like turtle.Screen()
+        turtles (dict[int, Any]): turtle accessed by id of the game piece
+
+    Methods:
+        __init__(self, board_size: str, *, speed: int = 3, fast_forward: bool = False,
+                 redraw_interval: int = 1,
+                 turtle_factory: Optional[Callable[..., Any]] = None, screen=None) -> None
+        attach(self, game_piece: GamePiece) -> None
+        on_move(self, game_piece: GamePiece, steps: int) -> None
+        on_get_out(self, game_piece: GamePiece) -> None
+        on_reset(self, game_piece: GamePiece) -> None
+        end_turn(self) -> None
+        draw_winner(self, color: str) -> None
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(self, board_size: str, *, speed: int = 3, fast_forward: bool = False,
+                 redraw_interval: int = 1,
+                 turtle_factory: Optional[Callable[..., Any]] = None, screen=None) -> None:
+        """Initializing attributes
+
+        Args:
+            board_size (str): size of game board. look into SIZES for sizes
+            speed (int, optional): speed of the turtles. Defaults to 3.
+            fast_forward (bool, optional): turn off the animation of the turtles.
+                                           Defaults to False.
+            redraw_interval (int, optional): amount of turns between two redraws
+                                             in fast forward mode. Defaults to 1.
+            turtle_factory (Optional[Callable[..., Any]], optional): creates turtles,
+                                                                     None for turtle.Turtle.
+                                                                     Defaults to None.
+            screen (optional): screen the turtles are drawn on,
+                               None for turtle.Screen(). Defaults to None.
+        """
+        if turtle_factory is None or screen is None:
+            # pylint: disable-next=import-outside-toplevel,no-name-in-module
+            from turtle import Screen, Turtle
+            turtle_factory = turtle_factory or Turtle
+            screen = Screen() if screen is None else screen
+        self.board_size = board_size
+        self.speed = speed
+        self.fast_forward = fast_forward
+        self.redraw_interval = redraw_interval
+        self.turns = 0
+        self.turtle_factory = turtle_factory
+        self.screen = screen
+        self.turtles: dict[int, Any] = {}
+
+    def attach(self, game_piece: GamePiece) -> None:
+        """Creates a turtle for a game piece and starts observing it
+
+        Args:
+            game_piece (GamePiece): game piece that gets drawn
+        """
+        turtle = self.turtle_factory(shape="turtle")
+        self.screen.colormode(255)
+        if self.fast_forward:
+            self.screen.tracer(0)
+        turtle.fillcolor(GAME_PIECE_COLORS[game_piece.color])
+        turtle.pencolor(255, 255, 255)
+        turtle.speed(self.speed)
+        turtle.penup()
+        turtle.seth(HOME_ANGLES[game_piece.color])
+        turtle.goto(game_piece.get_pos())
+
+        self.turtles[id(game_piece)] = turtle
+        game_piece.observers.append(self)
+
+    def on_move(self, game_piece: GamePiece, steps: int) -> None:
+        """Moves the turtle of a game piece field by field,
+        in fast forward mode straight to the new field
+
+        Args:
+            game_piece (GamePiece): game piece that moved
+            steps (int): number of steps the game piece went
+        """
+        turtle = self.turtles[id(game_piece)]
+        if self.fast_forward:
+            pos = game_piece.get_pos()
+            turtle.seth(turtle.towards(pos))
+            turtle.goto(pos)
+            return
+        dist = SIZES[self.board_size]
+        for _ in range(steps):
+            x_pos, y_pos = convert_Vec2D_to_tuple(turtle.pos())
+            if has_to_turn_left(x_pos, y_pos, self.board_size):
+                turtle.left(90)
+            if has_to_turn_right(x_pos, y_pos, self.board_size, game_piece.color):
+                turtle.right(90)
+            turtle.forward(dist)
+
+    def on_get_out(self, game_piece: GamePiece) -> None:
+        """Puts the turtle of a game piece on it's starting position
+
+        Args:
+            game_piece (GamePiece): game piece that got out
+        """
+        geometry = BOARD_GEOMETRIES[self.board_size]
+        self.turtles[id(game_piece)].goto(
+            geometry.starting_vertices[COLOR_INDICES[game_piece.color]])
+
+    def on_reset(self, game_piece: GamePiece) -> None:
+        """Puts the turtle of a game piece back home
+
+        Args:
+            game_piece (GamePiece): game piece that got kicked out
+        """
+        turtle = self.turtles[id(game_piece)]
+        turtle.goto(game_piece.home_position)
+        turtle.seth(HOME_ANGLES[game_piece.color])
+
+    def end_turn(self) -> None:
+        """Redraws the screen after every redraw_interval turns in fast forward mode"""
+        self.turns += 1
+        if self.fast_forward and self.turns % self.redraw_interval == 0:
+            self.screen.update()
+
+    def draw_winner(self, color: str) -> None:
+        """Draws winner on the game board
+
+        Args:
+            color (str): color that won
+        """
+        pen = self.turtle_factory()
+        write_winner(pen, color)
+        if self.fast_forward:
+            self.screen.update()
+
+
+def write_winner(pen, color: str) -> None:
+    """Writes the winner in the middle of the game board
+
+    Args:
+        pen: turtle that writes, gets hidden
+        color (str): color that won
+    """
+    pen.hideturtle()
+    pen.speed(0)
+    pen.pencolor(color)
+    pen.penup()
+    pen.goto(0, 100)
+    pen.write(color.upper(), move=False, align="center", font=("Arial", 150, "normal"))
+    pen.pencolor("black")
+    pen.goto(0, -300)
+    pen.write("WON", move=False, align="center", font=("Arial", 150, "normal"))
@@ -0,0 +1,332 @@
+"""This module stores the outcomes of huge amounts of games column by column
+
+A store is a directory with one raw binary file per column and a small
+JSON file with the amount of rows and the names of the strategies.
+Every column has a fixed width, so appending is writing to the end of the files
+and reading maps the files into memory with numpy.memmap without copying them.
+Aggregations walk over the mapped columns in chunks, so result sets
+with hundreds of millions of rows never have to fit into memory.
+The amount of rows only gets updated after all columns are written,
+so a crash while appending never leaves a half written row behind
+
+Columns (colors are given by their index in COLORS):
+    seed (int64): seed of the simulation
+    game (int64): index of the game inside of the simulation (look into main.game_seed)
+    starting_color (int8): color that started the game
+    winner (int8): color that won, -1 if no one has won
+    turns (int16): amount of turns that were played
+    hits (uint16, per color): amount of game pieces a color has hit
+    strategy (uint8, per color): id of the strategy a color played with
+
+Classes:
+    ResultStore
+"""
+
+import json
+import os
+from collections import Counter
+from tempfile import TemporaryDirectory
+from typing import Iterable, Iterator, Sequence
+
+import numpy as np
+
+from batch_engine import BatchResult, play_batch
+from game_board import COLOR_INDICES, COLORS
+from main import GameResult, SimulationResult
+
+COLUMNS: dict[str, tuple[str, tuple[int, ...]]] = {
+    "seed": ("<i8", ()),
+    "game": ("<i8", ()),
+    "starting_color": ("i1", ()),
+    "winner": ("i1", ()),
+    "turns": ("<i2", ()),
+    "hits": ("<u2", (len(COLORS),)),
+    "strategy": ("u1", (len(COLORS),)),
+}
+"""Data type and shape of a row accessed by the name of the column"""
+META_FILE = "meta.json"
+"""Name of the file with the amount of rows and the names of the strategies"""
+CHUNK_ROWS = 1 << 22
+"""Amount of rows aggregated at once"""
+MAX_STRATEGIES = np.iinfo(COLUMNS["strategy"][0]).max + 1
+"""Amount of strategy names the strategy column can tell apart"""
+
+
+class ResultStore:
+    """Append-only columnar storage of the outcomes of games
+
+    Attributes:
+        path (str): directory of the store
+        rows (int): amount of stored games
+        strategies (list[str]): names of the strategies accessed by their id
+
+    Methods:
+        __init__(self, path: str) -> None
+        __len__(self) -> int
+        __repr__(self) -> str
+        strategy_id(self, name: str) -> int
+        append(self, *, seed: int, game: np.ndarray, starting_color: np.ndarray,
+               winner: np.ndarray, turns: np.ndarray, hits: np.ndarray,
+               strategies: Sequence[str]) -> None
+        append_batch(self, result: BatchResult, *, seed: int,
+                     strategies: Sequence[str], first_game: int = 0) -> None
+        append_results(self, results: Iterable[GameResult], *, seed: int,
+                       strategies: Sequence[str], first_game: int = 0) -> None
+        column(self, name: str) -> np.ndarray
+        chunks(self, *names: str) -> Iterator[tuple[np.ndarray, ...]]
+        to_simulation_result(self) -> SimulationResult
+        wins_per_strategy(self) -> dict[str, tuple[int, int]]
+    """
+
+    def __init__(self, path: str) -> None:
+        """Opens a store, creates it if the directory doesn't have one
+
+        Args:
+            path (str): directory of the store
+        """
+        self.path = path
+        self.rows = 0
+        self.strategies: list[str] = []
+        meta_path = os.path.join(path, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as file:
+                meta = json.load(file)
+            self.rows = meta["rows"]
+            self.strategies = meta["strategies"]
+        else:
+            os.makedirs(path, exist_ok=True)
+            self._write_meta(self.rows, self.strategies)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __repr__(self) -> str:
+        return f"ResultStore(path={self.path!r}, rows={self.rows}, strategies={self.strategies})"
+
+    def _write_meta(self, rows: int, strategies: list[str]) -> None:
+        """Saves the amount of rows and the names of the strategies
+
+        Args:
+            rows (int): amount of games in the columns
+            strategies (list[str]): names of the strategies in the order of their ids
+        """
+        tmp_path = os.path.join(self.path, META_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"rows": rows, "strategies": strategies}, file)
+        os.replace(tmp_path, os.path.join(self.path, META_FILE))
+
+    def _column_path(self, name: str) -> str:
+        """Path of the file of a column
+
+        Args:
+            name (str): name of the column (look into COLUMNS)
+
+        Returns:
+            str: path of the file
+        """
+        return os.path.join(self.path, f"{name}.bin")
+
+    def strategy_id(self, name: str) -> int:
+        """Id of a strategy, new names get the next id
+
+        Args:
+            name (str): name of the strategy
+
+        Raises:
+            ValueError: if the store already has MAX_STRATEGIES names
+
+        Returns:
+            int: id of the strategy
+        """
+        if name not in self.strategies:
+            if len(self.strategies) >= MAX_STRATEGIES:
+                raise ValueError(f"A store can't hold more than {MAX_STRATEGIES} strategies")
+            self.strategies.append(name)
+        return self.strategies.index(name)
+
+    # pylint: disable-next=too-many-arguments
+    def append(self, *, seed: int, game: np.ndarray, starting_color: np.ndarray,
+               winner: np.ndarray, turns: np.ndarray, hits: np.ndarray,
+               strategies: Sequence[str]) -> None:
+        """Appends the outcomes of games, all of them played with the same strategies
+
+        Args:
+            seed (int): seed of the simulation
+            game (np.ndarray): index of the game inside of the simulation, shape (games,)
+            starting_color (np.ndarray): color that started the game, shape (games,)
+            winner (np.ndarray): color that won, -1 if no one has won, shape (games,)
+            turns (np.ndarray): amount of turns that were played, shape (games,)
+            hits (np.ndarray): amount of game pieces a color has hit, shape (games, colors)
+            strategies (Sequence[str]): name of the strategy of every color
+                                        in the order of COLORS
+
+        Raises:
+            ValueError: if the columns don't have the same amount of games,
+                        there isn't one strategy per color
+                        or the store would get more than MAX_STRATEGIES names
+        """
+        n_games = len(game)
+        columns = {"seed": np.full(n_games, seed),
+                   "game": game,
+                   "starting_color": starting_color,
+                   "winner": winner,
+                   "turns": turns,
+                   "hits": hits}
+        arrays = {}
+        for name, array in columns.items():
+            dtype, shape = COLUMNS[name]
+            array = np.ascontiguousarray(array, dtype=dtype)
+            if array.shape != (n_games, *shape):
+                raise ValueError(f"Column {name} has shape {array.shape}, "
+                                 f"expected {(n_games, *shape)}")
+            arrays[name] = array
+
+        if len(strategies) != len(COLORS):
+            raise ValueError(f"Got {len(strategies)} strategies, expected {len(COLORS)}")
+        # new names only get added to the store once the columns and the metadata are written
+        names = self.strategies + [name for name in dict.fromkeys(strategies)
+                                   if name not in self.strategies]
+        if len(names) > MAX_STRATEGIES:
+            raise ValueError(f"A store can't hold more than {MAX_STRATEGIES} strategies")
+        ids = [names.index(name) for name in strategies]
+        arrays["strategy"] = np.tile(np.array(ids, dtype=COLUMNS["strategy"][0]), (n_games, 1))
+
+        for name, array in arrays.items():
+            with open(self._column_path(name), "r+b" if self.rows else "wb") as file:
+                # drop what a crashed append left behind
+                file.truncate(self.rows * array.itemsize * int(np.prod(COLUMNS[name][1])))
+                file.seek(0, os.SEEK_END)
+                file.write(array.tobytes())
+        self._write_meta(self.rows + n_games, names)
+        self.rows += n_games
+        self.strategies = names
+
+    def append_batch(self, result: BatchResult, *, seed: int,
+                     strategies: Sequence[str], first_game: int = 0) -> None:
+        """Appends the outcome of a batch of batch_engine.play_batch
+
+        Args:
+            result (BatchResult): outcome of the batch
+            seed (int): seed of the batch
+            strategies (Sequence[str]): name of the strategy of every color
+            first_game (int, optional): index of the first game of the batch. Defaults to 0.
+        """
+        n_games = result.winners.size
+        self.append(seed=seed, game=np.arange(first_game, first_game + n_games),
+                    starting_color=result.starting_colors, winner=result.winners,
+                    turns=result.iterations, hits=result.hits.T, strategies=strategies)
+
+    def append_results(self, results: Iterable[GameResult], *, seed: int,
+                       strategies: Sequence[str], first_game: int = 0) -> None:
+        """Appends outcomes of main.play_game, seeded like main.simulate
+
+        Args:
+            results (Iterable[GameResult]): outcomes of the games in the order of their index
+            seed (int): seed of the simulation
+            strategies (Sequence[str]): name of the strategy of every color
+            first_game (int, optional): index of the first game. Defaults to 0.
+        """
+        results = list(results)
+        self.append(seed=seed, game=np.arange(first_game, first_game + len(results)),
+                    starting_color=[COLOR_INDICES[result.starting_color] for result in results],
+                    winner=[-1 if result.winner is None else COLOR_INDICES[result.winner]
+                            for result in results],
+                    turns=[result.iterations for result in results],
+                    hits=[[result.hits[color] for color in COLORS] for result in results],
+                    strategies=strategies)
+
+    def column(self, name: str) -> np.ndarray:
+        """Maps a column into memory without reading it
+
+        Args:
+            name (str): name of the column (look into COLUMNS)
+
+        Returns:
+            np.ndarray: read only array of shape (rows, *shape of a row)
+        """
+        dtype, shape = COLUMNS[name]
+        if not self.rows:
+            return np.empty((0, *shape), dtype=dtype)
+        return np.memmap(self._column_path(name), dtype=dtype, mode="r",
+                         shape=(self.rows, *shape))
+
+    def chunks(self, *names: str, chunk_rows: int = CHUNK_ROWS
+               ) -> Iterator[tuple[np.ndarray, ...]]:
+        """Walks over columns in chunks of rows
+
+        Args:
+            *names (str): names of the columns
+            chunk_rows (int, optional): amount of rows per chunk. Defaults to CHUNK_ROWS.
+
+        Yields:
+            Iterator[tuple[np.ndarray, ...]]: views of the columns, one chunk at a time
+        """
+        columns = [self.column(name) for name in names]
+        for start in range(0, self.rows, chunk_rows):
+            yield tuple(column[start:start + chunk_rows] for column in columns)
+
+    def to_simulation_result(self, chunk_rows: int = CHUNK_ROWS) -> SimulationResult:
+        """Aggregates all games the same way as main.simulate
+
+        Args:
+            chunk_rows (int, optional): amount of rows aggregated at once. Defaults to CHUNK_ROWS.
+
+        Returns:
+            SimulationResult: aggregated outcome
+        """
+        n_colors = len(COLORS)
+        wins_per_color = np.zeros(n_colors, dtype=np.int64)
+        wins_per_seat = np.zeros(n_colors, dtype=np.int64)
+        game_lengths = np.zeros(np.iinfo(COLUMNS["turns"][0]).max + 1, dtype=np.int64)
+        hits = np.zeros(n_colors, dtype=np.int64)
+        for starting_color, winner, turns, chunk_hits in self.chunks(
+                "starting_color", "winner", "turns", "hits", chunk_rows=chunk_rows):
+            finished = winner >= 0
+            winners = winner[finished]
+            wins_per_color += np.bincount(winners, minlength=n_colors)
+            wins_per_seat += np.bincount((winners - starting_color[finished]) % n_colors,
+                                         minlength=n_colors)
+            game_lengths += np.bincount(turns, minlength=game_lengths.size)
+            hits += chunk_hits.sum(axis=0, dtype=np.int64)
+
+        result = SimulationResult()
+        result.games = self.rows
+        result.wins_per_color = Counter(dict(zip(COLORS, wins_per_color.tolist())))
+        result.wins_per_seat = Counter(dict(enumerate(wins_per_seat.tolist())))
+        result.game_lengths = Counter({int(turns): int(game_lengths[turns])
+                                       for turns in np.flatnonzero(game_lengths)})
+        result.hits = Counter(dict(zip(COLORS, hits.tolist())))
+        return result
+
+    def wins_per_strategy(self, chunk_rows: int = CHUNK_ROWS) -> dict[str, tuple[int, int]]:
+        """How often the strategies won
+
+        Args:
+            chunk_rows (int, optional): amount of rows aggregated at once. Defaults to CHUNK_ROWS.
+
+        Returns:
+            dict[str, tuple[int, int]]: games won and colors played accessed by strategy
+        """
+        n_strategies = len(self.strategies)
+        wins = np.zeros(n_strategies, dtype=np.int64)
+        played = np.zeros(n_strategies, dtype=np.int64)
+        for winner, strategy in self.chunks("winner", "strategy", chunk_rows=chunk_rows):
+            finished = winner >= 0
+            wins += np.bincount(strategy[finished, winner[finished]], minlength=n_strategies)
+            played += np.bincount(strategy.ravel(), minlength=n_strategies)
+        return {name: (int(wins[idx]), int(played[idx]))
+                for idx, name in enumerate(self.strategies)}
+
+
+def main() -> None:
+    """For testing and debugging purposes"""
+    with TemporaryDirectory() as tmp_dir:
+        store = ResultStore(tmp_dir)
+        for seed in range(3):
+            store.append_batch(play_batch(10_000, seed=seed), seed=seed,
+                               strategies=("greedy",) * len(COLORS))
+        print(store, store.to_simulation_result(), store.wins_per_strategy(), sep="\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+"""This module contains search based strategies that look ahead with the GameState rules
+
+Both strategies pick one of the legal moves for a roll
+and stop searching once their time budget per move is used up:
+expectimax searches the tree of rolls and moves to a growing depth,
+Monte Carlo is flat, it only keeps UCB1 statistics of the moves for the roll
+
+Classes:
+    TranspositionTable
+    ExpectimaxStrategy
+    MonteCarloStrategy
+
+Functions:
+    evaluate(state: GameState) -> tuple[float, ...]
+    rollout(state: GameState, dice_stream: DiceStream, max_moves: int) -> tuple[float, ...]
+"""
+
+from collections import OrderedDict
+from math import log, sqrt
+from time import perf_counter
+from typing import Any, Hashable, Optional
+
+from game_board import COLORS, PATH_LENGTH
+from game_piece import GOAL
+from moves import PERMISSION_CHANCE, Move, apply, greedy_move, legal_moves, skip, winner
+from state import PIECES_PER_COLOR, GameState, canonical, from_frame, to_frame
+from tools import DiceStream
+
+WIN_VALUE = 1.0
+"""Value of a won game, every heuristic value is below it"""
+GOAL_BONUS = 10
+"""Extra progress of a game piece on a goal position, it can't get hit anymore"""
+MAX_PROGRESS = PIECES_PER_COLOR * (PATH_LENGTH + GOAL_BONUS)
+"""Progress of a color with all game pieces in goal"""
+TABLE_SIZE = 1_000_000
+"""Default amount of entries of a transposition table"""
+TIME_BUDGET_MS = 50.0
+"""Default time a strategy may think about one move"""
+CHECK_INTERVAL = 16
+"""Amount of searched nodes between two checks of the clock"""
+
+
+class _OutOfTime(Exception):
+    """Raised inside of a search when the time budget is used up"""
+
+
+class TranspositionTable:
+    """Bounded cache of evaluated states, the least recently used entry gets dropped first
+
+    Attributes:
+        max_size (int): maximum amount of entries
+        entries (OrderedDict[Hashable, Any]): cached values accessed by key
+        hits (int): amount of successful lookups
+        misses (int): amount of failed lookups
+
+    Methods:
+        __init__(self, max_size: int = TABLE_SIZE) -> None
+        __len__(self) -> int
+        get(self, key: Hashable) -> Optional[Any]
+        put(self, key: Hashable, value: Any) -> None
+    """
+
+    __slots__ = ("max_size", "entries", "hits", "misses")
+
+    def __init__(self, max_size: int = TABLE_SIZE) -> None:
+        """Initializing attributes
+
+        Args:
+            max_size (int, optional): maximum amount of entries. Defaults to TABLE_SIZE.
+        """
+        self.max_size = max_size
+        self.entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Looks up a cached value
+
+        Args:
+            key (Hashable): key of the entry
+
+        Returns:
+            Optional[Any]: cached value, None if it isn't cached
+        """
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Caches a value and drops the oldest entry if the table is full
+
+        Args:
+            key (Hashable): key of the entry
+            value (Any): value that gets cached
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+
+def evaluate(state: GameState) -> tuple[float, ...]:
+    """Heuristic value of a state for every color
+
+    The progress of a color is the sum of steps of its game pieces
+    with a bonus for game pieces in goal. The value of a color is its progress
+    compared to the average progress scaled by MAX_PROGRESS,
+    a won game is worth WIN_VALUE
+
+    Args:
+        state (GameState): state of the game
+
+    Returns:
+        tuple[float, ...]: value accessed by the index of a color
+    """
+    n_colors = len(COLORS)
+    won = winner(state)
+    if won is not None:
+        return tuple(WIN_VALUE if color_idx == won else -WIN_VALUE / (n_colors - 1)
+                     for color_idx in range(n_colors))
+
+    progress = [0] * n_colors
+    for slot, position in enumerate(state.positions):
+        progress[slot // PIECES_PER_COLOR] += position + (GOAL_BONUS if position > GOAL else 0)
+    average = sum(progress) / n_colors
+    return tuple((value - average) / MAX_PROGRESS for value in progress)
+
+
+def rollout(state: GameState, dice_stream: DiceStream, max_moves: int) -> tuple[float, ...]:
+    """Plays random moves until someone has won or max_moves rolls are made
+
+    Args:
+        state (GameState): state of the game
+        dice_stream (DiceStream): dice of the rollout
+        max_moves (int): maximum amount of rolls
+
+    Returns:
+        tuple[float, ...]: value of the final state accessed by the index of a color
+    """
+    for _ in range(max_moves):
+        if winner(state) is not None:
+            break
+        roll = dice_stream.roll()
+        moves = legal_moves(state, roll, permission=any(dice_stream.roll() == 6
+                                                        for _ in range(3)))
+        state = apply(state, dice_stream.choice(moves)) if moves else skip(state, roll)
+    return evaluate(state)
+
+
+class ExpectimaxStrategy:
+    """Picks moves with an expectimax search over the rolls of the dice
+
+    Every color maximizes its own value (max-n), chance nodes average
+    over the six rolls and the permission to leave home.
+    The search deepens iteratively until the time budget is used up,
+    the move of the deepest finished search gets picked.
+    Values of searched states are kept in a transposition table between moves
+
+    Attributes:
+        time_budget_ms (float): time the search may take per move in milliseconds
+        max_depth (int): maximum amount of rolls the search looks ahead
+        table (TranspositionTable): cached values accessed by canonical state and depth
+        depth_reached (int): depth of the last finished search
+
+    Methods:
+        __init__(self, time_budget_ms: float = TIME_BUDGET_MS, *, max_depth: int = 8,
+                 table_size: int = TABLE_SIZE) -> None
+        __call__(self, state: GameState, moves: list[Move]) -> Move
+    """
+
+    def __init__(self, time_budget_ms: float = TIME_BUDGET_MS, *, max_depth: int = 8,
+                 table_size: int = TABLE_SIZE) -> None:
+        """Initializing attributes
+
+        Args:
+            time_budget_ms (float, optional): time the search may take per move
+                                              in milliseconds. Defaults to TIME_BUDGET_MS.
+            max_depth (int, optional): maximum amount of rolls the search looks ahead.
+                                       Defaults to 8.
+            table_size (int, optional): maximum amount of entries of the transposition table.
+                                        Defaults to TABLE_SIZE.
+        """
+        self.time_budget_ms = time_budget_ms
+        self.max_depth = max_depth
+        self.table = TranspositionTable(table_size)
+        self.depth_reached = 0
+        self._deadline = 0.0
+        self._nodes = 0
+
+    def __call__(self, state: GameState, moves: list[Move]) -> Move:
+        """Picks one of the legal moves
+
+        Args:
+            state (GameState): state of the game before the move
+            moves (list[Move]): legal moves for the roll, not empty
+
+        Returns:
+            Move: the picked move
+        """
+        if len(moves) == 1:
+            return moves[0]
+
+        self._deadline = perf_counter() + self.time_budget_ms / 1000
+        self._nodes = 0
+        best = greedy_move(moves)
+        for depth in range(1, self.max_depth + 1):
+            try:
+                best = self._best_move(state, moves, depth)
+            except _OutOfTime:
+                break
+            self.depth_reached = depth
+        return best
+
+    def _best_move(self, state: GameState, moves: list[Move], depth: int) -> Move:
+        """Searches all moves to a fixed depth
+
+        Args:
+            state (GameState): state of the game before the move
+            moves (list[Move]): legal moves for the roll
+            depth (int): amount of rolls to look ahead after the move
+
+        Returns:
+            Move: the move with the highest value for the moving color
+        """
+        turn = state.turn
+        return max(moves, key=lambda move: self._chance(apply(state, move), depth - 1)[turn])
+
+    def _chance(self, state: GameState, depth: int) -> tuple[float, ...]:
+        """Value of a state before the roll of the dice
+
+        Args:
+            state (GameState): state of the game
+            depth (int): amount of rolls to look ahead
+
+        Raises:
+            _OutOfTime: if the time budget is used up
+
+        Returns:
+            tuple[float, ...]: expected value accessed by the index of a color
+        """
+        if depth <= 0 or winner(state) is not None:
+            return evaluate(state)
+
+        # the table is keyed by canonical states and holds values in their frame
+        key = (canonical(state), depth)
+        cached = self.table.get(key)
+        if cached is not None:
+            return from_frame(cached, state.turn)
+
+        self._nodes += 1
+        if self._nodes % CHECK_INTERVAL == 0 and perf_counter() > self._deadline:
+            raise _OutOfTime
+
+        total = [0.0] * len(COLORS)
+        for roll in range(1, 7):
+            moves = legal_moves(state, roll)
+            entering = legal_moves(state, roll, permission=True)
+            if entering == moves:
+                outcomes = ((1.0, moves),)
+            else:
+                outcomes = ((1 - PERMISSION_CHANCE, moves), (PERMISSION_CHANCE, entering))
+            for chance, outcome_moves in outcomes:
+                value = self._decision(state, roll, outcome_moves, depth)
+                for color_idx, color_value in enumerate(value):
+                    total[color_idx] += chance * color_value / 6
+
+        value = tuple(total)
+        self.table.put(key, to_frame(value, state.turn))
+        return value
+
+    def _decision(self, state: GameState, roll: int, moves: list[Move],
+                  depth: int) -> tuple[float, ...]:
+        """Value of a state after the roll of the dice, the moving color picks its best move
+
+        Args:
+            state (GameState): state of the game
+            roll (int): rolled number
+            moves (list[Move]): legal moves for the roll
+            depth (int): amount of rolls to look ahead
+
+        Returns:
+            tuple[float, ...]: value accessed by the index of a color
+        """
+        if not moves:
+            return self._chance(skip(state, roll), depth - 1)
+        turn = state.turn
+        return max((self._chance(apply(state, move), depth - 1) for move in moves),
+                   key=lambda value: value[turn])
+
+
+class MonteCarloStrategy:
+    """Picks moves with flat Monte Carlo search on the moves for the roll
+
+    The search doesn't build a tree: only the moves for the roll get statistics.
+    They get chosen by UCB1 (a bandit over the root moves) and evaluated
+    with random rollouts until the time budget is used up,
+    the most visited move gets picked.
+    The statistics of the states after a move are kept in a transposition table,
+    so rollouts of earlier moves are reused
+
+    Attributes:
+        time_budget_ms (float): time the search may take per move in milliseconds
+        rollout_moves (int): maximum amount of rolls of a rollout
+        exploration (float): exploration constant of UCB1
+        table (TranspositionTable): visits and summed values accessed by canonical state
+                                    and the moving color relative to it
+        dice_stream (DiceStream): dice of the rollouts
+
+    Methods:
+        __init__(self, time_budget_ms: float = TIME_BUDGET_MS, *, rollout_moves: int = 80,
+                 exploration: float = 1.4, table_size: int = TABLE_SIZE,
+                 dice_stream: Optional[DiceStream] = None) -> None
+        __call__(self, state: GameState, moves: list[Move]) -> Move
+    """
+
+    def __init__(self, time_budget_ms: float = TIME_BUDGET_MS, *, rollout_moves: int = 80,
+                 exploration: float = 1.4, table_size: int = TABLE_SIZE,
+                 dice_stream: Optional[DiceStream] = None) -> None:
+        """Initializing attributes
+
+        Args:
+            time_budget_ms (float, optional): time the search may take per move
+                                              in milliseconds. Defaults to TIME_BUDGET_MS.
+            rollout_moves (int, optional): maximum amount of rolls of a rollout.
+                                           Defaults to 80.
+            exploration (float, optional): exploration constant of UCB1. Defaults to 1.4.
+            table_size (int, optional): maximum amount of entries of the transposition table.
+                                        Defaults to TABLE_SIZE.
+            dice_stream (Optional[DiceStream], optional): dice of the rollouts,
+                                                          None for a new unseeded one.
+                                                          Defaults to None.
+        """
+        self.time_budget_ms = time_budget_ms
+        self.rollout_moves = rollout_moves
+        self.exploration = exploration
+        self.table = TranspositionTable(table_size)
+        self.dice_stream = DiceStream() if dice_stream is None else dice_stream
+
+    def __call__(self, state: GameState, moves: list[Move]) -> Move:
+        """Picks one of the legal moves
+
+        Args:
+            state (GameState): state of the game before the move
+            moves (list[Move]): legal moves for the roll, not empty
+
+        Returns:
+            Move: the picked move
+        """
+        if len(moves) == 1:
+            return moves[0]
+
+        deadline = perf_counter() + self.time_budget_ms / 1000
+        turn = state.turn
+        children = [apply(state, move) for move in moves]
+        # statistics belong to the moving color, seen from the frame of the child
+        keys = [(canonical(child), (turn - child.turn) % len(COLORS)) for child in children]
+        stats = [self.table.get(key) or (0, 0.0) for key in keys]
+
+        while perf_counter() < deadline:
+            total_visits = sum(visits for visits, _ in stats) + 1
+            idx = max(range(len(moves)), key=lambda i: self._ucb(*stats[i], total_visits))
+            # values are scaled to [-1, 1], so the exploration constant fits
+            reward = rollout(children[idx], self.dice_stream, self.rollout_moves)[turn]
+            visits, value = stats[idx]
+            stats[idx] = (visits + 1, value + reward)
+
+        for key, child_stats in zip(keys, stats):
+            self.table.put(key, child_stats)
+        return moves[max(range(len(moves)), key=lambda i: stats[i][0])]
+
+    def _ucb(self, visits: int, value: float, total_visits: int) -> float:
+        """Upper confidence bound of a move
+
+        Args:
+            visits (int): amount of rollouts after the move
+            value (float): summed rewards of the rollouts
+            total_visits (int): amount of rollouts of all moves
+
+        Returns:
+            float: upper confidence bound, infinite for unvisited moves
+        """
+        if visits == 0:
+            return float("inf")
+        return value / visits + self.exploration * sqrt(log(total_visits) / visits)
+
+
+def main() -> None:
+    """For testing and debugging purposes"""
+    positions = bytearray(GameState.initial().positions)
+    positions[0:4] = bytes((10, 20, 1, 0))
+    positions[4:8] = bytes((12, 0, 0, 0))
+    state = GameState(bytes(positions), 0)
+    moves = legal_moves(state, 3)
+    print(moves)
+
+    expectimax = ExpectimaxStrategy(100)
+    print(expectimax(state, moves), expectimax.depth_reached, len(expectimax.table))
+    monte_carlo = MonteCarloStrategy(100, dice_stream=DiceStream(seed=0))
+    print(monte_carlo(state, moves), len(monte_carlo.table))
+
+
+if __name__ == "__main__":
+    main()
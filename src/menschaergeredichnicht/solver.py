@@ -0,0 +1,294 @@
+"""This module solves small configurations of the game exactly
+
+A configuration is a subset of the colors, each one playing with the same
+amount of game pieces. The other game pieces of a playing color already
+take the most inner goal positions, colors that don't play are skipped.
+All states that can be reached from the start get enumerated and
+the win probabilities and the expected amount of turns until the game ends
+are computed with value iteration over the rolls and the permission to leave home.
+States are stored canonical (look into state.canonical): rotated to the frame
+of the color that has to move and with sorted game pieces, so their values
+are accessed by colors relative to the color that has to move
+(strategies must not depend on the order of the moves)
+
+Classes:
+    Solution
+
+Functions:
+    initial_state(colors: Sequence[str], pieces: int, starting_color: str) -> GameState
+    solve(colors: Sequence[str] = ("yellow",), pieces: int = 1, *,
+          strategy: Optional[Strategy] = None, tolerance: float = TOLERANCE,
+          max_sweeps: int = MAX_SWEEPS) -> Solution
+"""
+
+from collections import deque
+from typing import Optional, Sequence
+
+from game_board import COLOR_INDICES, COLORS
+from game_piece import LAST_STEP
+from moves import PERMISSION_CHANCE, apply, legal_moves, skip, winner
+from player import Strategy
+from state import PIECES_PER_COLOR, GameState, canonical, from_frame
+from strategies import greedy_strategy
+
+TOLERANCE = 1e-12
+"""Value iteration stops when no value changes more than that in a sweep"""
+MAX_SWEEPS = 100_000
+"""Value iteration gives up after that many sweeps"""
+
+Node = tuple[GameState, tuple[int, ...]]
+"""Canonical state and the colors that play relative to the color that has to move"""
+Transition = tuple[float, int, int, int]
+"""Probability, index of the next node, rotation of its frame and amount of finished turns"""
+
+
+def _node(state: GameState, active: tuple[int, ...]) -> Node:
+    """Canonical node of a state
+
+    Args:
+        state (GameState): state of the game
+        active (tuple[int, ...]): indices of the colors that play, in the frame of the state
+
+    Returns:
+        Node: canonical state and the colors that play relative to the color that has to move
+    """
+    return canonical(state), tuple(sorted((color_idx - state.turn) % len(COLORS)
+                                          for color_idx in active))
+
+
+def initial_state(colors: Sequence[str], pieces: int, starting_color: str) -> GameState:
+    """State at the beginning of a game of a configuration
+
+    Args:
+        colors (Sequence[str]): colors that play
+        pieces (int): amount of game pieces of every color
+        starting_color (str): color that starts the game
+
+    Returns:
+        GameState: initial state
+    """
+    # game pieces that don't play take the most inner goal positions
+    goal = bytes(LAST_STEP + 1 - i for i in range(PIECES_PER_COLOR - pieces))
+    positions = bytearray(len(COLORS) * PIECES_PER_COLOR)
+    for color in colors:
+        offset = COLOR_INDICES[color] * PIECES_PER_COLOR
+        positions[offset + pieces:offset + PIECES_PER_COLOR] = goal
+    return GameState(bytes(positions), COLOR_INDICES[starting_color])
+
+
+class Solution:
+    """Exact values of all reachable states of a configuration
+
+    Attributes:
+        colors (tuple[str, ...]): colors that play
+        pieces (int): amount of game pieces of every color
+        states (list[Node]): all reachable canonical states with the colors that play
+        indices (dict[Node, int]): index of a node in states
+        win_probabilities (list[tuple[float, ...]]): chance of every color (relative to
+                                                     the color that has to move) to win
+                                                     accessed by the index of a node
+        expected_turns (list[float]): expected amount of turns until the game ends
+                                      accessed by the index of a node
+        sweeps (int): amount of sweeps of the value iteration
+
+    Methods:
+        __init__(self, colors: Sequence[str], pieces: int) -> None
+        __repr__(self) -> str
+        win_probability(self, color: str, state: Optional[GameState] = None) -> float
+        turns(self, state: Optional[GameState] = None) -> float
+    """
+
+    def __init__(self, colors: Sequence[str], pieces: int) -> None:
+        """Initializing attributes
+
+        Args:
+            colors (Sequence[str]): colors that play
+            pieces (int): amount of game pieces of every color
+        """
+        self.colors = tuple(colors)
+        self.pieces = pieces
+        self.states: list[Node] = []
+        self.indices: dict[Node, int] = {}
+        self.win_probabilities: list[tuple[float, ...]] = []
+        self.expected_turns: list[float] = []
+        self.sweeps = 0
+
+    def __repr__(self) -> str:
+        return (f"Solution(colors={self.colors}, pieces={self.pieces}, "
+                f"states={len(self.states)}, sweeps={self.sweeps}, "
+                f"win_probabilities={ {color: self.win_probability(color) for color in self.colors} }, "
+                f"expected_turns={self.turns()})")
+
+    def _lookup(self, state: Optional[GameState]) -> tuple[int, int]:
+        """Index of the node of a state, the initial state of the first color if None
+
+        Args:
+            state (Optional[GameState]): state of the game
+
+        Returns:
+            tuple[int, int]: index of the node in states and the color that has to move
+        """
+        if state is None:
+            state = initial_state(self.colors, self.pieces, self.colors[0])
+        active = tuple(COLOR_INDICES[color] for color in self.colors)
+        return self.indices[_node(state, active)], state.turn
+
+    def win_probability(self, color: str, state: Optional[GameState] = None) -> float:
+        """Chance of a color to win
+
+        Args:
+            color (str): color of the player
+            state (Optional[GameState], optional): state of the game,
+                                                   None for the start with the first color.
+                                                   Defaults to None.
+
+        Returns:
+            float: win probability
+        """
+        idx, turn = self._lookup(state)
+        return from_frame(self.win_probabilities[idx], turn)[COLOR_INDICES[color]]
+
+    def turns(self, state: Optional[GameState] = None) -> float:
+        """Expected amount of turns until the game ends
+
+        Args:
+            state (Optional[GameState], optional): state of the game,
+                                                   None for the start with the first color.
+                                                   Defaults to None.
+
+        Returns:
+            float: expected amount of turns (like GameResult.iterations)
+        """
+        return self.expected_turns[self._lookup(state)[0]]
+
+
+def _successors(state: GameState, active: tuple[int, ...],
+                strategy: Strategy) -> list[tuple[float, Node, int, int]]:
+    """All states after the next roll with their probability
+
+    Args:
+        state (GameState): canonical state of the game, nobody has won yet
+        active (tuple[int, ...]): indices of the colors that play in the frame of the state
+        strategy (Strategy): picks the moves
+
+    Returns:
+        list[tuple[float, Node, int, int]]: probability, next node, rotation
+                                            of its frame and amount of finished turns
+    """
+    successors: list[tuple[float, Node, int, int]] = []
+    for roll in range(1, 7):
+        moves = legal_moves(state, roll)
+        entering = legal_moves(state, roll, permission=True)
+        outcomes = (((1.0, moves),) if entering == moves
+                    else ((1 - PERMISSION_CHANCE, moves), (PERMISSION_CHANCE, entering)))
+        for chance, outcome_moves in outcomes:
+            next_state = apply(state, strategy(state, outcome_moves)) if outcome_moves \
+                else skip(state, roll)
+            if winner(next_state) is not None:
+                successors.append((chance / 6, _node(next_state, active), next_state.turn, 1))
+                continue
+            turn = next_state.turn
+            while turn not in active:
+                turn = (turn + 1) % len(COLORS)
+            successors.append((chance / 6, _node(GameState(next_state.positions, turn), active),
+                               turn, int(roll != 6)))
+    return successors
+
+
+def solve(colors: Sequence[str] = ("yellow",), pieces: int = 1, *,
+          strategy: Optional[Strategy] = None, tolerance: float = TOLERANCE,
+          max_sweeps: int = MAX_SWEEPS) -> Solution:
+    """Computes the exact values of a configuration
+
+    Args:
+        colors (Sequence[str], optional): colors that play. Defaults to ("yellow",).
+        pieces (int, optional): amount of game pieces of every color. Defaults to 1.
+        strategy (Optional[Strategy], optional): picks the moves of all colors,
+                                                 None for the default behaviour.
+                                                 Defaults to None.
+        tolerance (float, optional): largest change of a value in the last sweep.
+                                     Defaults to TOLERANCE.
+        max_sweeps (int, optional): maximum amount of sweeps. Defaults to MAX_SWEEPS.
+
+    Raises:
+        ValueError: if the values don't converge within max_sweeps
+
+    Returns:
+        Solution: values of all reachable states
+    """
+    if strategy is None:
+        strategy = greedy_strategy
+    active = tuple(COLOR_INDICES[color] for color in colors)
+    solution = Solution(colors, pieces)
+
+    # enumerate all reachable nodes
+    transitions: list[Optional[list[Transition]]] = []
+    # the initial states of symmetric colors share a node
+    for color in colors:
+        solution.indices.setdefault(_node(initial_state(colors, pieces, color), active),
+                                    len(solution.indices))
+    queue = deque(solution.indices)
+    while queue:
+        node = queue.popleft()
+        solution.states.append(node)
+        state, node_active = node
+        if winner(state) is not None:
+            transitions.append(None)
+            continue
+        node_transitions: list[Transition] = []
+        for chance, next_node, rotation, turns in _successors(state, node_active, strategy):
+            if next_node not in solution.indices:
+                solution.indices[next_node] = len(solution.indices)
+                queue.append(next_node)
+            node_transitions.append((chance, solution.indices[next_node], rotation, turns))
+        transitions.append(node_transitions)
+
+    # value iteration, finished games keep their values
+    n_colors = len(COLORS)
+    win_probabilities = [[0.0] * n_colors for _ in solution.states]
+    expected_turns = [0.0] * len(solution.states)
+    for idx, (state, _) in enumerate(solution.states):
+        won = winner(state)
+        if won is not None:
+            win_probabilities[idx][won] = 1.0
+
+    for sweep in range(1, max_sweeps + 1):
+        largest_change = 0.0
+        for idx, node_transitions in enumerate(transitions):
+            if node_transitions is None:
+                continue
+            probabilities = [0.0] * n_colors
+            turns = 0.0
+            for chance, next_idx, rotation, finished_turns in node_transitions:
+                # color_idx of this frame is color_idx - rotation in the frame of the next node
+                next_probabilities = win_probabilities[next_idx]
+                for color_idx in range(n_colors):
+                    probabilities[color_idx] += \
+                        chance * next_probabilities[(color_idx - rotation) % n_colors]
+                turns += chance * (finished_turns + expected_turns[next_idx])
+            largest_change = max(largest_change, abs(turns - expected_turns[idx]),
+                                 *(abs(probability - old)
+                                   for probability, old in zip(probabilities,
+                                                               win_probabilities[idx])))
+            win_probabilities[idx] = probabilities
+            expected_turns[idx] = turns
+        if largest_change < tolerance:
+            solution.sweeps = sweep
+            break
+    else:
+        raise ValueError(f"Value iteration didn't converge within {max_sweeps} sweeps")
+
+    solution.win_probabilities = [tuple(probabilities) for probabilities in win_probabilities]
+    solution.expected_turns = expected_turns
+    return solution
+
+
+def main() -> None:
+    """For testing and debugging purposes"""
+    print(solve())
+    print(solve(("yellow",), 2))
+    print(solve(("yellow", "red"), 1))
+
+
+if __name__ == "__main__":
+    main()
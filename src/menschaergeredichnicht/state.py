@@ -0,0 +1,222 @@
+"""This module represents the state of a game in a compact way
+
+A state only holds what matters for the rules: the steps of all
+16 game pieces and the color that has to move.
+It is immutable, hashable and takes less than 100 bytes,
+so tree searches and transposition tables can keep millions of them
+
+The board is four-fold rotationally symmetric and steps are counted
+from the starting vertex of every color, so a state looks the same
+from the seat of every color. canonical() rotates a state to the frame
+of the color that has to move and sorts the interchangeable game pieces,
+caches keyed by it store up to 4·24 times fewer entries
+
+Classes:
+    GameState
+
+Functions:
+    done_flags(steps: Sequence[int]) -> tuple[bool, ...]
+    canonical(state: GameState) -> GameState
+    to_frame(values: Sequence[T], turn: int) -> tuple[T, ...]
+    from_frame(values: Sequence[T], turn: int) -> tuple[T, ...]
+"""
+
+from typing import TYPE_CHECKING, NamedTuple, Sequence, TypeVar
+
+from game_board import COLOR_INDICES, COLORS
+from game_piece import GOAL, HOME, LAST_STEP
+
+if TYPE_CHECKING:
+    from player import Player
+
+PIECES_PER_COLOR = 4
+"""Amount of game pieces every color has"""
+
+T = TypeVar("T")
+
+
+def done_flags(steps: Sequence[int]) -> tuple[bool, ...]:
+    """Which game pieces of one color are done (see Player.check_if_done)
+
+    Args:
+        steps (Sequence[int]): steps of the game pieces of one color
+
+    Returns:
+        tuple[bool, ...]: true for every game piece that is done
+    """
+    # a game piece in goal is done if all goal positions inside of it are taken
+    return tuple(step >= GOAL
+                 and all(LAST_STEP - i in steps for i in range(LAST_STEP - step))
+                 for step in steps)
+
+
+class GameState(NamedTuple):
+    """Compact, immutable state of a game
+
+    positions[color_idx*4 + i] is steps + 1 of the i-th game piece of a color
+    (look into COLORS for the order), so HOME is stored as 0
+
+    Attributes:
+        positions (bytes): encoded steps of all game pieces
+        turn (int): index of the color that has to move
+
+    Methods:
+        initial(cls, turn: int = 0) -> GameState
+        from_players(cls, players: list[Player], color: str) -> GameState
+        unpack(cls, key: int) -> GameState
+        copy(self) -> GameState
+        pack(self) -> int
+        steps(self, color_idx: int) -> tuple[int, ...]
+        load_into(self, players: list[Player]) -> None
+    """
+    positions: bytes
+    turn: int
+
+    @classmethod
+    def initial(cls, turn: int = 0):
+        """State at the beginning of a game, all game pieces are home
+
+        Args:
+            turn (int, optional): index of the color that starts. Defaults to 0.
+
+        Returns:
+            GameState: initial state
+        """
+        return cls(bytes(len(COLORS) * PIECES_PER_COLOR), turn)
+
+    @classmethod
+    def from_players(cls, players: list["Player"], color: str):
+        """Takes a snapshot of the game pieces of all players
+
+        Args:
+            players (list[Player]): information of all players
+            color (str): color that has to move
+
+        Returns:
+            GameState: state of the game
+        """
+        positions = bytearray(len(COLORS) * PIECES_PER_COLOR)
+        for player in players:
+            offset = COLOR_INDICES[player.color] * PIECES_PER_COLOR
+            for i, game_piece in enumerate(player.game_pieces):
+                positions[offset + i] = game_piece.steps + 1
+        return cls(bytes(positions), COLOR_INDICES[color])
+
+    @classmethod
+    def unpack(cls, key: int):
+        """Inverse of pack
+
+        Args:
+            key (int): state packed into an integer
+
+        Returns:
+            GameState: unpacked state
+        """
+        return cls((key >> 2).to_bytes(len(COLORS) * PIECES_PER_COLOR, "little"), key & 3)
+
+    def copy(self):
+        """States are immutable, so a copy is the state itself
+
+        Returns:
+            GameState: self
+        """
+        return self
+
+    def pack(self) -> int:
+        """Packs the state into a single integer
+
+        Returns:
+            int: the packed state
+        """
+        return int.from_bytes(self.positions, "little") << 2 | self.turn
+
+    def steps(self, color_idx: int) -> tuple[int, ...]:
+        """Steps of the game pieces of one color
+
+        Args:
+            color_idx (int): index of the color in COLORS
+
+        Returns:
+            tuple[int, ...]: steps of every game piece, HOME if at home
+        """
+        offset = color_idx * PIECES_PER_COLOR
+        return tuple(position - 1
+                     for position in self.positions[offset:offset + PIECES_PER_COLOR])
+
+    def load_into(self, players: list["Player"]) -> None:
+        """Sets the game pieces of all players to this state
+
+        Observers don't get notified, a renderer has to be redrawn afterwards
+
+        Args:
+            players (list[Player]): information of all players
+        """
+        for player in players:
+            steps = self.steps(COLOR_INDICES[player.color])
+            for game_piece, step, is_done in zip(player.game_pieces, steps, done_flags(steps)):
+                game_piece.steps = step
+                game_piece.is_done = is_done
+
+
+def canonical(state: GameState) -> GameState:
+    """Rotates a state to the frame of the color that has to move
+
+    The color that has to move becomes the first color, the others follow
+    in the order of play. Game pieces of one color get sorted.
+    Values computed for the canonical state belong to colors relative
+    to the color that has to move, look into from_frame and to_frame
+
+    Args:
+        state (GameState): state of the game
+
+    Returns:
+        GameState: canonical state, the first color has to move
+    """
+    positions = state.positions
+    offset = state.turn * PIECES_PER_COLOR
+    rotated = positions[offset:] + positions[:offset]
+    return GameState(b"".join(bytes(sorted(rotated[start:start + PIECES_PER_COLOR]))
+                              for start in range(0, len(rotated), PIECES_PER_COLOR)), 0)
+
+
+def to_frame(values: Sequence[T], turn: int) -> tuple[T, ...]:
+    """Rotates values accessed by the index of a color into the frame of a color
+
+    Args:
+        values (Sequence[T]): values accessed by the index of a color in COLORS
+        turn (int): index of the color whose frame it is
+
+    Returns:
+        tuple[T, ...]: values accessed by the index relative to the color
+    """
+    return tuple(values[turn:]) + tuple(values[:turn])
+
+
+def from_frame(values: Sequence[T], turn: int) -> tuple[T, ...]:
+    """Inverse of to_frame
+
+    Args:
+        values (Sequence[T]): values accessed by the index relative to the color
+        turn (int): index of the color whose frame it is
+
+    Returns:
+        tuple[T, ...]: values accessed by the index of a color in COLORS
+    """
+    shift = -turn % len(values) if values else 0
+    return tuple(values[shift:]) + tuple(values[:shift])
+
+
+def main() -> None:
+    """For testing and debugging purposes"""
+    state = GameState.initial()
+    print(state, hash(state), state.pack())
+    positions = bytearray(state.positions)
+    positions[0:4] = bytes((HOME + 1, 5, LAST_STEP + 1, GOAL + 1))
+    state = GameState(bytes(positions), 1)
+    print(state.steps(0), done_flags(state.steps(0)))
+    print(GameState.unpack(state.pack()) == state)
+    print(canonical(state), from_frame(to_frame(COLORS, 1), 1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,471 @@
+"""This module contains the strategies that pick a move and a registry of them by name
+
+A strategy gets the state of the game and the legal moves for the roll
+and returns one of the moves (look into player.Strategy).
+A strategy can also come with a batched form for batch_engine,
+which scores the game pieces of many games at once,
+the valid game piece with the highest score gets moved.
+Batched forms need numpy and import it when they get called,
+so the scalar ones start fast and work without numpy
+
+Classes:
+    BatchState
+    StrategyEntry
+    RandomStrategy
+
+Functions:
+    greedy_strategy(state: GameState, moves: list[Move]) -> Move
+    aggressive_strategy(state: GameState, moves: list[Move]) -> Move
+    defensive_strategy(state: GameState, moves: list[Move]) -> Move
+    rush_strategy(state: GameState, moves: list[Move]) -> Move
+    greedy_scores(batch: BatchState) -> np.ndarray
+    random_scores(batch: BatchState) -> np.ndarray
+    aggressive_scores(batch: BatchState) -> np.ndarray
+    defensive_scores(batch: BatchState) -> np.ndarray
+    rush_scores(batch: BatchState) -> np.ndarray
+    register_strategy(name: str, factory: Callable[..., Strategy],
+                      batched: Optional[BatchedStrategy] = None, *,
+                      uses_dice: bool = False) -> None
+    get_strategy(name: str, **kwargs) -> Strategy
+    get_batched_strategy(name: str) -> BatchedStrategy
+    resolve_strategy(strategy: Union[str, Strategy],
+                     dice_stream: Optional[DiceStream] = None) -> Strategy
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union
+
+from bitboard import hits_opponent, opponents, threatened
+from game_board import COLORS, TRACK_LENGTH
+from game_piece import GOAL, LAST_STEP
+from moves import Move, greedy_move
+from player import Strategy
+from state import PIECES_PER_COLOR, GameState
+from tools import DiceStream
+
+if TYPE_CHECKING:
+    from search import ExpectimaxStrategy, MonteCarloStrategy
+
+PREFERRED = 100
+"""Added to the score of preferred game pieces, above every amount of steps"""
+DANGER_DISTANCE = 6
+"""Game pieces that are up to that many fields behind a field can hit it"""
+
+
+class BatchState(NamedTuple):
+    """Everything a batched strategy can look at, for all running games of a batch
+
+    Attributes:
+        steps (np.ndarray): steps of all game pieces, shape (colors*4, games)
+        current (np.ndarray): steps of the moving color's game pieces, shape (4, games)
+        turn (np.ndarray): index of the moving color, shape (games,)
+        rolls (np.ndarray): rolled numbers, shape (games,)
+        board (np.ndarray): occupant of every field of the track, 0 if empty,
+                            otherwise 1 + index of the game piece, shape (40, games)
+        rng (np.random.Generator): generator for random decisions
+    """
+    steps: Any
+    current: Any
+    turn: Any
+    rolls: Any
+    board: Any
+    rng: Any
+
+
+BatchedStrategy = Callable[[BatchState], Any]
+"""Scores the game pieces of the moving color (shape (4, games)) of all games of a batch"""
+
+
+class StrategyEntry(NamedTuple):
+    """A registered strategy
+
+    Attributes:
+        factory (Callable[..., Strategy]): creates the strategy
+        batched (Optional[BatchedStrategy]): batched form, None if there's none
+        uses_dice (bool): factory takes a dice_stream for its random decisions
+    """
+    factory: Callable[..., Strategy]
+    batched: Optional[BatchedStrategy]
+    uses_dice: bool
+
+
+STRATEGIES: dict[str, StrategyEntry] = {}
+"""Registered strategies accessed by name"""
+
+
+############################## Start of strategies #############################
+
+
+def _is_safe(others: int, move: Move) -> bool:
+    """Checks if no game piece of another color can hit the game piece after a move
+
+    Args:
+        others (int): occupancy of the other colors (look into bitboard.opponents)
+        move (Move): legal move
+
+    Returns:
+        bool: true if the move ends in goal or out of reach of other colors
+    """
+    return not threatened(others, move.end, DANGER_DISTANCE)
+
+
+def _furthest_of(moves: list[Move]) -> Move:
+    """The move of the furthest game piece, the first one on ties
+
+    Args:
+        moves (list[Move]): legal moves, not empty
+
+    Returns:
+        Move: the move of the furthest game piece
+    """
+    pick = moves[0]
+    for move in moves:
+        if move.start > pick.start:
+            pick = move
+    return pick
+
+
+# pylint: disable-next=unused-argument
+def greedy_strategy(state: GameState, moves: list[Move]) -> Move:
+    """Default behaviour of Player.pick_game_piece
+
+    Small rolls are used on game pieces that can go deeper into the goal,
+    otherwise the furthest game piece moves
+
+    Args:
+        state (GameState): state of the game
+        moves (list[Move]): legal moves, not empty
+
+    Returns:
+        Move: the picked move
+    """
+    return greedy_move(moves)
+
+
+class RandomStrategy:
+    """Picks a random move
+
+    Attributes:
+        dice_stream (DiceStream): source of the random decisions
+
+    Methods:
+        __init__(self, dice_stream: Optional[DiceStream] = None, *, seed=None) -> None
+        __call__(self, state: GameState, moves: list[Move]) -> Move
+    """
+
+    def __init__(self, dice_stream: Optional[DiceStream] = None, *, seed=None) -> None:
+        """Initializing attributes
+
+        Args:
+            dice_stream (Optional[DiceStream], optional): source of the random decisions,
+                                                          None for a new one. Defaults to None.
+            seed (optional): seed of the new DiceStream. Defaults to None.
+        """
+        self.dice_stream = DiceStream(seed=seed) if dice_stream is None else dice_stream
+
+    # pylint: disable-next=unused-argument
+    def __call__(self, state: GameState, moves: list[Move]) -> Move:
+        """Picks one of the legal moves
+
+        Args:
+            state (GameState): state of the game
+            moves (list[Move]): legal moves, not empty
+
+        Returns:
+            Move: the picked move
+        """
+        return self.dice_stream.choice(moves)
+
+
+def aggressive_strategy(state: GameState, moves: list[Move]) -> Move:
+    """Hits game pieces of other colors whenever possible, otherwise moves the furthest
+
+    Args:
+        state (GameState): state of the game
+        moves (list[Move]): legal moves, not empty
+
+    Returns:
+        Move: the picked move
+    """
+    others = opponents(state)
+    hitting = [move for move in moves if hits_opponent(others, move.end)]
+    return _furthest_of(hitting or moves)
+
+
+def defensive_strategy(state: GameState, moves: list[Move]) -> Move:
+    """Moves game pieces out of reach of other colors, otherwise moves the furthest
+
+    Args:
+        state (GameState): state of the game
+        moves (list[Move]): legal moves, not empty
+
+    Returns:
+        Move: the picked move
+    """
+    others = opponents(state)
+    safe = [move for move in moves if _is_safe(others, move)]
+    return _furthest_of(safe or moves)
+
+
+# pylint: disable-next=unused-argument
+def rush_strategy(state: GameState, moves: list[Move]) -> Move:
+    """Gets game pieces into goal whenever possible, otherwise moves the furthest
+
+    Args:
+        state (GameState): state of the game
+        moves (list[Move]): legal moves, not empty
+
+    Returns:
+        Move: the picked move
+    """
+    entering_goal = [move for move in moves if move.end >= GOAL]
+    return _furthest_of(entering_goal or moves)
+
+
+############################### End of strategies ##############################
+
+########################## Start of batched strategies #########################
+
+
+def _target_fields(batch: BatchState):
+    """Fields of the track the game pieces of the moving color would move to
+
+    Args:
+        batch (BatchState): all running games of a batch
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: field of every game piece and a mask
+                                       of the ones that stay on the track, shape (4, games)
+    """
+    target = batch.current + batch.rolls
+    fields = (batch.turn * (TRACK_LENGTH // len(COLORS)) + target) % TRACK_LENGTH
+    return fields, target < GOAL
+
+
+def greedy_scores(batch: BatchState):
+    """Batched form of greedy_strategy
+
+    Args:
+        batch (BatchState): all running games of a batch
+
+    Returns:
+        np.ndarray: score of the moving color's game pieces, shape (4, games)
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import numpy as np
+
+    current, rolls = batch.current, batch.rolls
+    # goal index >= roll, written as steps <= LAST_STEP - roll
+    preferred = (current >= GOAL) & (current <= LAST_STEP - rolls) & (rolls < 4)
+    return np.where(preferred, PREFERRED, current)
+
+
+def random_scores(batch: BatchState):
+    """Batched form of RandomStrategy
+
+    Args:
+        batch (BatchState): all running games of a batch
+
+    Returns:
+        np.ndarray: score of the moving color's game pieces, shape (4, games)
+    """
+    return batch.rng.random(batch.current.shape)
+
+
+def aggressive_scores(batch: BatchState):
+    """Batched form of aggressive_strategy
+
+    Args:
+        batch (BatchState): all running games of a batch
+
+    Returns:
+        np.ndarray: score of the moving color's game pieces, shape (4, games)
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import numpy as np
+
+    fields, on_track = _target_fields(batch)
+    victims = np.take_along_axis(batch.board, fields.astype(np.intp), axis=0)
+    hitting = on_track & (victims > 0) & ((victims - 1) // PIECES_PER_COLOR != batch.turn)
+    return np.where(hitting, PREFERRED, 0) + batch.current
+
+
+def defensive_scores(batch: BatchState):
+    """Batched form of defensive_strategy
+
+    Args:
+        batch (BatchState): all running games of a batch
+
+    Returns:
+        np.ndarray: score of the moving color's game pieces, shape (4, games)
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import numpy as np
+
+    fields, on_track = _target_fields(batch)
+    endangered = np.zeros(fields.shape, dtype=bool)
+    for distance in range(1, DANGER_DISTANCE + 1):
+        behind = np.take_along_axis(batch.board,
+                                    ((fields - distance) % TRACK_LENGTH).astype(np.intp), axis=0)
+        endangered |= (behind > 0) & ((behind - 1) // PIECES_PER_COLOR != batch.turn)
+    return np.where(on_track & endangered, 0, PREFERRED) + batch.current
+
+
+def rush_scores(batch: BatchState):
+    """Batched form of rush_strategy
+
+    Args:
+        batch (BatchState): all running games of a batch
+
+    Returns:
+        np.ndarray: score of the moving color's game pieces, shape (4, games)
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import numpy as np
+
+    _, on_track = _target_fields(batch)
+    return np.where(on_track, 0, PREFERRED) + batch.current
+
+
+########################### End of batched strategies ##########################
+
+############################## Start of registry ###############################
+
+
+def _expectimax_strategy(**kwargs) -> "ExpectimaxStrategy":
+    """Creates an ExpectimaxStrategy, search only gets imported when it's used
+
+    Args:
+        **kwargs: passed on to ExpectimaxStrategy
+
+    Returns:
+        ExpectimaxStrategy: the strategy
+    """
+    # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+    from search import ExpectimaxStrategy
+
+    return ExpectimaxStrategy(**kwargs)
+
+
+def _monte_carlo_strategy(dice_stream: Optional[DiceStream] = None,
+                          **kwargs) -> "MonteCarloStrategy":
+    """Creates a MonteCarloStrategy with its own dice
+
+    The rollouts run until a deadline, so the amount of rolls they use depends on timing.
+    They get a stream spawned from the dice of the game,
+    otherwise they would change the rolls of the game
+
+    Args:
+        dice_stream (Optional[DiceStream], optional): dice of the game. Defaults to None.
+        **kwargs: passed on to MonteCarloStrategy
+
+    Returns:
+        MonteCarloStrategy: the strategy
+    """
+    # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+    from search import MonteCarloStrategy
+
+    return MonteCarloStrategy(dice_stream=None if dice_stream is None else dice_stream.spawn(),
+                              **kwargs)
+
+
+def register_strategy(name: str, factory: Callable[..., Strategy],
+                      batched: Optional[BatchedStrategy] = None, *,
+                      uses_dice: bool = False) -> None:
+    """Adds a strategy to the registry
+
+    Args:
+        name (str): name of the strategy
+        factory (Callable[..., Strategy]): creates the strategy
+        batched (Optional[BatchedStrategy], optional): batched form of the strategy.
+                                                       Defaults to None.
+        uses_dice (bool, optional): factory takes a dice_stream for its random decisions.
+                                    Defaults to False.
+    """
+    STRATEGIES[name] = StrategyEntry(factory, batched, uses_dice)
+
+
+def get_strategy(name: str, **kwargs) -> Strategy:
+    """Creates a registered strategy
+
+    Args:
+        name (str): name of the strategy
+        **kwargs: passed on to the factory of the strategy
+
+    Raises:
+        ValueError: if no strategy with that name is registered
+
+    Returns:
+        Strategy: the strategy
+    """
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {name!r}, choose from {sorted(STRATEGIES)}")
+    return STRATEGIES[name].factory(**kwargs)
+
+
+def get_batched_strategy(name: str) -> BatchedStrategy:
+    """Getter for the batched form of a registered strategy
+
+    Args:
+        name (str): name of the strategy
+
+    Raises:
+        ValueError: if the strategy isn't registered or has no batched form
+
+    Returns:
+        BatchedStrategy: batched form of the strategy
+    """
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {name!r}, choose from {sorted(STRATEGIES)}")
+    batched = STRATEGIES[name].batched
+    if batched is None:
+        raise ValueError(f"Strategy {name!r} has no batched form")
+    return batched
+
+
+def resolve_strategy(strategy: Union[str, Strategy],
+                     dice_stream: Optional[DiceStream] = None) -> Strategy:
+    """Turns the name of a registered strategy into the strategy
+
+    Args:
+        strategy (Union[str, Strategy]): name of a registered strategy or a strategy
+        dice_stream (Optional[DiceStream], optional): dice of the game, strategies
+                                                      with random decisions draw from it
+                                                      or from a stream spawned from it,
+                                                      so the game stays reproducible.
+                                                      Defaults to None.
+
+    Returns:
+        Strategy: the strategy
+    """
+    if not isinstance(strategy, str):
+        return strategy
+    if dice_stream is not None and strategy in STRATEGIES and STRATEGIES[strategy].uses_dice:
+        return get_strategy(strategy, dice_stream=dice_stream)
+    return get_strategy(strategy)
+
+
+register_strategy("greedy", lambda: greedy_strategy, greedy_scores)
+register_strategy("random", RandomStrategy, random_scores, uses_dice=True)
+register_strategy("aggressive", lambda: aggressive_strategy, aggressive_scores)
+register_strategy("defensive", lambda: defensive_strategy, defensive_scores)
+register_strategy("rush", lambda: rush_strategy, rush_scores)
+register_strategy("expectimax", _expectimax_strategy)
+register_strategy("monte_carlo", _monte_carlo_strategy, uses_dice=True)
+
+############################### End of registry ################################
+
+
+def main() -> None:
+    """For testing and debugging purposes"""
+    positions = bytearray(GameState.initial().positions)
+    positions[0:4] = bytes((10, 20, 1, 0))
+    positions[4:8] = bytes((12, 0, 0, 0))
+    positions[8:12] = bytes((25, 0, 0, 0))
+    state = GameState(bytes(positions), 0)
+    moves = [Move(0, 9, 12, 3), Move(1, 19, 22, 3), Move(2, 0, 3, 3)]
+    for name in STRATEGIES:
+        print(name, get_strategy(name)(state, moves))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,26 @@
 """This module is just a collection of useful functions.
 
+Classes:
+    DiceStream
+
 Functions:
     convert_Vec2D_to_tuple(pos: Vec2D) -> tuple[float, float]
-    dice() -> int
 """
 
-from random import randint
-from turtle import Vec2D
+from random import Random
+from typing import TYPE_CHECKING, Any, Sequence
+
+if TYPE_CHECKING:
+    from turtle import Vec2D
+
+DICE_FACES = (1, 2, 3, 4, 5, 6)
+"""All numbers a dice can show"""
+DICE_BLOCK_SIZE = 1024
+"""Amount of rolls a DiceStream draws at once"""
 
 
 # pylint: disable-next=invalid-name
-def convert_Vec2D_to_tuple(pos: Vec2D) -> tuple[float, float]:
+def convert_Vec2D_to_tuple(pos: "Vec2D") -> tuple[float, float]:
     """Converting a Vec2D Vector from turtle
 
     Used for getting the position of a turtle
@@ -27,16 +37,94 @@ def convert_Vec2D_to_tuple(pos: Vec2D) -> tuple[float, float]:
     return tuple((round(i, 2) for i in pos))
 
 
-def dice() -> int:
-    """Simulates rolling a dice
+class DiceStream:
+    """Rolls dice from its own random number generator
 
-    Returns:
-        int: Random integer between 1 and 6
+    Rolls get drawn in blocks, so there's no overhead of a generator call
+    per roll, and nothing depends on the global state of the random module.
+    The same seed always gives the same rolls, so a game can be replayed
+
+    Attributes:
+        rng (Random | numpy.random.Generator): generator the rolls are drawn from
+        block_size (int): amount of rolls that are drawn at once
+
+    Methods:
+        __init__(self, rng=None, *, seed=None, block_size: int = DICE_BLOCK_SIZE) -> None
+        roll(self) -> int
+        choice(self, seq: Sequence) -> Any
+        spawn(self) -> DiceStream
     """
-    return randint(1, 6)
+
+    def __init__(self, rng=None, *, seed=None, block_size: int = DICE_BLOCK_SIZE) -> None:
+        """Initializing attributes
+
+        Args:
+            rng (Random | numpy.random.Generator, optional): generator the rolls are drawn from,
+                                                             None for a new Random.
+                                                             Defaults to None.
+            seed (optional): seed for the new Random, ignored if rng is given. Defaults to None.
+            block_size (int, optional): amount of rolls that are drawn at once.
+                                        Defaults to DICE_BLOCK_SIZE.
+        """
+        self.rng = Random(seed) if rng is None else rng
+        self.block_size = block_size
+        self._rolls: list[int] = []
+
+    def _draw_block(self) -> list[int]:
+        """Draws the next block of rolls
+
+        Returns:
+            list[int]: rolls in reversed order, so they can be popped
+        """
+        if isinstance(self.rng, Random):
+            block = self.rng.choices(DICE_FACES, k=self.block_size)
+        else:
+            block = self.rng.integers(1, 7, size=self.block_size).tolist()
+        block.reverse()
+        return block
+
+    def roll(self) -> int:
+        """Simulates rolling a dice
+
+        Returns:
+            int: Random integer between 1 and 6
+        """
+        try:
+            return self._rolls.pop()
+        except IndexError:
+            # only once per block
+            self._rolls = self._draw_block()
+            return self._rolls.pop()
+
+    def choice(self, seq: Sequence) -> Any:
+        """Picks a random element with the generator of the stream
+
+        Args:
+            seq (Sequence): elements to pick from
+
+        Returns:
+            Any: picked element
+        """
+        if isinstance(self.rng, Random):
+            return self.rng.choice(seq)
+        return seq[int(self.rng.integers(len(seq)))]
+
+    def spawn(self):
+        """Creates an independent stream seeded from this one
+
+        Drawing the seed takes one number from the generator, not a roll,
+        so the rolls of this stream don't depend on how many rolls the new one uses
+
+        Returns:
+            DiceStream: new stream with its own generator
+        """
+        if isinstance(self.rng, Random):
+            return DiceStream(seed=self.rng.getrandbits(64), block_size=self.block_size)
+        return DiceStream(seed=int(self.rng.integers(1 << 63)), block_size=self.block_size)
 
 
 if __name__ == "__main__":
+    dice_stream = DiceStream(seed=0)
     # pylint: disable-next=expression-not-assigned
-    print("Test passed") if dice() in [
-        1, 2, 3, 4, 5, 6] else print("Test failed")
+    print("Test passed") if dice_stream.roll() in DICE_FACES else print("Test failed")
+    print([dice_stream.roll() for _ in range(10)])
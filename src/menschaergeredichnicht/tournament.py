@@ -0,0 +1,305 @@
+"""This module lets strategies play against each other
+
+Two strategies share the board in a pairing, each one plays two opposite colors.
+The starting color and the colors of the strategies rotate from game to game,
+so over every 8 games both strategies sit on every seat equally often.
+Games are played in batches in parallel processes, after every batch
+the confidence interval of the win rate gets checked and
+the pairing stops as soon as it's narrow enough or decided
+
+Classes:
+    PairingResult
+
+Functions:
+    wilson_interval(successes: int, trials: int, z: float = Z_95) -> tuple[float, float]
+    sequential_z(z: float, checks: int) -> float
+    play_pairing(strategy_a: str, strategy_b: str, *, size: str = "medium", seed: int = 0,
+                 max_games: int = MAX_GAMES, min_games: int = MIN_GAMES,
+                 batch_size: int = BATCH_SIZE, half_width: float = HALF_WIDTH,
+                 z: float = Z_95, stop_when_decided: bool = False,
+                 workers: Optional[int] = None) -> PairingResult
+    round_robin(strategies: Sequence[str], **kwargs) -> list[PairingResult]
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from itertools import combinations
+from math import sqrt
+from statistics import NormalDist
+from typing import Optional, Sequence
+
+from game_board import COLORS
+from main import game_seed, play_game
+from tools import DiceStream
+
+Z_95 = 1.959964
+"""Quantile of the normal distribution for a 95 % confidence interval"""
+MAX_GAMES = 10_000
+"""Default maximum amount of games of a pairing"""
+MIN_GAMES = 200
+"""Default amount of games before a pairing can stop early"""
+BATCH_SIZE = 200
+"""Default amount of games between two checks of the confidence interval"""
+HALF_WIDTH = 0.02
+"""Default half width of the confidence interval that is narrow enough"""
+ARRANGEMENTS = 2 * len(COLORS)
+"""Amount of games until every seat and color arrangement was played once"""
+
+
+class PairingResult:
+    """Outcome of the games between two strategies
+
+    Attributes:
+        strategy_a (str): name of the first strategy
+        strategy_b (str): name of the second strategy
+        games (int): amount of games
+        wins_a (int): games won by the first strategy
+        wins_b (int): games won by the second strategy
+
+    Methods:
+        __init__(self, strategy_a: str, strategy_b: str) -> None
+        __repr__(self) -> str
+        unfinished_games(self) -> int
+        win_rate(self) -> float
+        confidence_interval(self, z: float = Z_95) -> tuple[float, float]
+    """
+
+    def __init__(self, strategy_a: str, strategy_b: str) -> None:
+        """Initializing attributes
+
+        Args:
+            strategy_a (str): name of the first strategy
+            strategy_b (str): name of the second strategy
+        """
+        self.strategy_a = strategy_a
+        self.strategy_b = strategy_b
+        self.games = 0
+        self.wins_a = 0
+        self.wins_b = 0
+
+    def __repr__(self) -> str:
+        low, high = self.confidence_interval()
+        return (f"PairingResult({self.strategy_a} vs {self.strategy_b}, games={self.games}, "
+                f"win_rate={self.win_rate():.3f}, interval=({low:.3f}, {high:.3f}))")
+
+    def unfinished_games(self) -> int:
+        """Amount of games that got cut off without a winner
+
+        Returns:
+            int: amount of unfinished games
+        """
+        return self.games - self.wins_a - self.wins_b
+
+    def win_rate(self) -> float:
+        """Share of the finished games won by the first strategy
+
+        Returns:
+            float: win rate, 0.5 if no game has finished
+        """
+        finished = self.wins_a + self.wins_b
+        return self.wins_a / finished if finished else 0.5
+
+    def confidence_interval(self, z: float = Z_95) -> tuple[float, float]:
+        """Confidence interval of the win rate of the first strategy
+
+        Args:
+            z (float, optional): quantile of the normal distribution. Defaults to Z_95.
+
+        Returns:
+            tuple[float, float]: lower and upper bound
+        """
+        return wilson_interval(self.wins_a, self.wins_a + self.wins_b, z)
+
+
+def wilson_interval(successes: int, trials: int, z: float = Z_95) -> tuple[float, float]:
+    """Wilson score interval of a binomial proportion
+
+    Args:
+        successes (int): amount of successes
+        trials (int): amount of trials
+        z (float, optional): quantile of the normal distribution. Defaults to Z_95.
+
+    Returns:
+        tuple[float, float]: lower and upper bound, (0, 1) without trials
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    rate = successes / trials
+    denominator = 1 + z**2 / trials
+    center = (rate + z**2 / (2 * trials)) / denominator
+    spread = z * sqrt(rate * (1 - rate) / trials + z**2 / (4 * trials**2)) / denominator
+    return max(0.0, center - spread), min(1.0, center + spread)
+
+
+def sequential_z(z: float, checks: int) -> float:
+    """Quantile that keeps the error rate of z over repeated checks (Bonferroni correction)
+
+    Checking the same interval after every batch gives the data many chances
+    to leave 0.5 by accident, so the error rate of z gets split over all checks
+
+    Args:
+        z (float): quantile of the normal distribution of a single check
+        checks (int): maximum amount of checks
+
+    Returns:
+        float: quantile of a single one of the checks
+    """
+    alpha = 2 * (1 - NormalDist().cdf(z))
+    return NormalDist().inv_cdf(1 - alpha / (2 * max(checks, 1)))
+
+
+def play_pairing_games(size: str, strategy_a: str, strategy_b: str, seed: int,
+                       game_indices: range) -> tuple[int, int]:
+    """Plays a chunk of games of a pairing
+
+    The game index decides the starting color and which colors
+    the strategies play, every game gets its own seed
+
+    Args:
+        size (str): size of game board. look into SIZES for sizes
+        strategy_a (str): name of the first strategy
+        strategy_b (str): name of the second strategy
+        seed (int): seed of the pairing
+        game_indices (range): indices of the games inside of the pairing
+
+    Returns:
+        tuple[int, int]: games won by the first and by the second strategy
+    """
+    wins_a = wins_b = 0
+    for game_index in game_indices:
+        colors_a = COLORS[game_index // len(COLORS) % 2::2]
+        strategies = {color: strategy_a if color in colors_a else strategy_b
+                      for color in COLORS}
+        result = play_game(size, strategies=strategies,
+                           dice_stream=DiceStream(seed=game_seed(seed, game_index)),
+                           starting_color=COLORS[game_index % len(COLORS)])
+        if result.winner is None:
+            continue
+        if result.winner in colors_a:
+            wins_a += 1
+        else:
+            wins_b += 1
+    return wins_a, wins_b
+
+
+def _play_batch(executor: Optional[Executor], workers: int, play: partial,
+                games: range) -> tuple[int, int]:
+    """Plays a batch of games, split into one chunk per worker
+
+    Args:
+        executor (Optional[Executor]): process pool, None to play inline
+        workers (int): amount of processes
+        play (partial): play_pairing_games without the game indices
+        games (range): indices of the games of the batch
+
+    Returns:
+        tuple[int, int]: games won by the first and by the second strategy
+    """
+    if executor is None:
+        return play(games)
+    chunk_size = max(1, -(-len(games) // workers))
+    chunks = [games[start:start + chunk_size] for start in range(0, len(games), chunk_size)]
+    wins = list(executor.map(play, chunks))
+    return sum(wins_a for wins_a, _ in wins), sum(wins_b for _, wins_b in wins)
+
+
+def play_pairing(strategy_a: str, strategy_b: str, *, size: str = "medium", seed: int = 0,
+                 max_games: int = MAX_GAMES, min_games: int = MIN_GAMES,
+                 batch_size: int = BATCH_SIZE, half_width: float = HALF_WIDTH,
+                 z: float = Z_95, stop_when_decided: bool = False,
+                 workers: Optional[int] = None,
+                 executor: Optional[Executor] = None) -> PairingResult:
+    """Plays games between two strategies until the win rate is known well enough
+
+    A pairing stops after max_games or, once min_games are played,
+    as soon as the confidence interval is at most 2 * half_width wide
+    or (with stop_when_decided) doesn't contain 0.5 anymore.
+    The second check can happen after every batch, so it uses
+    an interval widened for all of them (look into sequential_z).
+    Batches don't depend on the amount of workers, so neither does the result
+
+    Args:
+        strategy_a (str): name of the first strategy (look into strategies)
+        strategy_b (str): name of the second strategy
+        size (str, optional): size of game board. look into SIZES for sizes. Defaults to "medium".
+        seed (int, optional): seed of the pairing. Defaults to 0.
+        max_games (int, optional): maximum amount of games. Defaults to MAX_GAMES.
+        min_games (int, optional): amount of games before stopping early. Defaults to MIN_GAMES.
+        batch_size (int, optional): games between two checks, rounded up to a multiple
+                                    of the 8 seat arrangements. Defaults to BATCH_SIZE.
+        half_width (float, optional): half width of a narrow enough interval.
+                                      Defaults to HALF_WIDTH.
+        z (float, optional): quantile of the normal distribution. Defaults to Z_95.
+        stop_when_decided (bool, optional): stop once the widened interval excludes 0.5.
+                                            Defaults to False.
+        workers (Optional[int], optional): amount of processes, None for one per CPU.
+                                           Defaults to None.
+        executor (Optional[Executor], optional): process pool to reuse,
+                                                 None to start one. Defaults to None.
+
+    Returns:
+        PairingResult: outcome of the games
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    batch_size = -(-batch_size // ARRANGEMENTS) * ARRANGEMENTS
+    play = partial(play_pairing_games, size, strategy_a, strategy_b, seed)
+    batches = -(-max_games // batch_size)
+    decided_z = sequential_z(z, batches - max(-(-min_games // batch_size), 1) + 1)
+    result = PairingResult(strategy_a, strategy_b)
+
+    own_executor = executor is None and workers > 1
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while result.games < max_games:
+            games = range(result.games, min(result.games + batch_size, max_games))
+            wins_a, wins_b = _play_batch(executor, workers, play, games)
+            result.games += len(games)
+            result.wins_a += wins_a
+            result.wins_b += wins_b
+
+            if result.games < min_games:
+                continue
+            low, high = result.confidence_interval(z)
+            if high - low <= 2 * half_width:
+                break
+            low, high = result.confidence_interval(decided_z)
+            if stop_when_decided and not low <= 0.5 <= high:
+                break
+    finally:
+        if own_executor:
+            executor.shutdown()
+    return result
+
+
+def round_robin(strategies: Sequence[str], **kwargs) -> list[PairingResult]:
+    """Plays a pairing between every two strategies
+
+    Args:
+        strategies (Sequence[str]): names of the strategies
+        **kwargs: passed on to play_pairing
+
+    Returns:
+        list[PairingResult]: outcome of every pairing
+    """
+    workers = kwargs.pop("workers", None) or os.cpu_count() or 1
+    if workers == 1:
+        return [play_pairing(strategy_a, strategy_b, workers=1, **kwargs)
+                for strategy_a, strategy_b in combinations(strategies, 2)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [play_pairing(strategy_a, strategy_b, workers=workers, executor=executor,
+                             **kwargs)
+                for strategy_a, strategy_b in combinations(strategies, 2)]
+
+
+def main() -> None:
+    """For testing and debugging purposes"""
+    for result in round_robin(("greedy", "random", "aggressive", "defensive"),
+                              max_games=2_000, half_width=0.05):
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Shared fixtures of the tests
+
+The modules of the game import each other by their flat names,
+so their directory gets put on the path like when running them directly
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir, "src", "menschaergeredichnicht"))
+
+# pylint: disable-next=wrong-import-position
+from record import iter_states, record_game  # noqa: E402
+
+SEEDS = range(10)
+"""Seeds of the recorded games the tests run on"""
+
+
+@pytest.fixture(scope="session")
+def recorded_games():
+    """Outcome and record of a few seeded games"""
+    return [record_game("medium", seed) for seed in SEEDS]
+
+
+@pytest.fixture(scope="session")
+def recorded_states(recorded_games):
+    """State after every roll of the recorded games"""
+    return [state for _, record in recorded_games for state in iter_states(record)]
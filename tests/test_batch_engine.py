@@ -0,0 +1,55 @@
+"""NumPy batch engine against the move generator on GameState"""
+
+import numpy as np
+
+from batch_engine import play_batch, to_simulation_result
+from game_board import COLORS
+from moves import legal_moves
+from state import GameState
+
+
+class RankingSpy:
+    """Batched strategy that ranks the game pieces by random scores
+    and remembers what the engine showed it"""
+
+    def __init__(self, seed):
+        self.rng = np.random.default_rng(seed)
+        self.calls = []
+
+    def __call__(self, batch):
+        scores = self.rng.random(batch.current.shape)
+        # current is the array the engine moves the picked game piece in afterwards
+        self.calls.append((batch.steps.copy(), batch.current.copy(), batch.current,
+                           batch.turn.copy(), batch.rolls.copy(), scores))
+        return scores
+
+
+def test_moves_match_legal_moves():
+    checked = 0
+    for seed in range(5):
+        spy = RankingSpy(seed)
+        # a single game keeps its arrays until it ends
+        play_batch(1, seed=seed, strategies=spy)
+        for steps, before, after, turn, rolls, scores in spy.calls:
+            state = GameState(bytes(int(step) + 1 for step in steps[:, 0]), int(turn[0]))
+            moves = legal_moves(state, int(rolls[0]))
+            moved = np.flatnonzero(after[:, 0] != before[:, 0]).tolist()
+            if not moves:
+                assert moved == []
+                continue
+            best = max(moves, key=lambda move: scores[move.piece, 0])
+            assert moved == [best.piece]
+            assert after[best.piece, 0] == best.end
+            checked += 1
+    assert checked > 500
+
+
+def test_batches_are_seeded_and_complete():
+    result = play_batch(300, seed=1, chunk_size=128)
+    assert repr(to_simulation_result(result)) == repr(
+        to_simulation_result(play_batch(300, seed=1, chunk_size=128)))
+    won = result.winners >= 0
+    assert result.winners.shape == result.iterations.shape == (300,)
+    assert result.hits.shape == (len(COLORS), 300)
+    assert won.mean() > 0.9
+    assert ((result.starting_colors >= 0) & (result.starting_colors < len(COLORS))).all()
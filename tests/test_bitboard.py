@@ -0,0 +1,41 @@
+"""Bitboards of the occupancy against scans over the positions"""
+
+from bitboard import (color_mask, hits_opponent, lands_on_own, last_playable, opponents,
+                      threatened)
+from game_board import FIELD_PATHS, TRACK_LENGTH
+from game_piece import GOAL, LAST_STEP
+from state import PIECES_PER_COLOR
+
+
+def _scan_hits(state, end):
+    field = FIELD_PATHS[state.turn][end]
+    return any(FIELD_PATHS[slot // PIECES_PER_COLOR][position - 1] == field
+               for slot, position in enumerate(state.positions)
+               if slot // PIECES_PER_COLOR != state.turn and 0 < position <= GOAL)
+
+
+def _scan_threatened(state, end, distance):
+    fields = {FIELD_PATHS[state.turn][(end - back) % TRACK_LENGTH]
+              for back in range(1, distance + 1)}
+    return any(FIELD_PATHS[slot // PIECES_PER_COLOR][position - 1] in fields
+               for slot, position in enumerate(state.positions)
+               if slot // PIECES_PER_COLOR != state.turn and 0 < position <= GOAL)
+
+
+def test_bitboards_match_scans(recorded_states):
+    for state in recorded_states[::3]:
+        steps = state.steps(state.turn)
+        own = color_mask(state.positions, state.turn)
+        others = opponents(state)
+
+        playable = LAST_STEP
+        while playable in steps:
+            playable -= 1
+        assert last_playable(own) == playable
+
+        for end in range(LAST_STEP + 1):
+            assert lands_on_own(own, end) == (end in steps)
+        for end in range(GOAL):
+            assert hits_opponent(others, end) == _scan_hits(state, end)
+            assert threatened(others, end, 6) == _scan_threatened(state, end, 6)
+        assert not hits_opponent(others, GOAL)
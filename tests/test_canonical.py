@@ -0,0 +1,37 @@
+"""Canonical states of the rotationally symmetric seats"""
+
+from game_board import COLORS
+from state import PIECES_PER_COLOR, GameState, canonical, from_frame, to_frame
+
+
+def _rotated(state, shift):
+    """The same position with every color moved shift seats on"""
+    offset = shift * PIECES_PER_COLOR
+    # [-0:] is everything and [:-0] nothing, so no shift works as well
+    positions = state.positions[-offset:] + state.positions[:-offset]
+    return GameState(positions, (state.turn + shift) % len(COLORS))
+
+
+def test_canonical_is_idempotent_and_moves_first(recorded_states):
+    for state in recorded_states[::7]:
+        key = canonical(state)
+        assert key.turn == 0
+        assert canonical(key) == key
+
+
+def test_canonical_ignores_seats_and_piece_order(recorded_states):
+    for state in recorded_states[::7]:
+        key = canonical(state)
+        for shift in range(len(COLORS)):
+            assert canonical(_rotated(state, shift)) == key
+        shuffled = b"".join(state.positions[start:start + PIECES_PER_COLOR][::-1]
+                            for start in range(0, len(state.positions), PIECES_PER_COLOR))
+        assert canonical(GameState(shuffled, state.turn)) == key
+
+
+def test_frames_round_trip():
+    values = tuple(range(len(COLORS)))
+    for turn in range(len(COLORS)):
+        framed = to_frame(values, turn)
+        assert framed[0] == turn
+        assert from_frame(framed, turn) == values
@@ -0,0 +1,29 @@
+"""Seedable dice and the games played with them"""
+
+import numpy as np
+
+from main import play_game
+from tools import DICE_FACES, DiceStream
+
+
+def _rolls(dice_stream, amount=2000):
+    return [dice_stream.roll() for _ in range(amount)]
+
+
+def test_same_seed_same_rolls():
+    rolls = _rolls(DiceStream(seed=1))
+    assert rolls == _rolls(DiceStream(seed=1))
+    assert rolls != _rolls(DiceStream(seed=2))
+    assert set(rolls) == set(DICE_FACES)
+
+
+def test_numpy_generators_roll_as_well():
+    rolls = _rolls(DiceStream(np.random.default_rng(0), block_size=7))
+    assert rolls == _rolls(DiceStream(np.random.default_rng(0), block_size=7))
+    assert set(rolls) == set(DICE_FACES)
+
+
+def test_seeded_games_repeat():
+    for seed in range(30):
+        assert (play_game("medium", dice_stream=DiceStream(seed=seed))
+                == play_game("medium", dice_stream=DiceStream(seed=seed)))
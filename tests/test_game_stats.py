@@ -0,0 +1,50 @@
+"""Streaming statistics over game events against the outcomes of main"""
+
+import pytest
+
+from game_board import COLORS
+from game_stats import (DENIED, HIT, GameLengths, HitsPerField, PermissionLosses, WinRates,
+                        aggregate, record_events, simulate_events)
+from instrumentation import Instrumentation
+from main import game_seed, play_game, simulate
+from tools import DiceStream
+
+GAMES = 40
+SEED = 2
+
+
+def test_aggregators_match_the_simulation():
+    win_rates, lengths, hits = WinRates(), GameLengths(), HitsPerField()
+    losses = PermissionLosses()
+    aggregate(simulate_events(GAMES, seed=SEED), (win_rates, lengths, hits, losses))
+
+    expected = simulate(GAMES, seed=SEED, workers=1)
+    assert win_rates.games == GAMES
+    assert +win_rates.wins == +expected.wins_per_color
+    assert win_rates.rates() == expected.win_rates_per_color()
+    assert lengths.histogram == expected.game_lengths
+    assert sum(hits.hits) == sum(expected.hits.values())
+    assert sum(hits.frequencies()) == pytest.approx(1)
+    assert losses.turns == sum(turns * games for turns, games in expected.game_lengths.items())
+    assert 0 < losses.lost_turns < losses.turns
+
+
+def test_denied_events_match_the_instrumentation():
+    instrumentation = Instrumentation()
+    for game_index in range(GAMES):
+        play_game("medium", dice_stream=DiceStream(seed=game_seed(SEED, game_index)),
+                  instrumentation=instrumentation)
+    denied = sum(event.kind == DENIED for event in simulate_events(GAMES, seed=SEED))
+    assert denied == instrumentation.counters["denied"]
+
+
+def test_events_count_the_same_hits(recorded_games):
+    for result, record in recorded_games:
+        hits = dict.fromkeys(COLORS, 0)
+        hitter = None
+        for event in record_events(record):
+            if event.kind == HIT:
+                hits[hitter] += 1
+            elif event.color is not None:
+                hitter = event.color
+        assert hits == result.hits
@@ -0,0 +1,54 @@
+"""In-memory turtle stand-in and the renderer running on it"""
+
+import pytest
+
+from game_board import SIZES
+from headless_turtle import HeadlessScreen, HeadlessTurtle, headless_renderer
+from main import setup
+from record import record_game, replay, replay_game
+from renderer import write_winner
+
+
+def test_turtle_moves_along_the_axes():
+    turtle = HeadlessTurtle()
+    turtle.forward(10)
+    turtle.left(90)
+    turtle.forward(5)
+    assert turtle.pos() == (10, 5)
+    turtle.right(180)
+    turtle.forward(7)
+    assert turtle.pos() == (10, -2) and turtle.heading() == 270
+    assert turtle.towards(10, 8) == 90
+    assert turtle.towards((0, -2)) == 180
+    assert turtle.towards(13, 2) == pytest.approx(53.130102)
+    turtle.seth(turtle.towards(13, 2))
+    turtle.forward(5)
+    assert turtle.pos() == pytest.approx((13, 2))
+
+
+@pytest.mark.parametrize("size", tuple(SIZES))
+@pytest.mark.parametrize("fast_forward", (False, True))
+def test_renderer_ends_on_the_replayed_positions(size, fast_forward):
+    result, record = record_game(size, 1)
+    players = setup(size, 4, starting_color=record.starting_color)
+    replay(record).load_into(players)
+    expected = [game_piece.get_pos() for player in players for game_piece in player.game_pieces]
+
+    renderer = headless_renderer(size, fast_forward=fast_forward)
+    assert replay_game(record, size, renderer=renderer) == result
+    positions = [turtle.pos() for turtle in renderer.turtles.values()]
+    # the turtles stay on exact integer coordinates
+    assert positions == expected
+    assert all(isinstance(coordinate, int) for pos in positions for coordinate in pos)
+
+
+def test_winner_gets_written():
+    pen = HeadlessTurtle()
+    write_winner(pen, "red")
+    assert [text for text, _ in pen.texts] == ["RED", "WON"]
+    assert not pen.is_visible
+
+    renderer = headless_renderer("medium", fast_forward=True)
+    assert isinstance(renderer.screen, HeadlessScreen)
+    renderer.draw_winner("green")
+    assert renderer.screen.updates == 1
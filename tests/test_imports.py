@@ -0,0 +1,20 @@
+"""Headless imports don't load the modules of rendering"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import main
+
+HEAVY_MODULES = ("turtle", "tkinter", "numpy")
+
+
+@pytest.mark.parametrize("module", ("main", "record", "game_stats", "solver", "tournament"))
+def test_headless_modules_stay_light(module):
+    code = (f"import sys, {module}; "
+            f"print(*(name for name in {HEAVY_MODULES!r} if name in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True, cwd=os.path.dirname(main.__file__)).stdout
+    assert output.strip() == ""
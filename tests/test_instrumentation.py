@@ -0,0 +1,47 @@
+"""Timers, counters and the profiler hook of the game loop"""
+
+import os
+import subprocess
+import sys
+
+import main
+from instrumentation import PHASES, Instrumentation, run_profiled
+from main import play_game
+from tools import DiceStream
+
+SEEDS = range(30)
+
+
+def test_instrumentation_doesnt_change_games():
+    for seed in SEEDS:
+        strategies = {"green": "aggressive", "black": "defensive"} if seed % 2 else None
+        instrumentation = Instrumentation()
+        assert (play_game("medium", strategies=strategies, dice_stream=DiceStream(seed=seed))
+                == play_game("medium", strategies=strategies, dice_stream=DiceStream(seed=seed),
+                             instrumentation=instrumentation))
+        assert instrumentation.counters["games"] == 1
+        assert set(instrumentation.timers) <= set(PHASES)
+
+
+def test_instrumentation_counts_hits_and_turns():
+    instrumentation = Instrumentation()
+    results = [play_game("medium", dice_stream=DiceStream(seed=seed),
+                         instrumentation=instrumentation) for seed in SEEDS]
+    assert instrumentation.counters["hits"] == sum(sum(result.hits.values())
+                                                   for result in results)
+    assert instrumentation.counters["turns"] == sum(result.iterations for result in results)
+    assert instrumentation.counters["cut_off"] == sum(result.winner is None
+                                                      for result in results)
+
+
+def test_run_profiled_returns_the_result():
+    result, profiler = run_profiled(lambda: play_game("medium", dice_stream=DiceStream(seed=0)))
+    assert result == play_game("medium", dice_stream=DiceStream(seed=0))
+    assert hasattr(profiler, "print_stats")
+
+
+def test_importing_main_doesnt_load_the_profiler():
+    code = "import sys, main; print('cProfile' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True, cwd=os.path.dirname(main.__file__)).stdout
+    assert output.strip() == "False"
@@ -0,0 +1,68 @@
+"""The move generator on GameState against the game pieces of main"""
+
+from game_board import COLORS, FIELD_PATHS
+from game_piece import HOME
+from main import has_one_player_won, setup
+from moves import apply, greedy_move, legal_moves, winner
+from record import iter_states
+from state import PIECES_PER_COLOR, GameState
+
+
+def players_at(state):
+    """Players of main with the position of a state, the color that has to move comes first"""
+    players = setup("medium", 4, starting_color=COLORS[state.turn])
+    state.load_into(players)
+    return players
+
+
+def test_valid_game_pieces_match_legal_moves(recorded_states):
+    for state in recorded_states[::5]:
+        player = players_at(state)[0]
+        if all(game_piece.in_home() for game_piece in player.game_pieces):
+            continue
+        for roll in range(1, 7):
+            valid = player.get_valid_game_pieces(roll)
+            moves = legal_moves(state, roll)
+            assert [player.game_pieces.index(game_piece)
+                    for game_piece in valid] == [move.piece for move in moves]
+            if moves:
+                picked = player.choose_game_piece(valid, roll)
+                assert player.game_pieces.index(picked) == greedy_move(moves).piece
+
+
+def test_get_out_only_without_playable_game_pieces():
+    state = GameState.initial(2)
+    assert legal_moves(state, 4) == []
+    moves = legal_moves(state, 4, permission=True)
+    assert [(move.piece, move.start, move.end) for move in moves] == [(0, HOME, 4)]
+
+
+def test_apply_hits_other_colors():
+    # green stands on the field yellow enters with a 3
+    green_steps = FIELD_PATHS[1].index(FIELD_PATHS[0][3])
+    positions = bytearray(len(COLORS) * PIECES_PER_COLOR)
+    positions[0] = 1
+    positions[PIECES_PER_COLOR] = green_steps + 1
+    state = GameState(bytes(positions), 0)
+    after = apply(state, legal_moves(state, 3)[0])
+    assert after.steps(0)[0] == 3
+    assert after.steps(1)[0] == HOME
+    assert after.turn == 1
+
+
+def test_six_keeps_the_turn():
+    state = GameState(bytes((1,) + (0,) * 15), 0)
+    assert apply(state, legal_moves(state, 6)[0]).turn == 0
+
+
+def test_winner_matches_has_one_player_won(recorded_games):
+    for result, record in recorded_games:
+        states = list(iter_states(record))
+        for state in states[::5] + states[-1:]:
+            players = setup("medium", 4, starting_color=record.starting_color)
+            state.load_into(players)
+            won_player = has_one_player_won("medium", players)
+            won = winner(state)
+            assert (None if won is None else COLORS[won]) == (
+                won_player.color if won_player else None)
+        assert (None if won is None else COLORS[won]) == result.winner
@@ -0,0 +1,55 @@
+"""Occupancy index against the scans over all game pieces"""
+
+from itertools import cycle
+
+from game_board import COLORS
+from main import has_one_player_won, make_a_move, setup
+from occupancy import OccupancyIndex
+from state import GameState
+from tools import DiceStream
+
+
+def _play_in_lockstep(seed, rolls=600):
+    """Plays a game with and without an index on the same dice
+    and yields both sets of players and the index after every roll"""
+    occupancy = OccupancyIndex()
+    indexed = setup("medium", 4, starting_color="red", occupancy=occupancy)
+    scanned = setup("medium", 4, starting_color="red")
+    dice_streams = DiceStream(seed=seed), DiceStream(seed=seed)
+    for idx in cycle(range(len(COLORS))):
+        steps = dice_streams[0].roll()
+        assert dice_streams[1].roll() == steps
+        hits = [make_a_move(steps=steps, current_player=players[idx], players=players,
+                            dice_stream=dice_stream, occupancy=index)
+                for players, dice_stream, index in ((indexed, dice_streams[0], occupancy),
+                                                    (scanned, dice_streams[1], None))]
+        assert hits[0] == hits[1]
+        yield indexed, scanned, occupancy
+        rolls -= 1
+        if not rolls or has_one_player_won("medium", indexed):
+            return
+
+
+def test_index_follows_the_game_pieces():
+    for seed in range(5):
+        for indexed, scanned, occupancy in _play_in_lockstep(seed):
+            assert (GameState.from_players(indexed, "red")
+                    == GameState.from_players(scanned, "red"))
+            for player in indexed:
+                for game_piece in player.game_pieces:
+                    field = game_piece.get_field()
+                    assert occupancy.fields[id(game_piece)] == field
+                    if field != -1:
+                        assert game_piece in occupancy.at(field)
+            assert sum(map(len, occupancy.occupants)) == sum(
+                not game_piece.in_home() for player in indexed for game_piece in player.game_pieces)
+
+
+def test_valid_game_pieces_dont_depend_on_the_index():
+    for indexed, scanned, _ in _play_in_lockstep(0):
+        for indexed_player, scanned_player in zip(indexed, scanned):
+            for roll in range(1, 7):
+                assert ([indexed_player.game_pieces.index(game_piece)
+                         for game_piece in indexed_player.get_valid_game_pieces(roll)]
+                        == [scanned_player.game_pieces.index(game_piece)
+                            for game_piece in scanned_player.get_valid_game_pieces(roll)])
@@ -0,0 +1,49 @@
+"""Game records, their file format and replays against the played games"""
+
+from io import BytesIO
+
+import pytest
+
+from game_board import COLORS
+from main import play_game
+from moves import winner
+from record import GameRecord, RecordWriter, read_records, record_game, replay, replay_game
+from tools import DiceStream
+
+
+def test_records_survive_the_file_format(recorded_games):
+    file = BytesIO()
+    writer = RecordWriter(file)
+    for _, record in recorded_games:
+        writer.write(record)
+    file.seek(0)
+    assert list(read_records(file)) == [record for _, record in recorded_games]
+
+
+def test_replay_reaches_the_outcome(recorded_games):
+    for result, record in recorded_games:
+        won = winner(replay(record))
+        assert (None if won is None else COLORS[won]) == result.winner
+
+
+def test_replay_game_plays_the_same_game(recorded_games):
+    for result, record in recorded_games:
+        assert replay_game(record) == result
+
+
+@pytest.mark.parametrize("seed", (7, "7", None))
+def test_seeds_keep_their_type(seed):
+    result, record = record_game("medium", seed)
+    file = BytesIO()
+    RecordWriter(file).write(record)
+    file.seek(0)
+    (read,) = read_records(file)
+    assert read == record
+    assert type(read.seed) is type(seed)
+    if seed is not None:
+        assert play_game("medium", dice_stream=DiceStream(seed=read.seed)) == result
+
+
+def test_other_seeds_get_rejected():
+    with pytest.raises(ValueError):
+        RecordWriter(BytesIO()).write(GameRecord(1.5, "yellow", b""))
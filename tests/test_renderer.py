@@ -0,0 +1,51 @@
+"""Turtle renderer in step by step and fast forward mode, drawn with headless turtles"""
+
+import pytest
+
+from headless_turtle import HeadlessScreen, HeadlessTurtle
+from main import play_game
+from renderer import TurtleRenderer
+from tools import DiceStream
+
+
+class CheckedRenderer(TurtleRenderer):
+    """Renderer that compares every turtle with its game piece after every turn"""
+
+    def __init__(self, board_size, **kwargs):
+        super().__init__(board_size, turtle_factory=HeadlessTurtle, screen=HeadlessScreen(),
+                         **kwargs)
+        self.game_pieces = []
+
+    def attach(self, game_piece):
+        super().attach(game_piece)
+        self.game_pieces.append(game_piece)
+
+    def end_turn(self):
+        super().end_turn()
+        for game_piece in self.game_pieces:
+            assert self.turtles[id(game_piece)].pos() == pytest.approx(game_piece.get_pos())
+
+
+@pytest.mark.parametrize("size", ("small", "large"))
+@pytest.mark.parametrize("fast_forward", (False, True))
+def test_turtles_follow_the_game_pieces(size, fast_forward):
+    for seed in range(3):
+        renderer = CheckedRenderer(size, fast_forward=fast_forward)
+        result = play_game(size, renderer=renderer, dice_stream=DiceStream(seed=seed))
+        assert result == play_game(size, dice_stream=DiceStream(seed=seed))
+        assert renderer.turns == result.iterations
+
+
+@pytest.mark.parametrize("redraw_interval", (1, 7))
+def test_fast_forward_redraws_between_turns(redraw_interval):
+    renderer = CheckedRenderer("medium", fast_forward=True, redraw_interval=redraw_interval)
+    result = play_game("medium", renderer=renderer, dice_stream=DiceStream(seed=0))
+    assert renderer.screen.updates == result.iterations // redraw_interval
+    renderer.draw_winner(result.winner)
+    assert renderer.screen.updates == result.iterations // redraw_interval + 1
+
+
+def test_animation_leaves_the_redraws_to_turtle():
+    renderer = CheckedRenderer("medium")
+    play_game("medium", renderer=renderer, dice_stream=DiceStream(seed=0))
+    assert renderer.screen.updates == 0
@@ -0,0 +1,63 @@
+"""Columnar result store against the batch engine"""
+
+import os
+
+import numpy as np
+import pytest
+
+import result_store
+from batch_engine import play_batch, to_simulation_result
+from result_store import MAX_STRATEGIES, ResultStore
+
+STRATEGIES = ("greedy",) * 4
+
+
+def test_store_aggregates_like_the_batch_engine(tmp_path):
+    result = play_batch(500, seed=0)
+    store = ResultStore(str(tmp_path))
+    store.append_batch(result, seed=0, strategies=STRATEGIES)
+    assert len(ResultStore(str(tmp_path))) == 500
+    assert (repr(store.to_simulation_result(chunk_rows=128))
+            == repr(to_simulation_result(result)))
+
+
+def test_failing_append_keeps_no_strategy_name(tmp_path):
+    store = ResultStore(str(tmp_path))
+    with pytest.raises(ValueError):
+        store.append(seed=0, game=np.arange(3), starting_color=[0, 0], winner=[0, 0, 0],
+                     turns=[1, 1, 1], hits=np.zeros((3, 4)), strategies=("a", "b", "c", "d"))
+    assert store.strategies == []
+    store.append_batch(play_batch(10, seed=0), seed=0, strategies=STRATEGIES)
+    assert ResultStore(str(tmp_path)).strategies == ["greedy"]
+
+
+def test_failing_write_keeps_no_strategy_name(tmp_path, monkeypatch):
+    store = ResultStore(str(tmp_path))
+    store.append_batch(play_batch(10, seed=0), seed=0, strategies=STRATEGIES)
+
+    def fail(*_):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(result_store.os, "replace", fail)
+        with pytest.raises(OSError):
+            store.append_batch(play_batch(10, seed=1), seed=1, strategies=("rush",) * 4)
+    assert store.strategies == ["greedy"]
+    assert len(store) == 10
+
+    store.append_batch(play_batch(10, seed=2), seed=2, strategies=STRATEGIES)
+    reopened = ResultStore(str(tmp_path))
+    assert reopened.strategies == ["greedy"]
+    assert len(reopened) == 20
+    assert os.path.getsize(os.path.join(str(tmp_path), "turns.bin")) == (
+        20 * reopened.column("turns").itemsize)
+
+
+def test_strategy_ids_dont_wrap(tmp_path):
+    store = ResultStore(str(tmp_path))
+    for idx in range(MAX_STRATEGIES):
+        store.strategy_id(str(idx))
+    with pytest.raises(ValueError):
+        store.append_batch(play_batch(10, seed=0), seed=0, strategies=STRATEGIES)
+    assert len(store.strategies) == MAX_STRATEGIES
+    assert len(store) == 0
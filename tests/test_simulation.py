@@ -0,0 +1,17 @@
+"""Parallel simulation runner of main"""
+
+from main import SimulationResult, game_seed, play_game, simulate
+from tools import DiceStream
+
+
+def test_simulation_adds_up_the_seeded_games():
+    expected = SimulationResult()
+    for game_index in range(20):
+        expected.add(play_game("medium", dice_stream=DiceStream(seed=game_seed(3, game_index))))
+    assert repr(simulate(20, seed=3, workers=1)) == repr(expected)
+
+
+def test_simulation_doesnt_depend_on_the_workers():
+    result = simulate(40, seed=5, workers=1)
+    assert result.games == 40
+    assert repr(simulate(40, seed=5, workers=2)) == repr(result)
@@ -0,0 +1,20 @@
+"""Exact values of small configurations"""
+
+import pytest
+
+from solver import solve
+
+
+def test_single_color_always_wins():
+    solution = solve(("yellow",), 1)
+    assert solution.win_probability("yellow") == pytest.approx(1)
+    assert solution.turns() == pytest.approx(14.684375, abs=1e-4)
+
+
+def test_two_colors_with_one_game_piece():
+    solution = solve(("yellow", "red"), 1)
+    assert len(solution.states) == 1641
+    assert solution.win_probability("yellow") == pytest.approx(0.5241065, abs=1e-6)
+    assert (solution.win_probability("yellow") + solution.win_probability("red")
+            == pytest.approx(1))
+    assert solution.turns() == pytest.approx(24.241288, abs=1e-4)
@@ -0,0 +1,36 @@
+"""GameState and its done rule against the game pieces of main"""
+
+from game_board import COLORS
+from main import setup
+from state import GameState, done_flags
+
+
+def test_pack_round_trip(recorded_states):
+    for state in recorded_states:
+        assert GameState.unpack(state.pack()) == state
+        assert hash(state.copy()) == hash(state)
+
+
+def test_players_round_trip(recorded_states):
+    for state in recorded_states[::5]:
+        players = setup("medium", 4, starting_color=COLORS[state.turn])
+        state.load_into(players)
+        assert GameState.from_players(players, COLORS[state.turn]) == state
+
+
+def test_done_flags_match_check_if_done(recorded_states):
+    for state in recorded_states[::3]:
+        players = setup("medium", 4, starting_color=COLORS[state.turn])
+        state.load_into(players)
+        for player in players:
+            flags = [game_piece.is_done for game_piece in player.game_pieces]
+            for game_piece in player.game_pieces:
+                game_piece.is_done = False
+            player.check_if_done()
+            assert [game_piece.is_done for game_piece in player.game_pieces] == flags
+
+
+def test_done_flags_need_the_inner_goal_positions():
+    assert done_flags((43, 42, -1, 5)) == (True, True, False, False)
+    assert done_flags((42, 41, -1, 5)) == (False, False, False, False)
+    assert done_flags((40, 41, 42, 43)) == (True, True, True, True)
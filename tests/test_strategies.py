@@ -0,0 +1,91 @@
+"""Batched forms of the strategies against their scalar forms and the registry"""
+
+import numpy as np
+import pytest
+
+from batch_engine import OFFSETS
+from game_board import COLORS, FIELD_PATHS, TRACK_LENGTH
+from game_piece import GOAL, HOME, LAST_STEP
+from moves import legal_moves
+from state import PIECES_PER_COLOR, GameState
+from strategies import BatchState, get_batched_strategy, get_strategy, resolve_strategy
+from tools import DiceStream
+
+
+def batch_of(states, rolls):
+    """BatchState of positions, one game per state"""
+    steps = np.array([[position - 1 for position in state.positions] for state in states],
+                     dtype=np.int8).T
+    turn = np.array([state.turn for state in states])
+    games = np.arange(len(states))
+    board = np.zeros((TRACK_LENGTH, len(states)), dtype=np.int8)
+    for slot, row in enumerate(steps):
+        on_track = (row != HOME) & (row < GOAL)
+        fields = (OFFSETS[slot // PIECES_PER_COLOR] + row[on_track]) % TRACK_LENGTH
+        board[fields, games[on_track]] = slot + 1
+    slots = turn[:, None] * PIECES_PER_COLOR + np.arange(PIECES_PER_COLOR)
+    current = steps[slots, games[:, None]].T
+    return BatchState(steps, current, turn, np.array(rolls, dtype=np.int8), board,
+                      np.random.default_rng(0))
+
+
+def random_states(amount, seed=0):
+    """Positions with several game pieces of every color on the board, one per field"""
+    rng = np.random.default_rng(seed)
+    states = []
+    while len(states) < amount:
+        taken = set()
+        positions = bytearray()
+        for color_idx in range(len(COLORS)):
+            for step in rng.choice(np.arange(HOME, LAST_STEP + 1), PIECES_PER_COLOR,
+                                   replace=False).tolist():
+                field = FIELD_PATHS[color_idx][step] if step != HOME else None
+                if field in taken:
+                    step, field = HOME, None
+                taken.add(field)
+                positions.append(step + 1)
+        states.append(GameState(bytes(positions), int(rng.integers(len(COLORS)))))
+    return states
+
+
+@pytest.mark.parametrize("name", ("greedy", "aggressive", "defensive", "rush"))
+def test_batched_forms_pick_like_the_scalar_forms(name):
+    strategy, batched = get_strategy(name), get_batched_strategy(name)
+    states, rolls, moves = [], [], []
+    for idx, state in enumerate(random_states(3000)):
+        roll = idx % 6 + 1
+        legal = legal_moves(state, roll)
+        if len(legal) > 1:
+            states.append(state)
+            rolls.append(roll)
+            moves.append(legal)
+    assert len(states) > 1000
+
+    valid = np.zeros((PIECES_PER_COLOR, len(states)), dtype=bool)
+    for game, legal in enumerate(moves):
+        valid[[move.piece for move in legal], game] = True
+    picks = np.where(valid, batched(batch_of(states, rolls)), -np.inf).argmax(axis=0)
+    assert picks.tolist() == [strategy(state, legal).piece
+                              for state, legal in zip(states, moves)]
+
+
+def test_searches_get_their_own_dice():
+    state = GameState(bytes((1, 6) + (0,) * 14), 0)
+    moves = legal_moves(state, 3)
+    assert len(moves) == 2
+
+    rolls = []
+    for time_budget_ms in (1, 20):
+        dice_stream = DiceStream(seed=1)
+        strategy = resolve_strategy("monte_carlo", dice_stream)
+        strategy.time_budget_ms = time_budget_ms
+        assert strategy(state, moves) in moves
+        rolls.append([dice_stream.roll() for _ in range(8)])
+    assert rolls[0] == rolls[1]
+
+
+def test_unknown_names_raise():
+    with pytest.raises(ValueError):
+        get_strategy("unknown")
+    with pytest.raises(ValueError):
+        get_batched_strategy("expectimax")
@@ -0,0 +1,51 @@
+"""Pairings of the tournament and their confidence intervals"""
+
+import pytest
+
+import tournament
+from tournament import Z_95, play_pairing, sequential_z, wilson_interval
+
+
+def test_single_check_keeps_the_quantile():
+    assert sequential_z(Z_95, 1) == pytest.approx(Z_95, abs=1e-6)
+
+
+def test_more_checks_widen_the_interval():
+    assert Z_95 < sequential_z(Z_95, 10) < sequential_z(Z_95, 50)
+    low, high = wilson_interval(550, 1000, Z_95)
+    wide_low, wide_high = wilson_interval(550, 1000, sequential_z(Z_95, 50))
+    assert wide_low < low < 0.55 < high < wide_high
+
+
+def test_pairings_dont_depend_on_the_workers():
+    kwargs = {"max_games": 48, "min_games": 48, "batch_size": 16}
+    result = play_pairing("greedy", "random", workers=1, **kwargs)
+    assert result.games == 48
+    assert result.wins_a + result.wins_b + result.unfinished_games() == 48
+    assert repr(play_pairing("greedy", "random", workers=2, **kwargs)) == repr(result)
+
+
+def test_pairings_stop_once_the_interval_is_narrow():
+    result = play_pairing("greedy", "random", max_games=400, min_games=32, batch_size=16,
+                          half_width=0.4, workers=1)
+    assert result.games == 32
+
+
+def test_pairings_stop_once_decided(monkeypatch):
+    # the first strategy wins 60 % of the games, all of them get finished
+    def three_of_five(size, strategy_a, strategy_b, seed, game_indices):
+        wins_a = sum(game_index % 5 < 3 for game_index in game_indices)
+        return wins_a, len(game_indices) - wins_a
+
+    monkeypatch.setattr(tournament, "play_pairing_games", three_of_five)
+    kwargs = {"max_games": 4000, "min_games": 160, "batch_size": 40, "half_width": 0.01,
+              "workers": 1}
+    assert play_pairing("a", "b", **kwargs).games == 4000
+    decided = play_pairing("a", "b", stop_when_decided=True, **kwargs)
+    assert 160 < decided.games < 4000
+
+    # the pairing stops at the first check with an interval above 0.5
+    decided_z = sequential_z(Z_95, 4000 // 40 - 160 // 40 + 1)
+    for games, is_decided in ((decided.games, True), (decided.games - 40, False)):
+        wins_a = sum(game_index % 5 < 3 for game_index in range(games))
+        assert (wilson_interval(wins_a, games, decided_z)[0] > 0.5) == is_decided